@@ -5,81 +5,211 @@ Clean Architecture: Dependency Injection
 FastAPI 의존성 주입을 위한 팩토리 함수들
 """
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Dict, Any
+from fastapi import Header, HTTPException, status
+from typing import Optional, Tuple
+from functools import lru_cache
+import hashlib
+import logging
+import threading
+import time
 import structlog
+from cachetools import TTLCache
 
 from app.use_cases.analysis.execute_analysis_use_case import ExecuteAnalysisUseCase
 from app.use_cases.auth.authenticate_user_use_case import AuthenticateUserUseCase
 from app.infrastructure.di_container import get_di_container
-from app.core.auth.jwt_manager import JWTManager, TokenType
+from app.config.settings import get_settings
+from app.core.auth.jwt_manager import (
+    ASYNC_OFFLOAD_MIN_BYTES,
+    JWTManager,
+    TokenType,
+    AuthenticatedUser,
+    intern_permissions,
+)
 from app.core.security.sql_validator import SQLSecurityValidator
 from app.core.security.pii_masker import PIIMasker
+from app.schemas.auth import UserInfoResponse
 
 logger = structlog.get_logger(__name__)
-security = HTTPBearer()
+# 레벨 검사용 stdlib 로거 (필터링될 로그의 인자 계산 생략)
+_std_logger = logging.getLogger(__name__)
 
-# 보안 컴포넌트 싱글톤 인스턴스
-_jwt_manager = None
-_sql_validator = None
-_pii_masker = None
+# Authorization 헤더 접두사 (OpenAPI 보안 스키마는 app.main에서 등록)
+BEARER_PREFIX = "Bearer "
+_BEARER_PREFIX_LEN = len(BEARER_PREFIX)
 
+# 토큰 검증 결과 캐시 (반복 요청 시 서명 검증 생략)
+# 값: (캐시 만료 시각, 사용자 정보, 응답 모델) - 만료 시각은 토큰 exp를 넘지 않도록 제한
+# 캐시는 워커 프로세스별이므로 공유 블랙리스트(JWT_REDIS_BLACKLIST_ENABLED)가 없으면
+# 다른 워커에서 로그아웃된 토큰이 최대 TOKEN_CACHE_TTL_SECONDS 동안 통과할 수 있음.
+# 공유 블랙리스트가 있으면 캐시 적중 시에도 블랙리스트를 다시 확인합니다.
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
 
+
+def _token_cache_key(token: str) -> bytes:
+    """토큰 원문 대신 저장할 캐시 키 생성"""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def _get_cache_entry(token: str) -> Optional[Tuple[float, AuthenticatedUser, Optional[UserInfoResponse]]]:
+    """캐시 항목 조회 (만료된 항목은 제거)"""
+    key = _token_cache_key(token)
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry[0]:
+            _token_cache.pop(key, None)
+            return None
+        return entry
+
+
+async def _get_unrevoked_cache_entry(
+    token: str
+) -> Optional[Tuple[float, AuthenticatedUser, Optional[UserInfoResponse]]]:
+    """
+    캐시 항목 조회 (공유 블랙리스트 사용 시 폐기된 토큰은 캐시에서 제거)
+    
+    폐기된 토큰은 None을 반환하므로 호출자는 전체 검증 경로에서 401을 받습니다.
+    """
+    entry = _get_cache_entry(token)
+    if entry is None:
+        return None
+    jwt_manager = get_jwt_manager()
+    if jwt_manager.redis_client is not None and await jwt_manager.is_token_revoked_async(token):
+        invalidate_cached_token(token)
+        return None
+    return entry
+
+
+def cache_authenticated_token(
+    token: str,
+    user: AuthenticatedUser,
+    token_exp: float,
+    user_info: Optional[UserInfoResponse] = None
+) -> None:
+    """
+    검증된 토큰의 사용자 정보 캐시 저장
+    
+    Args:
+        token: 액세스 토큰
+        user: 사용자 정보
+        token_exp: 토큰 만료 시각 (Unix timestamp) - 캐시 TTL 상한
+        user_info: 미리 생성한 사용자 정보 응답 (선택사항)
+    """
+    valid_until = min(time.time() + TOKEN_CACHE_TTL_SECONDS, token_exp)
+    with _token_cache_lock:
+        _token_cache[_token_cache_key(token)] = (valid_until, user, user_info)
+
+
+def build_user_info(user: AuthenticatedUser) -> UserInfoResponse:
+    """인증된 사용자 정보로 응답 모델 생성 (서버 생성 값이므로 검증 생략)"""
+    return UserInfoResponse.model_construct(
+        user_id=user.user_id,
+        username=user.username,
+        email=user.email,
+        role=user.role,
+        permissions=sorted(user.permissions)
+    )
+
+
+def _attach_user_info(token: str, user_info: UserInfoResponse) -> None:
+    """기존 캐시 항목에 사용자 정보 응답 추가"""
+    key = _token_cache_key(token)
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is not None:
+            _token_cache[key] = (entry[0], entry[1], user_info)
+
+
+def invalidate_cached_token(token: str) -> None:
+    """토큰 캐시 무효화 (로그아웃 시 사용)"""
+    with _token_cache_lock:
+        _token_cache.pop(_token_cache_key(token), None)
+
+
+@lru_cache(maxsize=1)
 def get_jwt_manager() -> JWTManager:
-    """JWT 관리자 인스턴스 반환"""
-    global _jwt_manager
-    if _jwt_manager is None:
-        _jwt_manager = JWTManager()
-    return _jwt_manager
+    """
+    JWT 관리자 인스턴스 반환
+    
+    JWT_REDIS_BLACKLIST_ENABLED 설정 시 REDIS_URL의 동기 Redis 클라이언트로
+    블랙리스트를 워커 간에 공유합니다 (미설정 시 프로세스별 메모리 블랙리스트).
+    """
+    settings = get_settings()
+    if not settings.jwt_redis_blacklist_enabled:
+        return JWTManager()
+    
+    import redis  # 블랙리스트 공유 활성화 시에만 필요
+    
+    return JWTManager(redis_client=redis.Redis.from_url(settings.redis_url))
 
 
+@lru_cache(maxsize=1)
 def get_sql_validator() -> SQLSecurityValidator:
     """SQL 보안 검증기 인스턴스 반환"""
-    global _sql_validator
-    if _sql_validator is None:
-        _sql_validator = SQLSecurityValidator()
-    return _sql_validator
+    return SQLSecurityValidator()
 
 
+@lru_cache(maxsize=1)
 def get_pii_masker() -> PIIMasker:
     """PII 마스킹 시스템 인스턴스 반환"""
-    global _pii_masker
-    if _pii_masker is None:
-        _pii_masker = PIIMasker()
-    return _pii_masker
+    return PIIMasker()
+
+
+def extract_bearer_token(authorization: Optional[str]) -> str:
+    """
+    Authorization 헤더에서 Bearer 토큰 추출
+    
+    HTTPBearer 보안 의존성 대신 헤더 문자열을 직접 검사합니다.
+    """
+    if not authorization or not authorization.startswith(BEARER_PREFIX):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 토큰이 필요합니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    token = authorization[_BEARER_PREFIX_LEN:]
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 토큰이 필요합니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    jwt_manager: JWTManager = Depends(get_jwt_manager)
-) -> Dict[str, Any]:
+    authorization: Optional[str] = Header(None, alias="Authorization", include_in_schema=False)
+) -> AuthenticatedUser:
     """
     현재 사용자 정보 조회
     
     JWT 토큰 검증을 통한 사용자 인증
+    JWT 관리자는 프로세스 싱글톤이므로 Depends 대신 직접 참조합니다.
     """
+    token = extract_bearer_token(authorization)
+    
     try:
-        token = credentials.credentials
-        
-        if not token:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="인증 토큰이 필요합니다",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # 캐시 확인
+        cached_entry = await _get_unrevoked_cache_entry(token)
+        if cached_entry is not None:
+            return cached_entry[1]
         
-        # JWT 토큰 검증
-        validation_result = jwt_manager.validate_token(token)
+        # JWT 토큰 검증 (CPU 연산이므로 이벤트 루프 밖에서 실행)
+        jwt_manager = get_jwt_manager()
+        validation_result = await jwt_manager.validate_token_async(token)
         
         if not validation_result.is_valid or not validation_result.payload:
-            logger.warning(
-                "토큰 검증 실패",
-                extra={
-                    "error": validation_result.error_message,
-                    "token_hash": token[:16] + "..." if len(token) > 16 else token
-                }
-            )
+            if _std_logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "토큰 검증 실패",
+                    error=validation_result.error_message,
+                    token_prefix=token[:16]
+                )
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=validation_result.error_message or "유효하지 않은 인증 토큰입니다",
@@ -97,13 +227,15 @@ async def get_current_user(
             )
         
         # 사용자 정보 반환
-        return {
-            "user_id": payload.user_id,
-            "username": payload.username,
-            "email": payload.email,
-            "role": payload.role,
-            "permissions": payload.permissions
-        }
+        user = AuthenticatedUser(
+            user_id=payload.user_id,
+            username=payload.username,
+            email=payload.email,
+            role=payload.role,
+            permissions=intern_permissions(payload.permissions)
+        )
+        cache_authenticated_token(token, user, payload.exp_ts)
+        return user
         
     except HTTPException:
         raise
@@ -116,23 +248,68 @@ async def get_current_user(
         )
 
 
+async def get_current_user_lightweight(
+    authorization: Optional[str] = Header(None, alias="Authorization", include_in_schema=False)
+) -> None:
+    """
+    토큰 유효성만 확인 (HEAD 요청용)
+    
+    토큰 캐시에 있으면 사용자 정보나 응답 모델을 만들지 않고 바로 통과시키고,
+    캐시에 없으면 서명·만료만 확인하는 최소 검증을 이벤트 루프에서 바로 수행합니다.
+    큰 토큰이나 Redis 블랙리스트처럼 블로킹이 생길 수 있는 경우에는 전체 검증을 사용합니다.
+    """
+    token = extract_bearer_token(authorization)
+    if await _get_unrevoked_cache_entry(token) is not None:
+        return
+    
+    jwt_manager = get_jwt_manager()
+    if jwt_manager.redis_client is not None or len(token) >= ASYNC_OFFLOAD_MIN_BYTES:
+        await get_current_user(authorization)
+        return
+    
+    if jwt_manager.validate_access_token_minimal(token) is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 인증 토큰입니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_cached_user_info(
+    authorization: Optional[str] = Header(None, alias="Authorization", include_in_schema=False)
+) -> UserInfoResponse:
+    """
+    현재 사용자 정보 응답 조회
+    
+    토큰 캐시에 미리 생성된 응답이 있으면 그대로 반환하고,
+    없으면 전체 검증을 거쳐 응답을 생성한 뒤 캐시에 추가합니다.
+    """
+    token = extract_bearer_token(authorization)
+    entry = await _get_unrevoked_cache_entry(token)
+    if entry is not None and entry[2] is not None:
+        return entry[2]
+    
+    user = await get_current_user(authorization)
+    user_info = build_user_info(user)
+    _attach_user_info(token, user_info)
+    return user_info
+
+
+@lru_cache(maxsize=1)
+def _resolve_execute_analysis_use_case() -> ExecuteAnalysisUseCase:
+    """분석 실행 Use Case 싱글톤 조회 (초기화 실패는 캐싱되지 않음)"""
+    return get_di_container().get_execute_analysis_use_case()
+
+
 async def get_execute_analysis_use_case() -> ExecuteAnalysisUseCase:
     """
     분석 실행 Use Case 의존성 주입
     
     Clean Architecture: Composition Root
     의존성 주입 컨테이너에서 Use Case를 가져옵니다.
+    초기화 오류(ContainerInitializationError)는 앱 레벨 예외 핸들러가 500으로 변환합니다.
     """
-    try:
-        container = get_di_container()
-        return container.get_execute_analysis_use_case()
-        
-    except Exception as e:
-        logger.error("Use Case 의존성 주입 오류", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="서비스 초기화 오류가 발생했습니다"
-        )
+    return _resolve_execute_analysis_use_case()
 
 
 # 추가 의존성 함수들 (향후 구현)
@@ -143,6 +320,12 @@ async def get_query_history_use_case():
     pass
 
 
+@lru_cache(maxsize=1)
+def _resolve_authenticate_user_use_case() -> AuthenticateUserUseCase:
+    """사용자 인증 Use Case 싱글톤 조회 (초기화 실패는 캐싱되지 않음)"""
+    return get_di_container().get_authenticate_user_use_case()
+
+
 async def get_authenticate_user_use_case() -> AuthenticateUserUseCase:
     """
     사용자 인증 Use Case 의존성 주입
@@ -150,16 +333,7 @@ async def get_authenticate_user_use_case() -> AuthenticateUserUseCase:
     Clean Architecture: Composition Root
     의존성 주입 컨테이너에서 인증 Use Case를 가져옵니다.
     """
-    try:
-        container = get_di_container()
-        return container.get_authenticate_user_use_case()
-        
-    except Exception as e:
-        logger.error("인증 Use Case 의존성 주입 오류", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="인증 서비스 초기화 오류가 발생했습니다"
-        )
+    return _resolve_authenticate_user_use_case()
 
 
 async def get_user_management_use_case():
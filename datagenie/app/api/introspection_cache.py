@@ -0,0 +1,61 @@
+"""
+FastAPI Dependency Introspection Cache
+
+Clean Architecture: Interface Adapters - Framework 설정
+FastAPI가 요청마다 반복하는 의존성 callable 검사 결과를 캐싱합니다.
+"""
+
+import weakref
+from typing import Any, Callable
+
+import structlog
+from fastapi.dependencies import utils as dependency_utils
+
+logger = structlog.get_logger(__name__)
+
+# 패치 대상: solve_dependencies가 요청마다 호출하는 검사 함수들
+_PATCHED_CHECKS = ("is_coroutine_callable", "is_gen_callable", "is_async_gen_callable")
+
+_installed = False
+
+
+def _memoize_check(check: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """callable 객체를 키로 검사 결과를 캐싱 (객체 수명에 맞춰 자동 정리)"""
+    cache: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+    def cached_check(call: Any) -> bool:
+        try:
+            return cache[call]
+        except KeyError:
+            result = cache[call] = check(call)
+            return result
+        except TypeError:
+            # 약한 참조나 해시를 지원하지 않는 객체는 캐싱하지 않음
+            return check(call)
+
+    cached_check.__wrapped__ = check
+    return cached_check
+
+
+def install_dependency_introspection_cache() -> None:
+    """
+    FastAPI 의존성 검사 함수에 캐시 적용
+
+    의존성 callable(get_current_user, get_jwt_manager 등)은 import 이후 변하지 않으므로
+    코루틴/제너레이터 여부를 한 번만 계산합니다.
+    """
+    global _installed
+    if _installed:
+        return
+
+    # FastAPI 업그레이드로 검사 함수가 사라지거나 바뀌면 일부만 패치하지 않고 건너뜀
+    missing = [name for name in _PATCHED_CHECKS if not callable(getattr(dependency_utils, name, None))]
+    if missing:
+        logger.warning("FastAPI 의존성 검사 함수를 찾을 수 없어 캐시 적용 생략", missing=missing)
+        return
+
+    for name in _PATCHED_CHECKS:
+        setattr(dependency_utils, name, _memoize_check(getattr(dependency_utils, name)))
+
+    _installed = True
+    logger.debug("FastAPI 의존성 검사 캐시 적용", checks=_PATCHED_CHECKS)
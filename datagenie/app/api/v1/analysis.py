@@ -6,8 +6,14 @@ Clean Architecture: Interface Adapters - Web Controllers
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import JSONResponse
-from typing import Optional, Dict, Any
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from datetime import datetime
+from typing import Optional, Dict, Any, BinaryIO, Tuple
+import logging
+import re
+import tempfile
+import orjson
+from pydantic_core import to_jsonable_python
 import structlog
 
 from app.use_cases.analysis.execute_analysis_use_case import (
@@ -23,11 +29,80 @@ from app.schemas.analysis import (
     AnalysisResponseSchema,
     ErrorResponseSchema
 )
-from app.api.dependencies import get_current_user, get_execute_analysis_use_case
+from app.core.auth.jwt_manager import AuthenticatedUser
+from app.api.dependencies import (
+    get_current_user,
+    get_current_user_lightweight,
+    get_execute_analysis_use_case
+)
 
 logger = structlog.get_logger(__name__)
+_std_logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/analysis",
+    tags=["analysis"],
+    default_response_class=ORJSONResponse
+)
+
+# 업로드 파일 제한
+_ALLOWED_EXT = frozenset({'.xlsx', '.xls', '.csv'})
+_ALLOWED_EXT_TEXT = ', '.join(sorted(_ALLOWED_EXT))
+_EXT_RE = re.compile(r'\.(xlsx|xls|csv)$', re.IGNORECASE)
+_MAX_UPLOAD = 50 << 20  # 50MB
+
+# 업로드 스트리밍 설정
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+UPLOAD_SPOOL_MAX_MEMORY = 8 * 1024 * 1024  # 8MB 초과 시 디스크로 전환
+
+
+async def _spool_upload(file: UploadFile, max_size: int) -> Tuple[BinaryIO, int]:
+    """
+    업로드 파일을 청크 단위로 임시 파일에 복사
+    
+    전체 파일을 메모리에 올리지 않고, 크기 제한을 넘는 즉시 중단합니다.
+    
+    Returns:
+        (처음 위치로 되감은 임시 파일, 파일 크기)
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY)
+    total = 0
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total += len(chunk)
+            if total > max_size:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="파일 크기가 너무 큽니다. 최대 50MB까지 지원합니다."
+                )
+            buffer.write(chunk)
+    except BaseException:
+        buffer.close()
+        raise
+    
+    buffer.seek(0)
+    return buffer, total
+
+
+def _render_analysis_response(data: Dict[str, Any], message: str) -> Response:
+    """
+    분석 응답을 orjson으로 직접 렌더링
 
-router = APIRouter(prefix="/analysis", tags=["analysis"])
+    AnalysisResponseSchema 형태의 본문을 pydantic 모델 변환 없이 바로 bytes로 인코딩합니다.
+    AnalysisResult는 to_dict() 중간 dict 없이 orjson이 dataclass를 직접 직렬화하고,
+    orjson이 지원하지 않는 값(Decimal 등)은 pydantic JSON 모드와 같은 규칙으로 변환합니다.
+    """
+    content = orjson.dumps(
+        {
+            "success": True,
+            "data": data,
+            "message": message,
+            "timestamp": datetime.utcnow()
+        },
+        default=to_jsonable_python,
+        option=orjson.OPT_NON_STR_KEYS
+    )
+    return Response(content=content, media_type="application/json")
 
 
 @router.post(
@@ -39,7 +114,7 @@ router = APIRouter(prefix="/analysis", tags=["analysis"])
 )
 async def execute_analysis(
     request: AnalysisRequestSchema,
-    current_user: Dict[str, Any] = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     use_case: ExecuteAnalysisUseCase = Depends(get_execute_analysis_use_case)
 ) -> AnalysisResponseSchema:
     """
@@ -55,17 +130,18 @@ async def execute_analysis(
         # HTTP 요청을 Use Case 요청으로 변환
         use_case_request = AnalysisRequest(
             question=request.question,
-            user_id=current_user["user_id"],
+            user_id=current_user.user_id,
             connection_id=request.connection_id,
             options=request.options
         )
         
         # Use Case 실행
-        logger.info(
-            "분석 요청 시작",
-            user_id=current_user["user_id"],
-            question=request.question[:100] + "..." if len(request.question) > 100 else request.question
-        )
+        if _std_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "분석 요청 시작",
+                user_id=current_user.user_id,
+                question=request.question[:100]
+            )
         
         result = await use_case.execute(use_case_request)
         
@@ -77,14 +153,13 @@ async def execute_analysis(
         )
         
         # Use Case 응답을 HTTP 응답으로 변환
-        return AnalysisResponseSchema(
-            success=True,
-            data={
+        return _render_analysis_response(
+            {
                 "query_id": result.query_id,
                 "question": result.question,
                 "query_type": result.query_type,
                 "status": result.status,
-                "result": result.result.to_dict() if result.result else None,
+                "result": result.result,
                 "execution_time_ms": result.execution_time_ms
             },
             message="분석이 성공적으로 완료되었습니다."
@@ -93,7 +168,7 @@ async def execute_analysis(
     except PermissionDeniedError as e:
         logger.warning(
             "분석 권한 부족",
-            user_id=current_user["user_id"],
+            user_id=current_user.user_id,
             error=str(e)
         )
         raise HTTPException(
@@ -104,7 +179,7 @@ async def execute_analysis(
     except InvalidQueryError as e:
         logger.warning(
             "잘못된 쿼리",
-            user_id=current_user["user_id"],
+            user_id=current_user.user_id,
             question=request.question,
             error=str(e)
         )
@@ -116,7 +191,7 @@ async def execute_analysis(
     except AnalysisExecutionError as e:
         logger.error(
             "분석 실행 오류",
-            user_id=current_user["user_id"],
+            user_id=current_user.user_id,
             question=request.question,
             error=str(e)
         )
@@ -128,7 +203,7 @@ async def execute_analysis(
     except Exception as e:
         logger.error(
             "예상치 못한 오류",
-            user_id=current_user["user_id"],
+            user_id=current_user.user_id,
             error=str(e),
             exc_info=True
         )
@@ -149,7 +224,7 @@ async def execute_analysis_with_file(
     question: str,
     file: UploadFile = File(...),
     connection_id: Optional[str] = None,
-    current_user: Dict[str, Any] = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     use_case: ExecuteAnalysisUseCase = Depends(get_execute_analysis_use_case)
 ) -> AnalysisResponseSchema:
     """
@@ -157,6 +232,7 @@ async def execute_analysis_with_file(
     
     Excel 파일을 업로드하여 분석을 수행합니다.
     """
+    file_data: Optional[BinaryIO] = None
     try:
         # 파일 검증
         if not file.filename:
@@ -166,41 +242,32 @@ async def execute_analysis_with_file(
             )
         
         # 파일 확장자 검증
-        allowed_extensions = {'.xlsx', '.xls', '.csv'}
-        file_extension = '.' + file.filename.split('.')[-1].lower()
-        
-        if file_extension not in allowed_extensions:
+        if not _EXT_RE.search(file.filename):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_extensions)}"
+                detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {_ALLOWED_EXT_TEXT}"
             )
         
-        # 파일 크기 검증 (50MB 제한)
-        file_data = await file.read()
-        max_size = 50 * 1024 * 1024  # 50MB
-        
-        if len(file_data) > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail="파일 크기가 너무 큽니다. 최대 50MB까지 지원합니다."
-            )
+        # 파일 크기 검증 (50MB 제한) - 스트리밍으로 복사하며 검사
+        file_data, file_size = await _spool_upload(file, _MAX_UPLOAD)
         
         # Use Case 요청 생성
         use_case_request = AnalysisRequest(
             question=question,
-            user_id=current_user["user_id"],
+            user_id=current_user.user_id,
             connection_id=connection_id,
             file_data=file_data
         )
         
         # Use Case 실행
-        logger.info(
-            "파일 분석 요청 시작",
-            user_id=current_user["user_id"],
-            filename=file.filename,
-            file_size=len(file_data),
-            question=question[:100] + "..." if len(question) > 100 else question
-        )
+        if _std_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "파일 분석 요청 시작",
+                user_id=current_user.user_id,
+                filename=file.filename,
+                file_size=file_size,
+                question=question[:100]
+            )
         
         result = await use_case.execute(use_case_request)
         
@@ -211,18 +278,17 @@ async def execute_analysis_with_file(
             execution_time_ms=result.execution_time_ms
         )
         
-        return AnalysisResponseSchema(
-            success=True,
-            data={
+        return _render_analysis_response(
+            {
                 "query_id": result.query_id,
                 "question": result.question,
                 "query_type": result.query_type,
                 "status": result.status,
-                "result": result.result.to_dict() if result.result else None,
+                "result": result.result,
                 "execution_time_ms": result.execution_time_ms,
                 "file_info": {
                     "filename": file.filename,
-                    "size": len(file_data)
+                    "size": file_size
                 }
             },
             message="파일 분석이 성공적으로 완료되었습니다."
@@ -235,7 +301,7 @@ async def execute_analysis_with_file(
     except Exception as e:
         logger.error(
             "파일 분석 오류",
-            user_id=current_user["user_id"],
+            user_id=current_user.user_id,
             filename=file.filename if file else None,
             error=str(e),
             exc_info=True
@@ -244,6 +310,10 @@ async def execute_analysis_with_file(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="파일 분석 중 오류가 발생했습니다."
         )
+    
+    finally:
+        if file_data is not None:
+            file_data.close()
 
 
 @router.get(
@@ -255,15 +325,16 @@ async def execute_analysis_with_file(
 async def get_analysis_history(
     limit: int = 10,
     offset: int = 0,
-    current_user: Dict[str, Any] = Depends(get_current_user)
-) -> Dict[str, Any]:
+    _: None = Depends(get_current_user_lightweight)
+) -> ORJSONResponse:
     """
     분석 이력 조회 엔드포인트
     
     TODO: 이 기능은 별도의 Use Case로 구현 예정
+    (구현 전까지는 캐시 기반 경량 인증만 수행하고 고정 응답을 바로 반환)
     """
     # 임시 구현 - 실제로는 별도 Use Case 필요
-    return {
+    return ORJSONResponse({
         "success": True,
         "data": {
             "queries": [],
@@ -272,7 +343,7 @@ async def get_analysis_history(
             "offset": offset
         },
         "message": "분석 이력을 조회했습니다."
-    }
+    })
 
 
 @router.get(
@@ -283,17 +354,17 @@ async def get_analysis_history(
 )
 async def get_analysis_result(
     query_id: str,
-    current_user: Dict[str, Any] = Depends(get_current_user)
-) -> AnalysisResponseSchema:
+    _: None = Depends(get_current_user_lightweight)
+) -> Response:
     """
     분석 결과 조회 엔드포인트
     
     TODO: 이 기능은 별도의 Use Case로 구현 예정
+    (구현 전까지는 캐시 기반 경량 인증만 수행하고 고정 응답을 바로 반환)
     """
     # 임시 구현 - 실제로는 별도 Use Case 필요
-    return AnalysisResponseSchema(
-        success=True,
-        data={
+    return _render_analysis_response(
+        {
             "query_id": query_id,
             "message": "분석 결과 조회 기능은 구현 예정입니다."
         },
@@ -5,13 +5,26 @@ Clean Architecture: Interface Adapters - Web Controllers
 인증 관련 REST API 엔드포인트를 제공합니다.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import asyncio
+import time
 import structlog
 
-from app.core.auth.jwt_manager import JWTManager, AuthenticationError
-from app.api.dependencies import get_jwt_manager, get_current_user, get_authenticate_user_use_case
+from app.core.auth.jwt_manager import JWTManager, AuthenticationError, AuthenticatedUser, intern_permissions
+from app.api.dependencies import (
+    get_jwt_manager,
+    get_current_user,
+    get_cached_user_info,
+    get_current_user_lightweight,
+    get_authenticate_user_use_case,
+    build_user_info,
+    cache_authenticated_token,
+    invalidate_cached_token,
+    extract_bearer_token
+)
 from app.use_cases.auth.authenticate_user_use_case import AuthenticateUserUseCase, AuthenticationRequest
 from app.schemas.auth import (
     LoginRequest,
@@ -62,44 +75,41 @@ async def login(
         
         # 4. 사용자 데이터 추출
         user_data = auth_result.user_data
-        
-        # 5. JWT 토큰 생성
-        access_token = jwt_manager.create_access_token(
+        user = AuthenticatedUser(
             user_id=user_data["user_id"],
             username=user_data["username"],
             email=user_data["email"],
             role=user_data["role"],
-            permissions=user_data["permissions"]
+            permissions=intern_permissions(user_data["permissions"])
         )
         
-        refresh_token = jwt_manager.create_refresh_token(
-            user_id=user_data["user_id"],
-            username=user_data["username"],
-            email=user_data["email"],
-            role=user_data["role"]
+        # 5. JWT 토큰 생성 (큰 토큰만 스레드 풀에서 서명, 작은 토큰은 바로 처리)
+        access_token, refresh_token = await asyncio.gather(
+            jwt_manager.create_access_token_async(user),
+            jwt_manager.create_refresh_token_async(user)
         )
         
         logger.info(
             "사용자 로그인 성공",
             extra={
-                "user_id": user_data["user_id"],
-                "username": user_data["username"],
-                "role": user_data["role"]
+                "user_id": user.user_id,
+                "username": user.username,
+                "role": user.role
             }
         )
         
-        return LoginResponse(
+        user_info = build_user_info(user)
+        
+        # 6. 발급한 토큰을 캐시에 등록 (/me, /verify 요청 시 재검증 생략)
+        expires_in = jwt_manager.access_token_expire_seconds
+        cache_authenticated_token(access_token, user, time.time() + expires_in, user_info)
+        
+        return LoginResponse.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
             token_type="bearer",
-            expires_in=jwt_manager.access_token_expire_minutes * 60,
-            user=UserInfoResponse(
-                user_id=user_data["user_id"],
-                username=user_data["username"],
-                email=user_data["email"],
-                role=user_data["role"],
-                permissions=user_data["permissions"]
-            )
+            expires_in=expires_in,
+            user=user_info
         )
         
     except HTTPException:
@@ -125,7 +135,10 @@ async def refresh_token(
 ) -> TokenResponse:
     """리프레시 토큰으로 새 액세스 토큰 발급"""
     try:
-        new_access_token = jwt_manager.refresh_access_token(request.refresh_token)
+        new_access_token = await run_in_threadpool(
+            jwt_manager.refresh_access_token,
+            request.refresh_token
+        )
         
         if not new_access_token:
             raise HTTPException(
@@ -135,10 +148,10 @@ async def refresh_token(
         
         logger.info("토큰 갱신 성공")
         
-        return TokenResponse(
+        return TokenResponse.model_construct(
             access_token=new_access_token,
             token_type="bearer",
-            expires_in=jwt_manager.access_token_expire_minutes * 60
+            expires_in=jwt_manager.access_token_expire_seconds
         )
         
     except HTTPException:
@@ -158,19 +171,21 @@ async def refresh_token(
     description="현재 토큰을 무효화합니다."
 )
 async def logout(
-    current_user: Dict[str, Any] = Depends(get_current_user),
-    jwt_manager: JWTManager = Depends(get_jwt_manager)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    jwt_manager: JWTManager = Depends(get_jwt_manager),
+    authorization: Optional[str] = Header(None, alias="Authorization", include_in_schema=False)
 ) -> Dict[str, str]:
     """사용자 로그아웃 (토큰 블랙리스트 추가)"""
     try:
-        # TODO: 실제로는 요청 헤더에서 토큰을 추출해야 함
-        # 현재는 간단한 구현
+        token = extract_bearer_token(authorization)
+        await run_in_threadpool(jwt_manager.blacklist_token, token)
+        invalidate_cached_token(token)
         
         logger.info(
             "사용자 로그아웃",
             extra={
-                "user_id": current_user["user_id"],
-                "username": current_user["username"]
+                "user_id": current_user.user_id,
+                "username": current_user.username
             }
         )
         
@@ -192,16 +207,10 @@ async def logout(
     description="현재 인증된 사용자의 정보를 반환합니다."
 )
 async def get_current_user_info(
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    user_info: UserInfoResponse = Depends(get_cached_user_info)
 ) -> UserInfoResponse:
     """현재 사용자 정보 조회"""
-    return UserInfoResponse(
-        user_id=current_user["user_id"],
-        username=current_user["username"],
-        email=current_user["email"],
-        role=current_user["role"],
-        permissions=current_user["permissions"]
-    )
+    return user_info
 
 
 @router.get(
@@ -211,12 +220,25 @@ async def get_current_user_info(
     description="현재 토큰의 유효성을 검증합니다."
 )
 async def verify_token(
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    user_info: UserInfoResponse = Depends(get_cached_user_info)
 ) -> Dict[str, Any]:
     """토큰 유효성 검증"""
     return {
         "valid": True,
-        "user_id": current_user["user_id"],
-        "username": current_user["username"],
-        "role": current_user["role"]
+        "user_id": user_info.user_id,
+        "username": user_info.username,
+        "role": user_info.role
     }
+
+
+@router.head(
+    "/verify",
+    status_code=status.HTTP_200_OK,
+    summary="토큰 검증 (HEAD)",
+    description="응답 본문 없이 현재 토큰의 유효성만 확인합니다."
+)
+async def verify_token_head(
+    _: None = Depends(get_current_user_lightweight)
+) -> Response:
+    """토큰 유효성 확인 (세션 확인용 경량 엔드포인트)"""
+    return Response(status_code=status.HTTP_200_OK)
@@ -4,9 +4,14 @@ Database Configuration and Connection Management
 Clean Architecture: Infrastructure layer responsible for database setup
 """
 
+import time
 from typing import AsyncGenerator
+from fastapi import Depends
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncSession, 
+    AsyncConnection,
     AsyncEngine,
     create_async_engine,
     async_sessionmaker
@@ -38,22 +43,38 @@ def create_database_engine() -> AsyncEngine:
     """
     settings = get_settings()
     
+    if settings.testing:
+        # Use NullPool for testing to avoid connection issues
+        pool_options = {"poolclass": NullPool}
+    else:
+        pool_options = {
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_pool_overflow,
+            "pool_timeout": settings.database_pool_timeout,  # Fail fast when the pool is exhausted
+            # No per-checkout ping; recycle well before server/LB idle timeouts instead
+            "pool_pre_ping": False,
+            "pool_recycle": 1800,   # Recycle connections every 30 minutes
+            "pool_use_lifo": True,  # Reuse the most recent (warm) connection first
+        }
+    
+    connect_args = {}
+    if make_url(settings.database_url).get_driver_name() == "asyncpg":
+        # Short OLTP queries never benefit from Postgres JIT compilation
+        connect_args["server_settings"] = {"jit": "off"}
+    
     engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,  # Log SQL queries in debug mode
-        pool_size=settings.database_pool_size,
-        max_overflow=settings.database_pool_overflow,
-        pool_pre_ping=True,  # Verify connections before use
-        pool_recycle=3600,   # Recycle connections every hour
-        # Use NullPool for testing to avoid connection issues
-        poolclass=NullPool if settings.debug else None,
+        connect_args=connect_args,
+        **pool_options,
     )
     
     logger.info(
         "Database engine created",
-        database_url=settings.database_url.split('@')[1] if '@' in settings.database_url else settings.database_url,
+        database_url=settings.sanitized_database_url,
         pool_size=settings.database_pool_size,
-        debug=settings.debug
+        debug=settings.debug,
+        testing=settings.testing
     )
     
     return engine
@@ -96,49 +117,53 @@ def get_session_maker() -> async_sessionmaker[AsyncSession]:
     return _async_session_maker
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+async def _get_conn() -> AsyncGenerator[AsyncConnection, None]:
     """
-    Get async database session for repositories.
+    Dependency function to acquire a pooled connection.
     
-    This is used by repository implementations to get
-    database sessions for data operations.
+    FastAPI caches this dependency per request, so every session
+    created within the same request shares one pooled connection
+    instead of racing for separate ones.
     """
-    session_maker = get_session_maker()
-    async with session_maker() as session:
-        try:
-            logger.debug("Async database session created")
-            yield session
-        except Exception as e:
-            logger.error("Async database session error", error=str(e))
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-            logger.debug("Async database session closed")
+    engine = get_database_engine()
+    async with engine.connect() as conn:
+        yield conn
 
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_db_session(
+    conn: AsyncConnection = Depends(_get_conn)
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to get database session.
     
     This is used with FastAPI's Depends() to inject
     database sessions into API endpoints.
+    The session is bound to the connection already acquired
+    for the current request (see _get_conn).
     
     Clean Architecture: This provides the interface
     that use cases need to access the database.
     """
-    session_maker = get_session_maker()
-    async with session_maker() as session:
-        try:
-            logger.debug("Database session created")
-            yield session
-        except Exception as e:
-            logger.error("Database session error", error=str(e))
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-            logger.debug("Database session closed")
+    # Closing the session on exit rolls back any uncommitted transaction
+    async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+        yield session
+
+
+def _create_missing_tables(sync_conn: Connection) -> int:
+    """
+    Create only the tables that do not exist yet.
+    
+    Existing table names are read with a single catalog query, so
+    create_all does not need a per-table existence check (checkfirst).
+    """
+    existing = set(inspect(sync_conn).get_table_names())
+    missing = [
+        table for table in Base.metadata.sorted_tables
+        if table.name not in existing
+    ]
+    if missing:
+        Base.metadata.create_all(sync_conn, tables=missing, checkfirst=False)
+    return len(missing)
 
 
 async def init_database() -> None:
@@ -153,8 +178,8 @@ async def init_database() -> None:
     try:
         async with engine.begin() as conn:
             logger.info("Creating database tables")
-            await conn.run_sync(Base.metadata.create_all)
-            logger.info("Database tables created successfully")
+            created = await conn.run_sync(_create_missing_tables)
+            logger.info("Database tables created successfully", created_tables=created)
     except Exception as e:
         logger.error("Failed to create database tables", error=str(e))
         raise
@@ -175,18 +200,35 @@ async def close_database() -> None:
 
 
 # Connection health check
+HEALTH_CHECK_TTL_SECONDS = 1.0
+
+# (checked_at monotonic timestamp, result) of the last health check
+_last_health: tuple[float, bool] = (0.0, False)
+
+
 async def check_database_health() -> bool:
     """
     Check database connection health.
     
     Returns True if database is accessible, False otherwise.
-    """
+    The result is reused for HEALTH_CHECK_TTL_SECONDS so frequent
+    liveness probes do not hit the database on every call.
+    """
+    global _last_health
+    checked_at, healthy = _last_health
+    now = time.monotonic()
+    if checked_at and now - checked_at < HEALTH_CHECK_TTL_SECONDS:
+        return healthy
+    
     try:
         engine = get_database_engine()
-        async with engine.begin() as conn:
-            await conn.execute("SELECT 1")
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         logger.debug("Database health check passed")
-        return True
+        healthy = True
     except Exception as e:
         logger.error("Database health check failed", error=str(e))
-        return False
+        healthy = False
+    
+    _last_health = (time.monotonic(), healthy)
+    return healthy
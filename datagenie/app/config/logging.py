@@ -5,78 +5,269 @@ Clean Architecture: Infrastructure 설정
 구조화된 로깅 시스템 설정
 """
 
+import io
+import os
 import sys
+import atexit
+import queue
 import logging
+import logging.handlers
+import orjson
 import structlog
-from typing import Any
+from typing import Any, Dict, Optional
 
 from app.config.settings import get_settings
 
-settings = get_settings()
+# stdlib 로그 출력을 담당하는 백그라운드 리스너 (요청 경로에서 I/O 제거)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
+# LOG_FILE 핸들러 (운영 환경의 앱 structlog 출력도 같은 파일에 기록)
+_log_file_handler: Optional["BufferedFileHandler"] = None
 
-def setup_logging() -> None:
+# setup_logging 중복 호출 방지
+_configured = False
+
+# 이름별 로거 캐시 (get_logger)
+_module_loggers: Dict[str, Any] = {}
+
+# 개발 환경 프로세서 체인 (stdlib 경유, 렌더러는 setup_logging에서 추가)
+_DEV_PROCESSORS = (
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+)
+
+# 운영 환경 프로세서 체인 (stdlib 미경유, orjson으로 bytes 출력)
+_PROD_PROCESSORS = (
+    structlog.processors.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.processors.JSONRenderer(serializer=orjson.dumps),
+)
+
+
+class _NamedBytesLogger(structlog.BytesLogger):
     """
-    구조화된 로깅 시스템 설정
+    로거 이름을 보존하는 BytesLogger (add_logger_name 프로세서용)
     
-    - JSON 형태의 구조화된 로그
-    - 개발/운영 환경별 다른 설정
-    - 성능 최적화된 로깅
+    stdout 출력 후 LOG_FILE 핸들러가 있으면 같은 줄을 파일에도 기록하여
+    외부 라이브러리 로그와 앱 로그가 한 파일에 모이도록 합니다.
+    """
+    
+    __slots__ = ("name",)
+    
+    def __init__(self, name: Optional[str] = None):
+        super().__init__()
+        self.name = name
+    
+    def msg(self, message: bytes) -> None:
+        super().msg(message)
+        if _log_file_handler is not None:
+            _log_file_handler.write_line(message)
+    
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+def _named_bytes_logger_factory(*args: Any) -> _NamedBytesLogger:
+    """get_logger(name)의 이름을 유지하는 BytesLogger 팩토리"""
+    return _NamedBytesLogger(args[0] if args else None)
+
+
+class BufferedFileHandler(logging.Handler):
+    """
+    버퍼링 파일 로그 핸들러
+    
+    레코드마다 write() 시스템 콜을 하지 않도록 64KB 버퍼에 모아서 기록합니다.
+    버퍼는 flush() 호출(종료 시 shutdown_logging/atexit) 또는 버퍼가 찼을 때 비워집니다.
+    """
+    
+    buffer_size = 64 * 1024
+    
+    def __init__(self, filename: str):
+        super().__init__()
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._writer = io.BufferedWriter(
+            open(filename, "ab", buffering=0),
+            buffer_size=self.buffer_size
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._writer.write(self.format(record).encode() + b"\n")
+        except Exception:
+            self.handleError(record)
+    
+    def write_line(self, line: bytes) -> None:
+        """이미 렌더링된 로그 한 줄 기록 (structlog BytesLogger 출력용)"""
+        self.acquire()
+        try:
+            if not self._writer.closed:
+                self._writer.write(line + b"\n")
+        finally:
+            self.release()
+    
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if not self._writer.closed:
+                self._writer.flush()
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if not self._writer.closed:
+                self._writer.close()
+        finally:
+            self.release()
+        super().close()
+
+
+def _configure_third_party_loggers() -> None:
+    """
+    외부 라이브러리(stdlib logging 사용) 로그 설정
+    
+    루트 로거에는 QueueHandler만 연결하고, 실제 출력은
+    QueueListener 스레드가 처리하여 이벤트 루프가 write()에 막히지 않도록 합니다.
     """
+    global _queue_listener, _log_file_handler
+    settings = get_settings()
     
-    # 기본 로깅 설정
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
+        handlers=[queue_handler],
         level=getattr(logging, settings.log_level.upper()),
     )
     
-    # structlog 프로세서 설정
-    processors = [
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-    ]
-    
-    # 환경별 다른 렌더러 사용
+    # 루트 로거가 이미 설정된 경우(basicConfig 무시) 리스너를 시작하지 않음
+    if _queue_listener is None and queue_handler in logging.getLogger().handlers:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers: list[logging.Handler] = [console_handler]
+        
+        # 운영 환경: 파일 로그는 버퍼링하여 기록 (앱 structlog 출력도 _NamedBytesLogger가 같은 핸들러로 기록)
+        if not settings.debug and settings.log_file:
+            file_handler = BufferedFileHandler(settings.log_file)
+            file_handler.setFormatter(logging.Formatter("%(message)s"))
+            atexit.register(file_handler.flush)
+            handlers.append(file_handler)
+            _log_file_handler = file_handler
+        
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue,
+            *handlers,
+            respect_handler_level=True,
+        )
+        _queue_listener.start()
+        # 리스너 스레드는 데몬이므로 종료 시 남은 레코드를 비우도록 등록
+        atexit.register(shutdown_logging)
+    
+    logging.getLogger("uvicorn").setLevel(logging.INFO)
+    logging.getLogger("fastapi").setLevel(logging.INFO)
+    
+    if not settings.debug:
+        # 운영 환경에서는 더 높은 레벨로 설정
+        logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
+
+def setup_logging() -> None:
+    """
+    구조화된 로깅 시스템 설정
+    
+    - JSON 형태의 구조화된 로그
+    - 개발/운영 환경별 다른 설정
+    - 운영 환경은 stdlib logging을 거치지 않고 orjson으로 바로 bytes 출력
+    - 여러 번 호출되어도 최초 1회만 설정 (핸들러 중복 등록 방지)
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    settings = get_settings()
+    
+    # 외부 라이브러리용 stdlib 로깅 설정
+    _configure_third_party_loggers()
+    
     if settings.debug:
-        # 개발 환경: 읽기 쉬운 콘솔 출력
-        processors.append(structlog.dev.ConsoleRenderer())
-    else:
-        # 운영 환경: JSON 형태 출력
-        processors.append(structlog.processors.JSONRenderer())
+        # 개발 환경: stdlib 경유, 읽기 쉬운 콘솔 출력
+        # (rich는 dev 요구사항에만 포함 - 설치된 경우 ConsoleRenderer가 예외 출력에 사용)
+        structlog.configure(
+            processors=[*_DEV_PROCESSORS, structlog.dev.ConsoleRenderer()],
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+            cache_logger_on_first_use=True,
+        )
+        return
     
-    # structlog 설정
+    # 운영 환경: 레벨 필터링은 바운드 로거에서, JSON 인코딩은 orjson으로 처리
     structlog.configure(
-        processors=processors,
+        processors=_PROD_PROCESSORS,
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=_named_bytes_logger_factory,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, settings.log_level.upper())
+        ),
         cache_logger_on_first_use=True,
     )
+
+
+def shutdown_logging() -> None:
+    """
+    로깅 시스템 종료
     
-    # 외부 라이브러리 로그 레벨 조정
-    logging.getLogger("uvicorn").setLevel(logging.INFO)
-    logging.getLogger("fastapi").setLevel(logging.INFO)
+    QueueListener를 멈춰 대기 중인 로그를 모두 출력하고,
+    이후 로그는 실제 핸들러로 직접 출력되도록 루트 로거를 되돌립니다.
+    애플리케이션 종료 시 호출해야 합니다.
+    """
+    global _queue_listener
     
-    if not settings.debug:
-        # 운영 환경에서는 더 높은 레벨로 설정
-        logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    if _queue_listener is None:
+        return
+    
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.flush()
+    
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is _queue_listener.queue:
+            root_logger.removeHandler(handler)
+    for handler in _queue_listener.handlers:
+        root_logger.addHandler(handler)
+    
+    _queue_listener = None
 
 
 def get_logger(name: str) -> Any:
     """
     구조화된 로거 인스턴스 반환
     
+    이름별로 하나의 로거만 생성하여 재사용합니다. cache_logger_on_first_use에 의해
+    첫 사용 이후에는 팩토리 조회 없이 바인딩된 로거가 사용되므로,
+    모듈 상단에서 `logger = get_logger(__name__)`로 한 번만 가져와 쓰는 것을 권장합니다.
+    
     Args:
         name: 로거 이름
         
     Returns:
         structlog 로거 인스턴스
     """
-    return structlog.get_logger(name)
\ No newline at end of file
+    logger = _module_loggers.get(name)
+    if logger is None:
+        logger = _module_loggers.setdefault(name, structlog.get_logger(name))
+    return logger
@@ -7,10 +7,25 @@ but is accessed by all layers through dependency injection.
 
 import os
 import secrets
-from typing import List, Optional, Any, Dict
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from dataclasses import dataclass
+from typing import Annotated, FrozenSet, Optional, Any, Dict, Tuple
+from pydantic import AfterValidator, Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache, cached_property
+
+
+VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def _normalize_log_level(v: str) -> str:
+    """Validate log level and normalize it to upper case"""
+    level = v.upper()
+    if level not in VALID_LOG_LEVELS:
+        raise ValueError(f"Log level must be one of: {list(VALID_LOG_LEVELS)}")
+    return level
+
+
+LogLevel = Annotated[str, AfterValidator(_normalize_log_level)]
 
 
 class Settings(BaseSettings):
@@ -25,6 +40,7 @@ class Settings(BaseSettings):
     app_name: str = Field(default="DataGenie", env="APP_NAME")
     app_version: str = Field(default="0.1.0", env="APP_VERSION")
     debug: bool = Field(default=False, env="DEBUG")
+    testing: bool = Field(default=False, env="TESTING")
     
     # Server Configuration
     host: str = Field(default="0.0.0.0", env="HOST")
@@ -47,12 +63,18 @@ class Settings(BaseSettings):
     openai_model_fallback: str = Field(default="gpt-3.5-turbo", env="OPENAI_MODEL_FALLBACK")
     openai_max_tokens: int = Field(default=2000, env="OPENAI_MAX_TOKENS")
     openai_temperature: float = Field(default=0.0, env="OPENAI_TEMPERATURE")
+    exact_token_metrics: bool = Field(default=False, env="EXACT_TOKEN_METRICS")  # tiktoken for every prompt
     
     # LLM Engine Configuration
     use_llm_engine: bool = Field(default=False, env="USE_LLM_ENGINE")
     llm_cache_ttl: int = Field(default=3600, env="LLM_CACHE_TTL")
     llm_max_retries: int = Field(default=2, env="LLM_MAX_RETRIES")
     llm_timeout: int = Field(default=30, env="LLM_TIMEOUT")
+    # 0 disables batching; ChatOpenAI.abatch still sends one request per prompt
+    llm_batch_window_ms: int = Field(default=0, env="LLM_BATCH_WINDOW_MS")
+    llm_batch_max_size: int = Field(default=8, env="LLM_BATCH_MAX_SIZE")
+    # Reuse generated SQL across questions that differ only in numbers/quoted strings
+    llm_structural_cache_enabled: bool = Field(default=False, env="LLM_STRUCTURAL_CACHE_ENABLED")
     
     # Database Configuration
     database_url: str = Field(
@@ -64,8 +86,10 @@ class Settings(BaseSettings):
     database_name: str = Field(default="datagenie", env="DATABASE_NAME")
     database_user: str = Field(default="postgres", env="DATABASE_USER")
     database_password: str = Field(default="password", env="DATABASE_PASSWORD")
-    database_pool_size: int = Field(default=5, env="DATABASE_POOL_SIZE")
-    database_pool_overflow: int = Field(default=10, env="DATABASE_POOL_OVERFLOW")
+    # Pool sizes are per worker process (each uvicorn worker owns its own engine)
+    database_pool_size: int = Field(default=10, env="DATABASE_POOL_SIZE")
+    database_pool_overflow: int = Field(default=20, env="DATABASE_POOL_OVERFLOW")
+    database_pool_timeout: int = Field(default=5, env="DATABASE_POOL_TIMEOUT")
     
     # Redis Configuration
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
@@ -74,10 +98,13 @@ class Settings(BaseSettings):
     redis_db: int = Field(default=0, env="REDIS_DB")
     redis_password: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
     redis_cache_ttl: int = Field(default=3600, env="REDIS_CACHE_TTL")
+    # Share the JWT blacklist across workers via redis_url (off: per-process in-memory set)
+    jwt_redis_blacklist_enabled: bool = Field(default=False, env="JWT_REDIS_BLACKLIST_ENABLED")
     
     # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
+    log_level: LogLevel = Field(default="INFO", env="LOG_LEVEL")
     log_format: str = Field(default="json", env="LOG_FORMAT")
+    # Non-debug only: receives both app (structlog) and third-party log lines, in addition to stdout
     log_file: str = Field(default="logs/app.log", env="LOG_FILE")
     
     # File Upload Configuration
@@ -118,15 +145,6 @@ class Settings(BaseSettings):
         
         return v
     
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v):
-        """Validate log level"""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Log level must be one of: {valid_levels}")
-        return v.upper()
-    
     @field_validator("allowed_file_types")
     @classmethod
     def validate_file_types(cls, v):
@@ -138,18 +156,6 @@ class Settings(BaseSettings):
                     raise ValueError(f"File extension must start with '.': {ext}")
         return v
     
-    @field_validator("cors_origins")
-    @classmethod
-    def validate_cors_origins(cls, v):
-        """Validate CORS origins"""
-        return v
-    
-    @field_validator("trusted_hosts")
-    @classmethod
-    def validate_trusted_hosts(cls, v):
-        """Validate trusted hosts"""
-        return v
-    
     @property
     def max_file_size_bytes(self) -> int:
         """Convert max file size from MB to bytes"""
@@ -165,20 +171,40 @@ class Settings(BaseSettings):
         """Check if running in production mode"""
         return not self.is_development
     
-    @property
-    def allowed_file_types_list(self) -> List[str]:
-        """Get allowed file types as a list"""
-        return [ext.strip() for ext in self.allowed_file_types.split(",")]
+    @cached_property
+    def allowed_file_types_list(self) -> Tuple[str, ...]:
+        """Get allowed file types as an ordered tuple (computed once per settings instance)"""
+        return tuple(ext.strip() for ext in self.allowed_file_types.split(","))
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Get CORS origins as a list"""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    @cached_property
+    def allowed_file_types_set(self) -> FrozenSet[str]:
+        """Get allowed file types as a frozenset for O(1) membership checks"""
+        return frozenset(self.allowed_file_types_list)
     
-    @property
-    def trusted_hosts_list(self) -> List[str]:
-        """Get trusted hosts as a list"""
-        return [host.strip() for host in self.trusted_hosts.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """Get CORS origins as an ordered tuple (computed once per settings instance)"""
+        return tuple(origin.strip() for origin in self.cors_origins.split(","))
+    
+    @cached_property
+    def cors_origins_set(self) -> FrozenSet[str]:
+        """Get CORS origins as a frozenset for O(1) membership checks"""
+        return frozenset(self.cors_origins_list)
+    
+    @cached_property
+    def trusted_hosts_list(self) -> Tuple[str, ...]:
+        """Get trusted hosts as an ordered tuple (computed once per settings instance)"""
+        return tuple(host.strip() for host in self.trusted_hosts.split(","))
+    
+    @cached_property
+    def trusted_hosts_set(self) -> FrozenSet[str]:
+        """Get trusted hosts as a frozenset for O(1) membership checks"""
+        return frozenset(self.trusted_hosts_list)
+    
+    @cached_property
+    def sanitized_database_url(self) -> str:
+        """Get database URL without credentials (safe for logging)"""
+        return self.database_url.rpartition("@")[2]
     
     def get_database_url(self, async_driver: bool = True) -> str:
         """Generate database URL with appropriate driver"""
@@ -190,10 +216,13 @@ class Settings(BaseSettings):
         auth = f":{self.redis_password}@" if self.redis_password else ""
         return f"redis://{auth}{self.redis_host}:{self.redis_port}/{self.redis_db}"
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,  # Immutable singleton (not hashable: external_db_configs is a dict)
+    )
 
 
 @lru_cache()
@@ -210,5 +239,60 @@ def get_settings() -> Settings:
     return Settings()
 
 
-# Export settings instance
-settings = get_settings()
+@dataclass(slots=True, frozen=True)
+class RuntimeSettings:
+    """
+    Read-only snapshot of the settings read on request paths.
+    
+    Plain slotted attributes avoid Pydantic's attribute machinery;
+    startup code that needs the full, validated model keeps using
+    get_settings().
+    """
+    app_version: str
+    debug: bool
+    testing: bool
+    is_development: bool
+    log_level: str
+    max_file_size_mb: int
+    max_file_size_bytes: int
+    rate_limit_per_minute: int
+    openai_max_tokens: int
+    cors_origins: FrozenSet[str]
+    trusted_hosts: FrozenSet[str]
+    allowed_file_types: FrozenSet[str]
+
+
+@lru_cache()
+def get_runtime_settings() -> RuntimeSettings:
+    """
+    Get cached runtime settings snapshot.
+    
+    Built once from get_settings(); clear both caches together in tests.
+    """
+    s = get_settings()
+    return RuntimeSettings(
+        app_version=s.app_version,
+        debug=s.debug,
+        testing=s.testing,
+        is_development=s.is_development,
+        log_level=s.log_level,
+        max_file_size_mb=s.max_file_size_mb,
+        max_file_size_bytes=s.max_file_size_bytes,
+        rate_limit_per_minute=s.rate_limit_per_minute,
+        openai_max_tokens=s.openai_max_tokens,
+        cors_origins=s.cors_origins_set,
+        trusted_hosts=s.trusted_hosts_set,
+        allowed_file_types=s.allowed_file_types_set,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily resolve the module-level ``settings`` export (PEP 562).
+    
+    Importing this module no longer reads the environment or .env file;
+    the Settings instance is built on first access instead.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,16 +6,58 @@ JWT 토큰 생성, 검증, 관리를 담당하는 핵심 인증 컴포넌트
 """
 
 import jwt
+from jwt.algorithms import get_default_algorithms
+import hmac
+import base64
+import binascii
 import hashlib
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional, List
+import orjson
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, FrozenSet, Iterable, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import structlog
+import asyncio
 import os
+import sys
+import time
 
 logger = structlog.get_logger(__name__)
 
+# HS256 서명은 hashlib/hmac(OpenSSL)으로 직접 처리하는 고속 경로 사용
+_FAST_PATH_ALGORITHM = "HS256"
+
+# hashlib/hmac은 약 2KB 이상의 입력에서만 GIL을 해제하므로,
+# 그보다 작은 토큰은 스레드 전환 비용이 서명/검증 비용보다 큼 → 이벤트 루프에서 바로 처리
+ASYNC_OFFLOAD_MIN_BYTES = 2048
+
+# 토큰 클레임 중 권한 목록을 제외한 부분의 대략적인 크기 (오프로드 판단용)
+_BASE_CLAIMS_SIZE = 256
+
+# Redis 블랙리스트 키 접두사 (값: 토큰 SHA-256 hex)
+_BLACKLIST_KEY_PREFIX = "jwt:bl:"
+
+
+@lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    """프로세스 공용 JWT 서명/검증 스레드 풀"""
+    return ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="jwt")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """패딩 없는 base64url 인코딩 (JWS 규격)"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """패딩 없는 base64url 디코딩"""
+    try:
+        return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+    except (binascii.Error, ValueError) as e:
+        raise jwt.DecodeError("잘못된 base64url 세그먼트") from e
+
 
 class TokenType(Enum):
     """토큰 유형"""
@@ -23,7 +65,40 @@ class TokenType(Enum):
     REFRESH = "refresh"
 
 
-@dataclass(frozen=True)
+# Enum 값 조회(TokenType(value))는 EnumMeta.__call__을 거치므로 dict로 대체
+_TOKEN_TYPES_BY_VALUE: Dict[str, TokenType] = {t.value: t for t in TokenType}
+
+
+@dataclass(slots=True, frozen=True)
+class AuthenticatedUser:
+    """
+    인증된 사용자 정보
+    
+    토큰 발급과 요청 인증에서 공통으로 사용하는 불변 사용자 표현입니다.
+    토큰 캐시에서 같은 인스턴스를 그대로 재사용합니다.
+    """
+    user_id: str
+    username: str
+    email: str
+    role: str
+    permissions: FrozenSet[str]
+    
+    def has_permission(self, permission: str) -> bool:
+        """특정 권한 보유 여부 확인"""
+        return permission in self.permissions
+
+
+def intern_permissions(permissions: Iterable[str]) -> FrozenSet[str]:
+    """
+    권한 목록을 frozenset으로 변환
+    
+    권한 문자열을 intern하여 같은 권한은 같은 객체를 공유하도록 하고,
+    포함 여부 검사를 해시 조회로 처리합니다.
+    """
+    return frozenset(map(sys.intern, permissions))
+
+
+@dataclass(frozen=True, slots=True)
 class TokenPayload:
     """JWT 토큰 페이로드"""
     user_id: str
@@ -32,12 +107,22 @@ class TokenPayload:
     role: str
     permissions: List[str]
     token_type: TokenType
-    issued_at: datetime
-    expires_at: datetime
+    iat_ts: int
+    exp_ts: int
+    
+    @property
+    def issued_at(self) -> datetime:
+        """발급 시각 (로그/표시용으로 필요할 때만 생성)"""
+        return datetime.fromtimestamp(self.iat_ts, tz=timezone.utc)
+    
+    @property
+    def expires_at(self) -> datetime:
+        """만료 시각 (로그/표시용으로 필요할 때만 생성)"""
+        return datetime.fromtimestamp(self.exp_ts, tz=timezone.utc)
     
     def is_expired(self) -> bool:
-        """토큰 만료 여부 확인"""
-        return datetime.now(timezone.utc) > self.expires_at
+        """토큰 만료 여부 확인 (Unix timestamp 정수 비교)"""
+        return time.time() > self.exp_ts
     
     def has_permission(self, permission: str) -> bool:
         """특정 권한 보유 여부 확인"""
@@ -52,12 +137,12 @@ class TokenPayload:
             "role": self.role,
             "permissions": self.permissions,
             "token_type": self.token_type.value,
-            "iat": int(self.issued_at.timestamp()),
-            "exp": int(self.expires_at.timestamp())
+            "iat": self.iat_ts,
+            "exp": self.exp_ts
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenValidationResult:
     """토큰 검증 결과"""
     is_valid: bool
@@ -84,7 +169,8 @@ class JWTManager:
         secret_key: Optional[str] = None,
         algorithm: str = "HS256",
         access_token_expire_minutes: int = 30,
-        refresh_token_expire_days: int = 7
+        refresh_token_expire_days: int = 7,
+        redis_client=None
     ):
         """
         JWT 관리자 초기화
@@ -94,6 +180,7 @@ class JWTManager:
             algorithm: JWT 알고리즘
             access_token_expire_minutes: 액세스 토큰 만료 시간 (분)
             refresh_token_expire_days: 리프레시 토큰 만료 시간 (일)
+            redis_client: 블랙리스트 공유용 동기 Redis 클라이언트 (선택사항)
         """
         self.secret_key = secret_key or os.getenv("JWT_SECRET_KEY")
         if not self.secret_key:
@@ -101,114 +188,169 @@ class JWTManager:
         
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
+        self.access_token_expire_seconds = access_token_expire_minutes * 60
         self.refresh_token_expire_days = refresh_token_expire_days
         
-        # 토큰 블랙리스트 (실제로는 Redis 등 외부 저장소 사용)
-        self._blacklisted_tokens = set()
+        # 토큰마다 반복되는 계산은 미리 수행
+        self.refresh_token_expire_seconds = refresh_token_expire_days * 86400
+        self._token_type_access = TokenType.ACCESS.value
+        self._token_type_refresh = TokenType.REFRESH.value
+        
+        # HS256 고속 경로: 서명 키와 고정 헤더를 한 번만 인코딩
+        self._use_fast_path = algorithm == _FAST_PATH_ALGORITHM
+        self._secret_bytes = self.secret_key.encode("utf-8")
+        self._header_b64 = _b64url_encode(orjson.dumps({"alg": algorithm, "typ": "JWT"}))
+        
+        # 그 외 알고리즘: PyJWT 알고리즘 구현과 키를 한 번만 조회/준비
+        # (jwt.encode/decode는 호출마다 레지스트리 조회와 옵션 dict 생성을 반복)
+        if not self._use_fast_path:
+            algorithms = get_default_algorithms()
+            if algorithm not in algorithms:
+                raise ValueError(f"지원하지 않는 JWT 알고리즘입니다: {algorithm}")
+            self._algorithm_impl = algorithms[algorithm]
+            self._prepared_key = self._algorithm_impl.prepare_key(self._secret_bytes)
+        
+        # 토큰 블랙리스트: Redis가 있으면 인스턴스 간 공유 + 토큰 만료 시 자동 삭제,
+        # 없으면 프로세스 내 set 사용
+        # (validate_token은 스레드풀에서 실행되므로 동기 클라이언트 사용)
+        self.redis_client = redis_client
+        self._blacklisted_tokens: Set[bytes] = set()
     
-    def create_access_token(
-        self,
-        user_id: str,
-        username: str,
-        email: str,
-        role: str,
-        permissions: List[str]
-    ) -> str:
+    def create_access_token(self, user: AuthenticatedUser) -> str:
         """
         액세스 토큰 생성
         
         Args:
-            user_id: 사용자 ID
-            username: 사용자명
-            email: 이메일
-            role: 역할
-            permissions: 권한 목록
+            user: 토큰을 발급할 사용자 정보
             
         Returns:
             str: JWT 액세스 토큰
         """
-        now = datetime.now(timezone.utc)
-        expires_at = now + timedelta(minutes=self.access_token_expire_minutes)
-        
-        payload = TokenPayload(
-            user_id=user_id,
-            username=username,
-            email=email,
-            role=role,
-            permissions=permissions,
-            token_type=TokenType.ACCESS,
-            issued_at=now,
-            expires_at=expires_at
-        )
+        iat = int(time.time())
+        exp = iat + self.access_token_expire_seconds
         
-        token = jwt.encode(
-            payload.to_dict(),
-            self.secret_key,
-            algorithm=self.algorithm
-        )
+        # TokenPayload를 거치지 않고 클레임 dict를 바로 구성
+        claims = {
+            "user_id": user.user_id,
+            "username": user.username,
+            "email": user.email,
+            "role": user.role,
+            "permissions": list(user.permissions),
+            "token_type": self._token_type_access,
+            "iat": iat,
+            "exp": exp
+        }
+        
+        token = self._encode(claims)
         
         logger.info(
             "액세스 토큰 생성",
             extra={
-                "user_id": user_id,
-                "username": username,
-                "expires_at": expires_at.isoformat(),
-                "permissions_count": len(permissions)
+                "user_id": user.user_id,
+                "username": user.username,
+                "expires_at": exp,
+                "permissions_count": len(user.permissions)
             }
         )
         
         return token
     
-    def create_refresh_token(
-        self,
-        user_id: str,
-        username: str,
-        email: str,
-        role: str
-    ) -> str:
+    def create_refresh_token(self, user: AuthenticatedUser) -> str:
         """
         리프레시 토큰 생성
         
         Args:
-            user_id: 사용자 ID
-            username: 사용자명
-            email: 이메일
-            role: 역할
+            user: 토큰을 발급할 사용자 정보 (권한은 포함하지 않음)
             
         Returns:
             str: JWT 리프레시 토큰
         """
-        now = datetime.now(timezone.utc)
-        expires_at = now + timedelta(days=self.refresh_token_expire_days)
-        
-        payload = TokenPayload(
-            user_id=user_id,
-            username=username,
-            email=email,
-            role=role,
-            permissions=[],  # 리프레시 토큰은 권한 정보 없음
-            token_type=TokenType.REFRESH,
-            issued_at=now,
-            expires_at=expires_at
-        )
+        iat = int(time.time())
+        exp = iat + self.refresh_token_expire_seconds
         
-        token = jwt.encode(
-            payload.to_dict(),
-            self.secret_key,
-            algorithm=self.algorithm
-        )
+        claims = {
+            "user_id": user.user_id,
+            "username": user.username,
+            "email": user.email,
+            "role": user.role,
+            "permissions": [],  # 리프레시 토큰은 권한 정보 없음
+            "token_type": self._token_type_refresh,
+            "iat": iat,
+            "exp": exp
+        }
+        
+        token = self._encode(claims)
         
         logger.info(
             "리프레시 토큰 생성",
             extra={
-                "user_id": user_id,
-                "username": username,
-                "expires_at": expires_at.isoformat()
+                "user_id": user.user_id,
+                "username": user.username,
+                "expires_at": exp
             }
         )
         
         return token
     
+    def validate_access_token_minimal(self, token: str) -> Optional[Tuple[str, str, Tuple[str, ...]]]:
+        """
+        액세스 토큰 최소 검증
+        
+        서명·만료·블랙리스트·토큰 유형만 확인하고 (user_id, role, permissions)를 반환합니다.
+        TokenPayload/TokenValidationResult 생성과 성공 로그를 생략하므로,
+        사용자 식별만 필요한 읽기 전용 경로에서 사용합니다.
+        
+        Returns:
+            유효하지 않으면 None
+        """
+        try:
+            if self._is_blacklisted(token):
+                return None
+            claims = self._decode(token)
+            if claims["token_type"] != self._token_type_access:
+                return None
+            return claims["user_id"], claims["role"], tuple(claims.get("permissions", ()))
+        except (jwt.InvalidTokenError, KeyError, TypeError):
+            return None
+    
+    async def create_access_token_async(self, user: AuthenticatedUser) -> str:
+        """액세스 토큰 생성 (권한 목록이 커서 토큰이 큰 경우에만 스레드 풀 사용)"""
+        size = _BASE_CLAIMS_SIZE + sum(len(p) + 3 for p in user.permissions)
+        return await self._run_cpu_bound(size, self.create_access_token, user)
+    
+    async def create_refresh_token_async(self, user: AuthenticatedUser) -> str:
+        """리프레시 토큰 생성 (권한이 없어 항상 작으므로 이벤트 루프에서 처리)"""
+        return await self._run_cpu_bound(_BASE_CLAIMS_SIZE, self.create_refresh_token, user)
+    
+    async def validate_token_async(self, token: str) -> TokenValidationResult:
+        """
+        토큰 검증 (비동기 핸들러용)
+        
+        Redis 블랙리스트는 네트워크 I/O이므로 항상 스레드 풀에서 실행합니다.
+        """
+        size = ASYNC_OFFLOAD_MIN_BYTES if self.redis_client is not None else len(token)
+        return await self._run_cpu_bound(size, self.validate_token, token)
+    
+    async def is_token_revoked_async(self, token: str) -> bool:
+        """
+        블랙리스트 등록 여부만 확인 (캐시된 토큰 재확인용)
+        
+        Redis 조회는 네트워크 I/O이므로 스레드 풀에서 실행합니다.
+        """
+        size = ASYNC_OFFLOAD_MIN_BYTES if self.redis_client is not None else len(token)
+        return await self._run_cpu_bound(size, self._is_blacklisted, token)
+    
+    async def _run_cpu_bound(self, size: int, func, *args):
+        """
+        입력 크기에 따라 바로 실행하거나 스레드 풀로 넘김
+        
+        ASYNC_OFFLOAD_MIN_BYTES 미만은 GIL이 해제되지 않아 오프로드 이득이 없으므로
+        호출한 코루틴에서 바로 실행합니다.
+        """
+        if size < ASYNC_OFFLOAD_MIN_BYTES:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), func, *args)
+    
     def validate_token(self, token: str) -> TokenValidationResult:
         """
         토큰 검증
@@ -229,29 +371,17 @@ class JWTManager:
                 )
             
             # JWT 디코딩 및 검증
-            decoded_payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm]
-            )
+            decoded_payload = self._decode(token)
             
-            # 페이로드 파싱
+            # 페이로드 파싱 (만료는 디코딩 단계에서 이미 검증됨)
             payload = self._parse_payload(decoded_payload)
             
-            # 만료 시간 확인
-            if payload.is_expired():
-                return TokenValidationResult(
-                    is_valid=False,
-                    payload=None,
-                    error_message="토큰이 만료되었습니다"
-                )
-            
             logger.debug(
                 "토큰 검증 성공",
                 extra={
                     "user_id": payload.user_id,
                     "token_type": payload.token_type.value,
-                    "expires_at": payload.expires_at.isoformat()
+                    "expires_at": payload.exp_ts
                 }
             )
             
@@ -287,6 +417,68 @@ class JWTManager:
                 error_message="토큰 검증 중 오류가 발생했습니다"
             )
     
+    def _encode(self, claims: Dict[str, Any]) -> str:
+        """클레임을 서명된 JWT 문자열로 인코딩"""
+        signing_input = self._header_b64 + b"." + _b64url_encode(orjson.dumps(claims))
+        return (signing_input + b"." + _b64url_encode(self._sign(signing_input))).decode("ascii")
+    
+    def _sign(self, signing_input: bytes) -> bytes:
+        """서명 생성"""
+        if self._use_fast_path:
+            return hmac.new(self._secret_bytes, signing_input, hashlib.sha256).digest()
+        return self._algorithm_impl.sign(signing_input, self._prepared_key)
+    
+    def _verify(self, signing_input: bytes, signature: bytes) -> bool:
+        """서명 검증 (상수 시간 비교)"""
+        if self._use_fast_path:
+            expected = hmac.new(self._secret_bytes, signing_input, hashlib.sha256).digest()
+            return hmac.compare_digest(expected, signature)
+        return self._algorithm_impl.verify(signing_input, self._prepared_key, signature)
+    
+    def _decode(self, token: str) -> Dict[str, Any]:
+        """
+        JWT 서명 및 만료 검증 후 클레임 반환
+        
+        PyJWT의 범용 디코딩 경로를 거치지 않고 토큰을 한 번만 분리하여 직접 검증하며,
+        실패 시 PyJWT와 동일한 예외(jwt.InvalidTokenError 계열)를 발생시킵니다.
+        """
+        try:
+            raw = token.encode("ascii")
+        except UnicodeEncodeError as e:
+            raise jwt.DecodeError("토큰에 허용되지 않는 문자가 포함되어 있습니다") from e
+        
+        signing_input, _, signature_b64 = raw.rpartition(b".")
+        header_b64, _, payload_b64 = signing_input.partition(b".")
+        if not header_b64 or not payload_b64 or b"." in payload_b64:
+            raise jwt.DecodeError("토큰 세그먼트 수가 올바르지 않습니다")
+        
+        # 발급한 헤더와 바이트 단위로 같으면 JSON 파싱 생략
+        if header_b64 != self._header_b64:
+            try:
+                header = orjson.loads(_b64url_decode(header_b64))
+            except orjson.JSONDecodeError as e:
+                raise jwt.DecodeError("잘못된 토큰 헤더") from e
+            if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+                raise jwt.InvalidAlgorithmError("허용되지 않는 알고리즘")
+        
+        if not self._verify(signing_input, _b64url_decode(signature_b64)):
+            raise jwt.InvalidSignatureError("서명 검증 실패")
+        
+        try:
+            claims = orjson.loads(_b64url_decode(payload_b64))
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError("잘못된 토큰 페이로드") from e
+        if not isinstance(claims, dict):
+            raise jwt.DecodeError("토큰 페이로드가 JSON 객체가 아닙니다")
+        
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+            raise jwt.DecodeError("exp 클레임이 올바르지 않습니다")
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        
+        return claims
+    
     def _parse_payload(self, decoded_payload: Dict[str, Any]) -> TokenPayload:
         """디코딩된 페이로드를 TokenPayload 객체로 변환"""
         return TokenPayload(
@@ -295,9 +487,9 @@ class JWTManager:
             email=decoded_payload["email"],
             role=decoded_payload["role"],
             permissions=decoded_payload.get("permissions", []),
-            token_type=TokenType(decoded_payload["token_type"]),
-            issued_at=datetime.fromtimestamp(decoded_payload["iat"], tz=timezone.utc),
-            expires_at=datetime.fromtimestamp(decoded_payload["exp"], tz=timezone.utc)
+            token_type=_TOKEN_TYPES_BY_VALUE[decoded_payload["token_type"]],
+            iat_ts=decoded_payload["iat"],
+            exp_ts=decoded_payload["exp"]
         )
     
     def refresh_access_token(self, refresh_token: str) -> Optional[str]:
@@ -327,30 +519,68 @@ class JWTManager:
         
         # TODO: 사용자 정보 및 권한을 데이터베이스에서 다시 조회
         # 현재는 기본 권한으로 설정
-        permissions = ["analysis:execute", "query:read"]
-        
-        return self.create_access_token(
+        return self.create_access_token(AuthenticatedUser(
             user_id=payload.user_id,
             username=payload.username,
             email=payload.email,
             role=payload.role,
-            permissions=permissions
-        )
+            permissions=intern_permissions(("analysis:execute", "query:read"))
+        ))
     
     def blacklist_token(self, token: str):
         """토큰을 블랙리스트에 추가 (로그아웃 시 사용)"""
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-        self._blacklisted_tokens.add(token_hash)
+        token_hash = hashlib.sha256(token.encode()).digest()
+        
+        if self.redis_client is not None:
+            # 토큰이 만료되면 블랙리스트에 둘 필요가 없으므로 남은 수명만큼만 보관
+            ttl = self._remaining_lifetime(token)
+            if ttl <= 0:
+                return
+            try:
+                self.redis_client.set(_BLACKLIST_KEY_PREFIX + token_hash.hex(), b"1", ex=ttl)
+            except Exception as e:
+                logger.warning(
+                    "Redis 블랙리스트 등록 실패 - 메모리에 보관",
+                    extra={"error": str(e)}
+                )
+                self._blacklisted_tokens.add(token_hash)
+        else:
+            self._blacklisted_tokens.add(token_hash)
         
         logger.info(
             "토큰 블랙리스트 추가",
-            extra={"token_hash": token_hash[:16]}
+            extra={"token_hash": token_hash[:8].hex()}
         )
     
     def _is_blacklisted(self, token: str) -> bool:
         """토큰이 블랙리스트에 있는지 확인"""
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-        return token_hash in self._blacklisted_tokens
+        if self.redis_client is None:
+            # 블랙리스트가 비어 있으면(대부분의 요청) 해시 계산 생략
+            if not self._blacklisted_tokens:
+                return False
+            return hashlib.sha256(token.encode()).digest() in self._blacklisted_tokens
+        
+        token_hash = hashlib.sha256(token.encode()).digest()
+        if token_hash in self._blacklisted_tokens:
+            return True
+        try:
+            return bool(self.redis_client.exists(_BLACKLIST_KEY_PREFIX + token_hash.hex()))
+        except Exception as e:
+            logger.warning(
+                "Redis 블랙리스트 조회 실패",
+                extra={"error": str(e)}
+            )
+            return False
+    
+    def _remaining_lifetime(self, token: str) -> int:
+        """서명 검증 없이 exp 클레임을 읽어 남은 수명(초) 계산"""
+        try:
+            payload_b64 = token.encode("ascii").split(b".")[1]
+            exp = orjson.loads(_b64url_decode(payload_b64))["exp"]
+            return int(exp - time.time())
+        except Exception:
+            # exp를 읽을 수 없으면 가장 긴 토큰 수명만큼 보관
+            return self.refresh_token_expire_seconds
     
     def get_token_info(self, token: str) -> Optional[Dict[str, Any]]:
         """토큰 정보 조회 (디버깅용)"""
@@ -5,12 +5,14 @@ Clean Architecture: Application Core
 LLM 통합 및 자연어 처리 핵심 로직
 """
 
-import json
+import re
+import time
+import heapq
 import hashlib
+import orjson
 import asyncio
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from dataclasses import dataclass
-from datetime import datetime
 import structlog
 
 from langchain_openai import ChatOpenAI
@@ -24,8 +26,66 @@ from app.config.settings import get_settings
 logger = structlog.get_logger(__name__)
 settings = get_settings()
 
+# 생성된 Python 코드의 금지 패턴 (모듈 로드 시 한 번만 컴파일, 단일 스캔)
+_FORBIDDEN_CODE_RE = re.compile(
+    r'import\s+(os|sys|subprocess|shutil)'
+    r'|exec\s*\('
+    r'|eval\s*\('
+    r'|open\s*\('
+    r'|__import__'
+    r'|compile\s*\('
+    r'|globals\s*\('
+    r'|locals\s*\(',
+    re.IGNORECASE
+)
 
-@dataclass(frozen=True)
+# 질문 분류 규칙: 명확한 질문은 LLM 호출 없이 분류 (analysis_type, confidence)
+_CLASSIFICATION_RULES = (
+    (re.compile(r'\b(select|where|join|group\s+by|order\s+by)\b|테이블|데이터베이스|\bdb\b', re.IGNORECASE),
+     "database", 0.95),
+    (re.compile(r'\b(pivot|vlookup|xlsx?|csv)\b|엑셀|시트|피벗', re.IGNORECASE),
+     "excel", 0.9),
+)
+_CLASSIFICATION_FASTPATH_MIN_CONFIDENCE = 0.85
+
+# JSON 추출용 스캐너: 문자열 리터럴은 통째로 건너뛰고 중괄호만 추적
+_JSON_SCAN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    응답 텍스트에서 첫 번째 JSON 객체 구간 추출
+    
+    탐욕적 정규식 대신 중괄호 깊이를 추적하여 한 번만 스캔하며,
+    문자열 안의 중괄호와 이스케이프는 무시합니다.
+    """
+    stripped = text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        # JSON 모드 응답: 스캔 생략
+        return stripped
+    
+    start = text.find("{")
+    if start < 0:
+        return None
+    
+    depth = 0
+    for match in _JSON_SCAN_RE.finditer(text, start):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:match.end()]
+    return None
+
+
+def _question_hash(question: str) -> str:
+    """로그 상관관계용 질문 식별자 (비보안 용도, 16자리 hex)"""
+    return hashlib.blake2b(question.encode(), digest_size=8).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
 class SQLGenerationResult:
     """SQL 생성 결과"""
     sql: str
@@ -47,7 +107,7 @@ class SQLGenerationResult:
         return self.complexity == "complex" or self.requires_join
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExcelAnalysisResult:
     """Excel 분석 결과"""
     code: str
@@ -64,7 +124,7 @@ class ExcelAnalysisResult:
         return self.safety_check == "confirmed_safe" and self.confidence >= 0.7
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuestionClassificationResult:
     """질문 분류 결과"""
     analysis_type: str
@@ -76,6 +136,142 @@ class QuestionClassificationResult:
     estimated_processing_time: str
 
 
+@dataclass(slots=True)
+class ProcessorMetrics:
+    """
+    LLM 프로세서 성능 메트릭
+    
+    갱신은 await 없는 동기 메서드에서만 이루어지므로 이벤트 루프 안에서
+    다른 태스크와 섞이지 않습니다. 평균 신뢰도는 Welford 방식으로 누적합니다.
+    """
+    total_requests: int = 0
+    successful_requests: int = 0
+    cache_hits: int = 0
+    total_tokens_used: int = 0
+    classification_fastpath_hits: int = 0
+    confidence_count: int = 0
+    average_confidence: float = 0.0
+    
+    def record(self, success: bool, tokens_used: int, confidence: float):
+        """요청 결과 반영"""
+        self.total_requests += 1
+        self.total_tokens_used += tokens_used
+        if success:
+            self.successful_requests += 1
+            if confidence > 0:
+                self.confidence_count += 1
+                self.average_confidence += (
+                    (confidence - self.average_confidence) / self.confidence_count
+                )
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 값을 한 번에 읽어 지표로 변환"""
+        total_requests = self.total_requests
+        if total_requests == 0:
+            return {}
+        
+        return {
+            'success_rate': self.successful_requests / total_requests,
+            'cache_hit_rate': self.cache_hits / total_requests,
+            'classification_fastpath_hits': self.classification_fastpath_hits,
+            'total_tokens_used': self.total_tokens_used,
+            'average_confidence': self.average_confidence,
+            'total_requests': total_requests
+        }
+
+
+class _LLMBatcher:
+    """
+    동시 LLM 호출 배칭
+    
+    짧은 시간 창 동안 들어온 프롬프트를 모아 abatch 한 번으로 전달합니다.
+    창이 끝나거나 대기 요청이 최대 크기에 도달하면 즉시 전달합니다.
+    ChatOpenAI.abatch는 프롬프트마다 ainvoke를 동시 실행할 뿐 요청을 하나로 합치지 않으므로,
+    공급자 측 배치를 지원하는 모델에서만 의미가 있습니다 (기본 설정에서는 사용하지 않음).
+    """
+    
+    def __init__(self, llm: ChatOpenAI, window_seconds: float, max_batch_size: int):
+        self._llm = llm
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: List[Tuple[str, "asyncio.Future[str]"]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._inflight: Set["asyncio.Task[None]"] = set()
+    
+    async def invoke(self, prompt: str) -> str:
+        """프롬프트를 배치에 추가하고 응답 본문을 기다림"""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[str]" = loop.create_future()
+        self._pending.append((prompt, future))
+        
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window_seconds, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """대기 중인 프롬프트를 하나의 배치로 전송"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.ensure_future(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+    
+    async def _send(self, batch: List[Tuple[str, "asyncio.Future[str]"]]):
+        try:
+            responses = await self._llm.abatch(
+                [[HumanMessage(content=prompt)] for prompt, _ in batch],
+                return_exceptions=True
+            )
+        except Exception as e:
+            responses = [e] * len(batch)
+        
+        for (_, future), response in zip(batch, responses):
+            if future.done():  # 호출자가 취소한 경우
+                continue
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response.content)
+
+
+class ExampleIndex:
+    """
+    예시 질문 키워드 인덱스
+    
+    예시 질문을 한 번만 토큰화해 두고, 요청마다 질문만 토큰화하여
+    키워드 겹침 수가 큰 예시를 선택합니다.
+    """
+    
+    __slots__ = ("examples", "_example_tokens")
+    
+    def __init__(self, examples: List[Dict[str, str]]):
+        self.examples = examples
+        self._example_tokens = [
+            frozenset(example.get('question', '').lower().split())
+            for example in examples
+        ]
+    
+    def top_examples(self, question: str, limit: int) -> List[Dict[str, str]]:
+        """관련성 순 상위 예시 (동점이면 원래 순서 유지)"""
+        question_tokens = frozenset(question.lower().split())
+        example_tokens = self._example_tokens
+        top_indices = heapq.nlargest(
+            limit,
+            range(len(example_tokens)),
+            key=lambda i: len(question_tokens & example_tokens[i])
+        )
+        return [self.examples[i] for i in top_indices]
+
+
 class DataGenieLLMProcessor:
     """
     DataGenie 전용 LLM 프로세서
@@ -111,20 +307,27 @@ class DataGenieLLMProcessor:
             openai_api_key=settings.openai_api_key
         )
         
+        # 배치 창이 설정된 경우에만 주 모델 호출을 배치로 묶음 (0이면 바로 ainvoke)
+        self._batcher: Optional[_LLMBatcher] = None
+        if settings.llm_batch_window_ms > 0:
+            self._batcher = _LLMBatcher(
+                self.llm,
+                window_seconds=settings.llm_batch_window_ms / 1000,
+                max_batch_size=settings.llm_batch_max_size
+            )
+        
         self.prompt_templates = DataGeniePromptTemplates()
         self.injection_detector = PromptInjectionDetector()
         self.sql_validator = SQLSecurityValidator()
         self.cache_client = cache_client
         self.token_encoder = tiktoken.encoding_for_model(settings.openai_model)
+        self._token_warning_threshold = int(settings.openai_max_tokens * 0.8)  # 80% 임계값
+        self._exact_token_metrics = settings.exact_token_metrics
+        self._structural_cache_enabled = settings.llm_structural_cache_enabled
+        self._example_index: Optional[ExampleIndex] = None
         
         # 성능 메트릭
-        self.metrics = {
-            'total_requests': 0,
-            'successful_requests': 0,
-            'cache_hits': 0,
-            'total_tokens_used': 0,
-            'average_confidence': 0.0
-        }
+        self.metrics = ProcessorMetrics()
     
     async def generate_sql_analysis(
         self,
@@ -145,7 +348,7 @@ class DataGenieLLMProcessor:
         Returns:
             SQLGenerationResult: SQL 생성 결과
         """
-        start_time = datetime.now()
+        start_ns = time.monotonic_ns()
         
         try:
             # 1. 입력 검증
@@ -159,29 +362,32 @@ class DataGenieLLMProcessor:
             cache_key = self._generate_cache_key("sql", question, schema_info)
             cached_result = await self._get_cached_result(cache_key)
             if cached_result:
-                self.metrics['cache_hits'] += 1
+                self.metrics.cache_hits += 1
                 return cached_result
             
             # 4. 프롬프트 구성
             formatted_schema = self.prompt_templates.format_schema_info(schema_info)
             formatted_examples = self._get_relevant_examples(question, examples or [])
             
-            prompt = self.prompt_templates.get_sql_prompt().format(
+            prompt = self.prompt_templates.render_sql_prompt(
                 question=question,
                 schema_info=formatted_schema,
                 examples=formatted_examples
             )
             
             # 5. 토큰 사용량 확인
-            token_count = len(self.token_encoder.encode(prompt))
-            if token_count > settings.openai_max_tokens * 0.8:  # 80% 임계값
+            token_count = self._count_tokens(prompt)
+            if token_count > self._token_warning_threshold:
                 logger.warning(f"높은 토큰 사용량: {token_count}")
             
-            # 6. LLM 호출
-            response = await self._call_llm_with_fallback(prompt)
-            
-            # 7. 응답 파싱
-            result_data = self._parse_json_response(response)
+            # 6. LLM 호출 및 응답 파싱 (같은 프롬프트는 응답 캐시, 설정 시 같은 질문 골격은 구조 캐시 사용)
+            structural_context = (
+                (question, formatted_schema, formatted_examples)
+                if self._structural_cache_enabled else None
+            )
+            result_data = await self._invoke_llm_json(
+                "sql", prompt, structural_context=structural_context
+            )
             
             # 8. SQL 보안 검증
             sql_validation = self.sql_validator.validate_sql(
@@ -193,7 +399,7 @@ class DataGenieLLMProcessor:
                 raise SecurityError(f"안전하지 않은 SQL: {sql_validation.violations}")
             
             # 9. 결과 생성
-            processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
+            processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
             
             result = SQLGenerationResult(
                 sql=sql_validation.sanitized_sql or result_data.get('sql', ''),
@@ -231,7 +437,7 @@ class DataGenieLLMProcessor:
                 "SQL 생성 실패",
                 extra={
                     "error": str(e),
-                    "question_hash": hashlib.sha256(question.encode()).hexdigest()[:16]
+                    "question_hash": _question_hash(question)
                 }
             )
             raise LLMProcessingError(f"SQL 쿼리 생성에 실패했습니다: {str(e)}")
@@ -255,7 +461,7 @@ class DataGenieLLMProcessor:
         Returns:
             ExcelAnalysisResult: Excel 분석 결과
         """
-        start_time = datetime.now()
+        start_ns = time.monotonic_ns()
         
         try:
             # 1. 입력 검증
@@ -269,23 +475,20 @@ class DataGenieLLMProcessor:
             cache_key = self._generate_cache_key("excel", question, dataframe_info)
             cached_result = await self._get_cached_result(cache_key)
             if cached_result:
-                self.metrics['cache_hits'] += 1
+                self.metrics.cache_hits += 1
                 return cached_result
             
             # 4. 프롬프트 구성
             formatted_df_info = self.prompt_templates.format_dataframe_info(dataframe_info)
             
-            prompt = self.prompt_templates.get_excel_prompt().format(
+            prompt = self.prompt_templates.render_excel_prompt(
                 question=question,
                 dataframe_info=formatted_df_info,
                 sample_data=sample_data or "샘플 데이터 없음"
             )
             
-            # 5. LLM 호출
-            response = await self._call_llm_with_fallback(prompt)
-            
-            # 6. 응답 파싱
-            result_data = self._parse_json_response(response)
+            # 5. LLM 호출 및 응답 파싱 (같은 프롬프트는 응답 캐시 사용)
+            result_data = await self._invoke_llm_json("excel", prompt)
             
             # 7. Python 코드 안전성 검증
             generated_code = result_data.get('code', '')
@@ -293,7 +496,7 @@ class DataGenieLLMProcessor:
                 raise SecurityError("안전하지 않은 Python 코드가 생성되었습니다")
             
             # 8. 결과 생성
-            processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
+            processing_time = (time.monotonic_ns() - start_ns) // 1_000_000
             
             result = ExcelAnalysisResult(
                 code=generated_code,
@@ -310,7 +513,11 @@ class DataGenieLLMProcessor:
             await self._cache_result(cache_key, result)
             
             # 10. 메트릭 업데이트
-            token_count = len(self.token_encoder.encode(prompt))
+            token_count = (
+                len(self.token_encoder.encode(prompt))
+                if self._exact_token_metrics
+                else self._estimate_tokens(prompt)
+            )
             self._update_metrics(True, token_count, result.confidence)
             
             logger.info(
@@ -331,7 +538,7 @@ class DataGenieLLMProcessor:
                 "Excel 분석 생성 실패",
                 extra={
                     "error": str(e),
-                    "question_hash": hashlib.sha256(question.encode()).hexdigest()[:16]
+                    "question_hash": _question_hash(question)
                 }
             )
             raise LLMProcessingError(f"Excel 분석 코드 생성에 실패했습니다: {str(e)}")
@@ -350,14 +557,19 @@ class DataGenieLLMProcessor:
             # 입력 검증
             self._validate_input(question)
             
+            # 규칙으로 분류 가능한 질문은 LLM 호출 생략
+            local_result = self._classify_locally(question)
+            if local_result is not None:
+                self.metrics.classification_fastpath_hits += 1
+                return local_result
+            
             # 프롬프트 구성
-            prompt = self.prompt_templates.get_classification_prompt().format(
+            prompt = self.prompt_templates.render_classification_prompt(
                 question=question
             )
             
             # LLM 호출
-            response = await self._call_llm_with_fallback(prompt)
-            result_data = self._parse_json_response(response)
+            result_data = await self._invoke_llm_json("classification", prompt)
             
             return QuestionClassificationResult(
                 analysis_type=result_data.get('analysis_type', 'general'),
@@ -382,6 +594,58 @@ class DataGenieLLMProcessor:
                 estimated_processing_time='medium'
             )
     
+    def _classify_locally(self, question: str) -> Optional[QuestionClassificationResult]:
+        """
+        규칙 기반 질문 분류
+        
+        한 유형의 규칙만 일치하고 신뢰도가 기준 이상일 때만 결과를 반환하며,
+        여러 유형이 섞인 질문은 LLM 분류로 넘깁니다.
+        """
+        matched = None
+        for pattern, analysis_type, confidence in _CLASSIFICATION_RULES:
+            keywords = [m.group().lower() for m in pattern.finditer(question)]
+            if not keywords:
+                continue
+            if matched is not None:
+                return None
+            matched = (analysis_type, confidence, keywords)
+        
+        if matched is None or matched[1] < _CLASSIFICATION_FASTPATH_MIN_CONFIDENCE:
+            return None
+        
+        analysis_type, confidence, keywords = matched
+        return QuestionClassificationResult(
+            analysis_type=analysis_type,
+            confidence=confidence,
+            reasoning='규칙 기반 분류',
+            keywords=list(dict.fromkeys(keywords)),
+            requires_data_connection=analysis_type == "database",
+            complexity='simple',
+            estimated_processing_time='fast'
+        )
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        토큰 수 근사치 (UTF-8 4바이트당 1토큰)
+        
+        영어/코드는 약 4자, 한글은 약 1.3자당 1토큰으로 계산됩니다.
+        """
+        return len(text.encode()) >> 2
+    
+    def _count_tokens(self, prompt: str) -> int:
+        """
+        프롬프트 토큰 수 계산
+        
+        근사치가 경고 임계값의 ±10% 이내이거나 정확한 메트릭이 설정된 경우에만
+        tiktoken으로 실제 토큰화합니다.
+        """
+        estimate = self._estimate_tokens(prompt)
+        threshold = self._token_warning_threshold
+        if self._exact_token_metrics or abs(estimate - threshold) <= threshold // 10:
+            return len(self.token_encoder.encode(prompt))
+        return estimate
+    
     def _validate_input(self, question: str):
         """입력 검증"""
         if not question or not question.strip():
@@ -393,23 +657,10 @@ class DataGenieLLMProcessor:
     def _validate_python_code(self, code: str) -> bool:
         """Python 코드 안전성 검증"""
         import ast
-        import re
         
         # 금지된 패턴 검사
-        forbidden_patterns = [
-            r'import\s+(os|sys|subprocess|shutil)',
-            r'exec\s*\(',
-            r'eval\s*\(',
-            r'open\s*\(',
-            r'__import__',
-            r'compile\s*\(',
-            r'globals\s*\(',
-            r'locals\s*\(',
-        ]
-        
-        for pattern in forbidden_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                return False
+        if _FORBIDDEN_CODE_RE.search(code):
+            return False
         
         try:
             # 구문 검사
@@ -421,8 +672,9 @@ class DataGenieLLMProcessor:
     async def _call_llm_with_fallback(self, prompt: str) -> str:
         """LLM 호출 (폴백 포함)"""
         try:
-            message = HumanMessage(content=prompt)
-            response = await self.llm.ainvoke([message])
+            if self._batcher is not None:
+                return await self._batcher.invoke(prompt)
+            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
             return response.content
         except Exception as e:
             logger.warning(f"주 모델 실패, 폴백 모델 사용: {str(e)}")
@@ -437,22 +689,55 @@ class DataGenieLLMProcessor:
         """JSON 응답 파싱"""
         try:
             # JSON 블록 추출
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                return json.loads(json_str)
+            json_str = _extract_json_object(response)
+            if json_str is not None:
+                return orjson.loads(json_str)
             else:
                 raise ValueError("JSON 형식을 찾을 수 없습니다")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {str(e)}, 응답: {response[:200]}")
             raise ValueError("LLM 응답을 파싱할 수 없습니다")
     
+    async def _invoke_llm_json(
+        self,
+        template_name: str,
+        prompt: str,
+        structural_context: Optional[Tuple[str, str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        LLM 호출 후 JSON 응답 파싱
+        
+        렌더링된 프롬프트 단위 응답 캐시를 먼저 확인하고, structural_context
+        (질문, 포맷된 스키마, 포맷된 예시)가 주어지면 질문 골격 캐시도 확인합니다.
+        """
+        response_cache = self.prompt_templates.cache
+        result_data = response_cache.get(template_name, prompt)
+        if result_data is not None:
+            return result_data
+        
+        structural_cache = self.prompt_templates.structural_cache
+        if structural_context is not None:
+            result_data = structural_cache.get(*structural_context)
+            if result_data is not None:
+                return result_data
+        
+        response = await self._call_llm_with_fallback(prompt)
+        result_data = self._parse_json_response(response)
+        response_cache.put(template_name, prompt, result_data)
+        if structural_context is not None:
+            structural_cache.put(*structural_context, result_data)
+        return result_data
+    
     def _generate_cache_key(self, operation: str, question: str, context: Dict) -> str:
         """캐시 키 생성"""
-        context_str = json.dumps(context, sort_keys=True)
-        content = f"{operation}:{question}:{context_str}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        # 보안 용도가 아니므로 blake2b 128비트로 충분
+        # 중간 문자열 없이 바이트를 순서대로 해시에 공급 (질문은 길이 접두로 경계 고정)
+        question_bytes = question.encode()
+        hasher = hashlib.blake2b(operation.encode(), digest_size=16)
+        hasher.update(len(question_bytes).to_bytes(4, "big"))
+        hasher.update(question_bytes)
+        hasher.update(orjson.dumps(context, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
+        return hasher.hexdigest()
     
     async def _get_cached_result(self, cache_key: str) -> Optional[Any]:
         """캐시에서 결과 조회"""
@@ -462,7 +747,7 @@ class DataGenieLLMProcessor:
         try:
             cached_data = await self.cache_client.get(f"datagenie:llm:{cache_key}")
             if cached_data:
-                return json.loads(cached_data)
+                return orjson.loads(cached_data)
         except Exception as e:
             logger.warning(f"캐시 조회 실패: {str(e)}")
         
@@ -474,16 +759,11 @@ class DataGenieLLMProcessor:
             return
         
         try:
-            # dataclass를 dict로 변환
-            if hasattr(result, '__dict__'):
-                result_dict = result.__dict__
-            else:
-                result_dict = result
-            
+            # orjson은 dataclass(slots 포함)를 직접 직렬화
             await self.cache_client.setex(
                 f"datagenie:llm:{cache_key}",
                 3600,  # 1시간 TTL
-                json.dumps(result_dict, ensure_ascii=False)
+                orjson.dumps(result)
             )
         except Exception as e:
             logger.warning(f"캐시 저장 실패: {str(e)}")
@@ -493,49 +773,25 @@ class DataGenieLLMProcessor:
         if not examples:
             return "예시 없음"
         
-        # 간단한 키워드 매칭으로 관련 예시 선택
-        question_words = set(question.lower().split())
-        scored_examples = []
-        
-        for example in examples:
-            example_words = set(example.get('question', '').lower().split())
-            relevance_score = len(question_words & example_words)
-            scored_examples.append((relevance_score, example))
+        # 같은 예시 목록이 반복 전달되면 토큰화 결과 재사용
+        index = self._example_index
+        if index is None or index.examples is not examples:
+            index = self._example_index = ExampleIndex(examples)
         
-        # 관련성 순으로 정렬하여 상위 3개 선택
-        scored_examples.sort(key=lambda x: x[0], reverse=True)
-        top_examples = [ex[1] for ex in scored_examples[:3]]
-        
-        return self.prompt_templates.format_examples(top_examples)
+        return self.prompt_templates.format_examples(index.top_examples(question, 3))
     
     def _update_metrics(self, success: bool, tokens_used: int, confidence: float):
         """메트릭 업데이트"""
-        self.metrics['total_requests'] += 1
-        if success:
-            self.metrics['successful_requests'] += 1
-        self.metrics['total_tokens_used'] += tokens_used
-        
-        # 평균 신뢰도 계산
-        if success and confidence > 0:
-            current_avg = self.metrics['average_confidence']
-            total_success = self.metrics['successful_requests']
-            self.metrics['average_confidence'] = (
-                (current_avg * (total_success - 1) + confidence) / total_success
-            )
+        self.metrics.record(success, tokens_used, confidence)
     
     def get_performance_metrics(self) -> Dict[str, Any]:
         """성능 메트릭 반환"""
-        total_requests = self.metrics['total_requests']
-        if total_requests == 0:
-            return {}
-        
-        return {
-            'success_rate': self.metrics['successful_requests'] / total_requests,
-            'cache_hit_rate': self.metrics['cache_hits'] / total_requests,
-            'total_tokens_used': self.metrics['total_tokens_used'],
-            'average_confidence': self.metrics['average_confidence'],
-            'total_requests': total_requests
-        }
+        metrics = self.metrics.snapshot()
+        if metrics:
+            metrics['prompt_format_cache'] = self.prompt_templates.format_cache_info()
+            metrics['response_cache'] = self.prompt_templates.cache.info()
+            metrics['structural_cache'] = self.prompt_templates.structural_cache.info()
+        return metrics
 
 
 class LLMProcessingError(Exception):
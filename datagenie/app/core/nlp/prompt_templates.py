@@ -5,13 +5,289 @@ Clean Architecture: Application Core
 LLM 프롬프트 엔지니어링 및 템플릿 관리
 """
 
-from typing import Dict, List, Any, Optional
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from langchain.prompts import PromptTemplate
+import orjson
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 
+class _PromptRenderer:
+    """
+    PromptTemplate을 정적 접두부와 변수 꼬리로 분리해 렌더링
+    
+    첫 변수 앞의 고정 본문은 한 번만 만들어 두고, 나머지만 str.format으로 채웁니다.
+    LangChain의 Python 수준 포맷터를 거치지 않으며 접두부가 호출마다 동일하게 유지됩니다.
+    """
+    
+    __slots__ = ("prefix", "tail")
+    
+    def __init__(self, prompt: PromptTemplate):
+        prefix_parts: List[str] = []
+        tail_parts: List[str] = []
+        
+        for literal, field_name, format_spec, conversion in Formatter().parse(prompt.template):
+            if tail_parts:
+                tail_parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            else:
+                prefix_parts.append(literal)
+            if field_name is not None:
+                conversion_part = f"!{conversion}" if conversion else ""
+                spec_part = f":{format_spec}" if format_spec else ""
+                tail_parts.append(f"{{{field_name}{conversion_part}{spec_part}}}")
+        
+        self.prefix = "".join(prefix_parts)
+        self.tail = "".join(tail_parts)
+    
+    def render(self, **kwargs: Any) -> str:
+        """변수를 채운 전체 프롬프트"""
+        return self.prefix + self.tail.format(**kwargs)
+
+
+class ResponseCache:
+    """
+    렌더링된 프롬프트별 LLM 응답 캐시
+    
+    temperature=0 호출은 같은 프롬프트에 같은 응답을 주므로, (템플릿 이름, 프롬프트)의
+    SHA-256을 키로 파싱된 JSON 응답을 LRU로 보관합니다. 응답은 orjson 바이트로 저장해
+    조회마다 독립된 객체를 돌려줍니다.
+    """
+    
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lru: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(template_name: str, prompt: str) -> bytes:
+        """템플릿 이름과 프롬프트의 SHA-256 다이제스트 (이름은 NUL로 구분)"""
+        hasher = hashlib.sha256(template_name.encode())
+        hasher.update(b"\0")
+        hasher.update(prompt.encode())
+        return hasher.digest()
+    
+    def get(self, template_name: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """캐시된 응답 조회 (없으면 None)"""
+        key = self._key(template_name, prompt)
+        with self._lock:
+            cached = self._lru.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._lru.move_to_end(key)
+            self.hits += 1
+        return orjson.loads(cached)
+    
+    def put(self, template_name: str, prompt: str, response: Dict[str, Any]) -> None:
+        """파싱된 응답 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        key = self._key(template_name, prompt)
+        value = orjson.dumps(response)
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            if len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+    
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._lru.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def info(self) -> Dict[str, int]:
+        """적중 통계 (functools 캐시 통계와 같은 키)"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "maxsize": self.maxsize,
+                "currsize": len(self._lru),
+            }
+
+
+# 질문 속 엔티티: 따옴표 문자열(따옴표/백슬래시/개행 제외) 또는 숫자
+_QUESTION_ENTITY_RE = re.compile(
+    r"'(?P<sq>[^'\"\\\n]*)'|\"(?P<dq>[^'\"\\\n]*)\"|(?<![\d.])(?P<num>\d+(?:\.\d+)?)(?![\d.])"
+)
+_SKELETON_MARKERS = {"sq": "<STR>", "dq": "<STR>", "num": "<NUM>"}
+_PLACEHOLDER_RE = re.compile(r"\x00(\d+)\x00")
+
+# 템플릿 검증용: SQL 문자열 리터럴, 따옴표 식별자, 숫자 리터럴
+_SQL_STRING_LITERAL_RE = re.compile(r"'((?:[^']|'')*)'")
+_SQL_QUOTED_IDENTIFIER_RE = re.compile(r'"(?:[^"]|"")*"')
+_SQL_NUMBER_RE = re.compile(r"(?<![\w.])\d|(?<!\w)\.\d")
+_DIGIT_RE = re.compile(r"\d")
+
+
+class StructuralResponseCache:
+    """
+    질문 골격 단위 SQL 응답 캐시 (GenCache 방식)
+    
+    "2023년 매출 상위 10개"와 "2024년 매출 상위 5개"처럼 숫자/따옴표 문자열만 다른 질문은
+    같은 골격을 공유합니다. 생성된 SQL에서 각 엔티티가 정확히 한 번 나타나고, 엔티티가 아닌
+    숫자/문자열 리터럴이 없을 때만 자리표시자로 바꿔 저장합니다. ("1분기" -> BETWEEN 1 AND 3처럼
+    엔티티에서 파생된 값이 있으면 다른 엔티티로 재구성할 수 없으므로 저장하지 않음)
+    적중 시 새 질문의 엔티티로 채운 응답을 돌려주며, 재구성된 SQL도 호출 측에서
+    SQLSecurityValidator 검증을 다시 거칩니다.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lru: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _extract(question: str) -> Tuple[str, List[Tuple[str, str]]]:
+        """질문 골격과 (종류, 값) 엔티티 목록"""
+        entities = []
+        
+        def mask(match: re.Match) -> str:
+            kind = match.lastgroup
+            entities.append((kind, match.group(kind)))
+            return _SKELETON_MARKERS[kind]
+        
+        skeleton = _QUESTION_ENTITY_RE.sub(mask, question)
+        return skeleton, entities
+    
+    @staticmethod
+    def _key(skeleton: str, schema_info: str, examples: str) -> bytes:
+        """스키마, 예시, 질문 골격의 SHA-256 다이제스트"""
+        hasher = hashlib.sha256(schema_info.encode())
+        hasher.update(b"\0")
+        hasher.update(examples.encode())
+        hasher.update(b"\0")
+        hasher.update(skeleton.encode())
+        return hasher.digest()
+    
+    @staticmethod
+    def _has_foreign_sql_literals(sql_template: str) -> bool:
+        """자리표시자가 아닌 숫자/문자열 리터럴이 SQL 템플릿에 남아 있는지 확인"""
+        for match in _SQL_STRING_LITERAL_RE.finditer(sql_template):
+            if not _PLACEHOLDER_RE.fullmatch(match.group(1)):
+                return True
+        
+        rest = _SQL_STRING_LITERAL_RE.sub(" ", sql_template)
+        rest = _SQL_QUOTED_IDENTIFIER_RE.sub(" ", rest)
+        rest = _PLACEHOLDER_RE.sub(" ", rest)
+        return _SQL_NUMBER_RE.search(rest) is not None
+    
+    @staticmethod
+    def _templatize(text: Any, entities: List[Tuple[str, str]]) -> Optional[str]:
+        """엔티티 값을 자리표시자로 치환 (각 엔티티가 정확히 한 번 나타날 때만)"""
+        if not isinstance(text, str) or "\x00" in text:
+            return None
+        
+        spans = []
+        for index, (kind, value) in enumerate(entities):
+            if kind == "num":
+                # 식별자 일부(col2023)는 제외하고, 뒤에 한글 단위(2023년)가 붙는 것은 허용
+                pattern = rf"(?<![\w.]){re.escape(value)}(?![\d.])"
+            else:
+                pattern = rf"(?<=['\"]){re.escape(value)}(?=['\"])"
+            matches = list(re.finditer(pattern, text))
+            if len(matches) != 1:
+                return None
+            spans.append((matches[0].start(), matches[0].end(), index))
+        
+        spans.sort()
+        parts = []
+        position = 0
+        for start, end, index in spans:
+            if start < position:
+                return None  # 겹치는 엔티티
+            parts.append(text[position:start])
+            parts.append(f"\x00{index}\x00")
+            position = end
+        parts.append(text[position:])
+        return "".join(parts)
+    
+    def get(self, question: str, schema_info: str, examples: str) -> Optional[Dict[str, Any]]:
+        """같은 골격의 응답을 새 엔티티로 재구성 (없으면 None)"""
+        skeleton, entities = self._extract(question)
+        if not entities:
+            return None
+        
+        key = self._key(skeleton, schema_info, examples)
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._lru.move_to_end(key)
+            self.hits += 1
+        
+        def fill(match: re.Match) -> str:
+            return entities[int(match.group(1))][1]
+        
+        response = orjson.loads(entry["response"])
+        response["sql"] = _PLACEHOLDER_RE.sub(fill, entry["sql"])
+        response["explanation"] = _PLACEHOLDER_RE.sub(fill, entry["explanation"])
+        return response
+    
+    def put(
+        self,
+        question: str,
+        schema_info: str,
+        examples: str,
+        response: Dict[str, Any]
+    ) -> None:
+        """SQL을 엔티티 자리표시자 템플릿으로 바꿀 수 있을 때만 저장"""
+        skeleton, entities = self._extract(question)
+        if not entities:
+            return
+        
+        sql_template = self._templatize(response.get("sql"), entities)
+        if sql_template is None or self._has_foreign_sql_literals(sql_template):
+            return
+        
+        # 설명은 엔티티를 치환할 수 없거나 다른 숫자가 남아 있으면 섞이지 않도록 비움
+        explanation_template = self._templatize(response.get("explanation", ""), entities) or ""
+        if _DIGIT_RE.search(_PLACEHOLDER_RE.sub(" ", explanation_template)):
+            explanation_template = ""
+        rest = {k: v for k, v in response.items() if k not in ("sql", "explanation")}
+        entry = {
+            "sql": sql_template,
+            "explanation": explanation_template,
+            "response": orjson.dumps(rest),
+        }
+        
+        key = self._key(skeleton, schema_info, examples)
+        with self._lock:
+            self._lru[key] = entry
+            self._lru.move_to_end(key)
+            if len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+    
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._lru.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def info(self) -> Dict[str, int]:
+        """적중 통계 (functools 캐시 통계와 같은 키)"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "maxsize": self.maxsize,
+                "currsize": len(self._lru),
+            }
+
+
 class DataGeniePromptTemplates:
     """
     DataGenie 전용 프롬프트 템플릿 관리자
@@ -175,6 +451,17 @@ Python 코드:"""
 시각화 추천:"""
     )
     
+    # 정적 접두부를 미리 분리한 렌더러 (LLM 호출 경로용)
+    _SQL_RENDERER = _PromptRenderer(SQL_GENERATION_PROMPT)
+    _EXCEL_RENDERER = _PromptRenderer(EXCEL_ANALYSIS_PROMPT)
+    _CLASSIFICATION_RENDERER = _PromptRenderer(QUESTION_CLASSIFICATION_PROMPT)
+    
+    # 렌더링된 프롬프트 → 파싱된 LLM 응답 (프로세스 내 공유)
+    cache = ResponseCache()
+    
+    # 질문 골격 → 엔티티 자리표시자 SQL 응답
+    structural_cache = StructuralResponseCache()
+    
     @classmethod
     def get_sql_prompt(cls) -> PromptTemplate:
         """SQL 생성 프롬프트 반환"""
@@ -200,35 +487,83 @@ Python 코드:"""
         """시각화 추천 프롬프트 반환"""
         return cls.VISUALIZATION_RECOMMENDATION_PROMPT
     
+    @classmethod
+    def render_sql_prompt(cls, question: str, schema_info: str, examples: str) -> str:
+        """SQL 생성 프롬프트 렌더링 (get_sql_prompt().format()과 동일한 결과)"""
+        return cls._SQL_RENDERER.render(
+            question=question, schema_info=schema_info, examples=examples
+        )
+    
+    @classmethod
+    def render_excel_prompt(cls, question: str, dataframe_info: str, sample_data: str) -> str:
+        """Excel 분석 프롬프트 렌더링 (get_excel_prompt().format()과 동일한 결과)"""
+        return cls._EXCEL_RENDERER.render(
+            question=question, dataframe_info=dataframe_info, sample_data=sample_data
+        )
+    
+    @classmethod
+    def render_classification_prompt(cls, question: str) -> str:
+        """질문 분류 프롬프트 렌더링 (get_classification_prompt().format()과 동일한 결과)"""
+        return cls._CLASSIFICATION_RENDERER.render(question=question)
+    
     @classmethod
     def format_schema_info(cls, schema: Dict[str, Any]) -> str:
-        """스키마 정보를 프롬프트용으로 포맷팅"""
-        formatted_tables = []
+        """스키마 정보를 프롬프트용으로 포맷팅 (같은 스키마는 캐시된 결과 재사용)"""
+        return _format_with_cache(_format_schema_info_cached, cls._format_schema_info, schema)
+    
+    @classmethod
+    def format_examples(cls, examples: List[Dict[str, str]]) -> str:
+        """예시 쿼리를 프롬프트용으로 포맷팅 (같은 예시 조합은 캐시된 결과 재사용)"""
+        return _format_with_cache(_format_examples_cached, cls._format_examples, examples)
+    
+    @classmethod
+    def format_dataframe_info(cls, df_info: Dict[str, Any]) -> str:
+        """데이터프레임 정보를 프롬프트용으로 포맷팅 (같은 정보는 캐시된 결과 재사용)"""
+        return _format_with_cache(_format_dataframe_info_cached, cls._format_dataframe_info, df_info)
+    
+    @classmethod
+    def format_cache_info(cls) -> Dict[str, Dict[str, int]]:
+        """포맷팅 캐시 적중 통계"""
+        return {
+            name: formatter.cache_info()._asdict()
+            for name, formatter in (
+                ("schema_info", _format_schema_info_cached),
+                ("examples", _format_examples_cached),
+                ("dataframe_info", _format_dataframe_info_cached),
+            )
+        }
+    
+    @staticmethod
+    def _format_schema_info(schema: Dict[str, Any]) -> str:
+        """스키마 정보 포맷팅 (줄 단위로 모아 한 번만 결합)"""
+        lines: List[str] = []
         
         for table_name, table_info in schema.items():
-            columns = []
-            for col in table_info.get('columns', []):
-                col_desc = f"{col['name']} ({col['type']})"
-                if col.get('primary_key'):
-                    col_desc += " [PK]"
-                if col.get('foreign_key'):
-                    col_desc += f" [FK -> {col['foreign_key']}]"
-                if not col.get('nullable', True):
-                    col_desc += " [NOT NULL]"
-                columns.append(col_desc)
+            if lines:
+                lines.append("")  # 테이블 사이 빈 줄
+            lines.append(f"테이블 '{table_name}':")
+            
+            columns = table_info.get('columns', [])
+            if not columns:
+                lines.append("  - ")
             
             # 테이블당 최대 15개 컬럼만 표시 (토큰 최적화)
+            for col in columns[:15]:
+                foreign_key = col.get('foreign_key')
+                lines.append(
+                    f"  - {col['name']} ({col['type']})"
+                    f"{' [PK]' if col.get('primary_key') else ''}"
+                    f"{f' [FK -> {foreign_key}]' if foreign_key else ''}"
+                    f"{'' if col.get('nullable', True) else ' [NOT NULL]'}"
+                )
             if len(columns) > 15:
-                columns = columns[:15] + ["... (더 많은 컬럼 있음)"]
-            
-            table_desc = f"테이블 '{table_name}':\n  - " + "\n  - ".join(columns)
-            formatted_tables.append(table_desc)
+                lines.append("  - ... (더 많은 컬럼 있음)")
         
-        return "\n\n".join(formatted_tables)
+        return "\n".join(lines)
     
-    @classmethod
-    def format_examples(cls, examples: List[Dict[str, str]]) -> str:
-        """예시 쿼리를 프롬프트용으로 포맷팅"""
+    @staticmethod
+    def _format_examples(examples: List[Dict[str, str]]) -> str:
+        """예시 쿼리 포맷팅"""
         formatted_examples = []
         
         for i, example in enumerate(examples[:3], 1):  # 최대 3개 예시
@@ -237,9 +572,9 @@ Python 코드:"""
         
         return "\n\n".join(formatted_examples)
     
-    @classmethod
-    def format_dataframe_info(cls, df_info: Dict[str, Any]) -> str:
-        """데이터프레임 정보를 프롬프트용으로 포맷팅"""
+    @staticmethod
+    def _format_dataframe_info(df_info: Dict[str, Any]) -> str:
+        """데이터프레임 정보 포맷팅"""
         info_parts = []
         
         # 기본 정보
@@ -261,6 +596,39 @@ Python 코드:"""
         return "\n".join(info_parts)
 
 
+def _format_with_cache(
+    cached_formatter: Callable[[bytes], str],
+    formatter: Callable[[Any], str],
+    value: Any
+) -> str:
+    """
+    입력을 orjson 바이트로 직렬화해 캐시 키로 사용
+    
+    dict는 해시할 수 없으므로 삽입 순서를 유지하는 JSON 바이트를 키로 쓰며,
+    JSON으로 표현할 수 없는 값(numpy 타입 등)이 있으면 캐시 없이 포맷팅합니다.
+    """
+    try:
+        key = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return formatter(value)
+    return cached_formatter(key)
+
+
+@lru_cache(maxsize=256)
+def _format_schema_info_cached(schema_json: bytes) -> str:
+    return DataGeniePromptTemplates._format_schema_info(orjson.loads(schema_json))
+
+
+@lru_cache(maxsize=256)
+def _format_examples_cached(examples_json: bytes) -> str:
+    return DataGeniePromptTemplates._format_examples(orjson.loads(examples_json))
+
+
+@lru_cache(maxsize=256)
+def _format_dataframe_info_cached(df_info_json: bytes) -> str:
+    return DataGeniePromptTemplates._format_dataframe_info(orjson.loads(df_info_json))
+
+
 class PromptInjectionDetector:
     """
     프롬프트 인젝션 탐지기
@@ -287,13 +655,26 @@ class PromptInjectionDetector:
         r'forget\s+everything\s+above',
     ]
     
+    # 패턴별 필수 리터럴 (소문자 기준) - 하나도 없으면 정규식 생략
+    INJECTION_ANCHORS = (
+        "지시", "잊어", "시스템", "어시스턴트", "사용자", "중요", "응답",
+        "```", "<|", "critical", "response", "ignore", "forget",
+    )
+    
+    # IGNORECASE가 ASCII 문자와 같게 취급하지만 lower()로는 바뀌지 않는 문자
+    _CASE_FOLD_TABLE = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "\u212a": "k"})
+    
     def __init__(self):
         """프롬프트 인젝션 탐지기 초기화"""
-        import re
-        self._compiled_patterns = [
-            re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-            for pattern in self.INJECTION_PATTERNS
-        ]
+        self._combined_pattern = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.INJECTION_PATTERNS),
+            re.IGNORECASE | re.MULTILINE
+        )
+    
+    def _has_anchor(self, user_input: str) -> bool:
+        """인젝션 패턴의 필수 리터럴 포함 여부 (C 수준 부분 문자열 검색)"""
+        lowered = user_input.translate(self._CASE_FOLD_TABLE).lower()
+        return any(anchor in lowered for anchor in self.INJECTION_ANCHORS)
     
     def detect_injection(self, user_input: str) -> bool:
         """
@@ -308,16 +689,18 @@ class PromptInjectionDetector:
         if not user_input or not isinstance(user_input, str):
             return False
         
-        for pattern in self._compiled_patterns:
-            if pattern.search(user_input):
-                logger.warning(
-                    "프롬프트 인젝션 시도 감지",
-                    extra={
-                        "input_hash": hash(user_input) % 10000,  # 간단한 해시
-                        "pattern_matched": True
-                    }
-                )
-                return True
+        if not self._has_anchor(user_input):
+            return False
+        
+        if self._combined_pattern.search(user_input):
+            logger.warning(
+                "프롬프트 인젝션 시도 감지",
+                extra={
+                    "input_hash": hash(user_input) % 10000,  # 간단한 해시
+                    "pattern_matched": True
+                }
+            )
+            return True
         
         return False
     
@@ -338,7 +721,6 @@ class PromptInjectionDetector:
         sanitized = user_input.strip()
         
         # 연속된 공백 정리
-        import re
-        sanitized = re.sub(r'\s+', ' ', sanitized)
+        sanitized = ' '.join(sanitized.split())
         
         return sanitized
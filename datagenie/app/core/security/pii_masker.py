@@ -7,13 +7,65 @@ Clean Architecture: Application Core
 
 import re
 import hashlib
-from typing import Any, Dict, List, Optional, Union, Pattern
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Union, Pattern
 from dataclasses import dataclass
 from enum import Enum
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# 모든 PII 패턴은 숫자나 '@'를 반드시 포함하므로, 둘 다 없는 문자열은 패턴 검사 생략
+# (PII_PATTERNS에 이 조건을 만족하지 않는 패턴을 추가하면 함께 수정해야 함)
+_PII_CANDIDATE_RE = re.compile(r"[0-9@]")
+
+_CONTAINER_TYPES = (dict, list, tuple)
+
+# 계좌번호는 정규식 대신 숫자 연속 구간을 추출한 뒤 길이와 경계를 직접 검사
+# (긴 숫자열에서 \b\d{10,16}\b를 위치마다 다시 평가하지 않음)
+_DIGIT_RUN_RE = re.compile(r"\d+")
+_BANK_ACCOUNT_LENGTHS = range(10, 17)
+
+
+def _is_word_char(char: str) -> bool:
+    """정규식 단어 문자(\\w)와 같은 기준인지 확인"""
+    return char.isalnum() or char == "_"
+
+
+def _find_bank_accounts(text: str) -> List[re.Match]:
+    """앞뒤가 단어 경계인 10~16자리 숫자 구간 (계좌번호 패턴과 동일한 결과)"""
+    accounts = []
+    last = len(text)
+    for run in _DIGIT_RUN_RE.finditer(text):
+        start, end = run.span()
+        if (end - start) not in _BANK_ACCOUNT_LENGTHS:
+            continue
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < last and _is_word_char(text[end]):
+            continue
+        accounts.append(run)
+    return accounts
+
+
+def _is_dataframe(data: Any) -> bool:
+    """pandas를 import하지 않고 DataFrame 여부 확인"""
+    return type(data).__module__.startswith("pandas") and hasattr(data, "select_dtypes")
+
+
+def _iter_children(container: Union[dict, list, tuple]):
+    """컨테이너의 자식 값 반복자 (딕셔너리는 값만)"""
+    return iter(container.values() if isinstance(container, dict) else container)
+
+
+def _rebuild_container(container: Union[dict, list, tuple], children: List[Any]) -> Any:
+    """마스킹된 자식 값으로 같은 종류의 컨테이너 재구성"""
+    if isinstance(container, dict):
+        return dict(zip(container.keys(), children))
+    if isinstance(container, list):
+        return children
+    return tuple(children)
+
 
 class PIIType(Enum):
     """개인정보 유형"""
@@ -28,7 +80,7 @@ class PIIType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PIIDetectionResult:
     """개인정보 탐지 결과"""
     pii_type: PIIType
@@ -38,7 +90,7 @@ class PIIDetectionResult:
     position: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaskingResult:
     """마스킹 결과"""
     original_data: Any
@@ -105,17 +157,12 @@ class PIIMasker:
             min_confidence: 최소 신뢰도 임계값
         """
         self.min_confidence = min_confidence
-        self._compiled_patterns = self._compile_patterns()
-    
-    def _compile_patterns(self) -> Dict[PIIType, Pattern]:
-        """정규식 패턴 컴파일"""
-        compiled = {}
-        for pii_type, config in self.PII_PATTERNS.items():
-            try:
-                compiled[pii_type] = re.compile(config['pattern'], re.IGNORECASE)
-            except re.error as e:
-                logger.error(f"PII 패턴 컴파일 실패: {pii_type}", error=str(e))
-        return compiled
+        # 정규식은 모듈 수준에서 한 번만 컴파일 (결합 정규식은 임계값별로 캐싱)
+        self._compiled_patterns = _COMPILED_PII
+        self._combined_pattern = _combined_pii_pattern(min_confidence)
+        self._scan_bank_accounts = (
+            self.PII_PATTERNS[PIIType.BANK_ACCOUNT]['confidence'] >= min_confidence
+        )
     
     def mask_data(self, data: Any, context: Optional[Dict[str, Any]] = None) -> MaskingResult:
         """
@@ -128,6 +175,9 @@ class PIIMasker:
         Returns:
             MaskingResult: 마스킹 결과
         """
+        if _is_dataframe(data):
+            return self.mask_dataframe(data, context)
+        
         detected_pii = []
         masked_data = self._mask_recursive(data, detected_pii)
         
@@ -141,57 +191,176 @@ class PIIMasker:
             masking_applied=len(detected_pii) > 0
         )
     
+    def mask_dataframe(self, df: Any, context: Optional[Dict[str, Any]] = None) -> MaskingResult:
+        """
+        pandas DataFrame의 문자열 컬럼 일괄 마스킹
+        
+        숫자/날짜 컬럼은 건너뛰고, 문자열 컬럼은 후보 문자(숫자, '@')가 있는 셀만 골라
+        Series.str.replace로 결합 정규식을 적용합니다. 변경이 있을 때만 복사본을 만듭니다.
+        
+        Args:
+            df: 마스킹할 DataFrame
+            context: 추가 컨텍스트 정보
+            
+        Returns:
+            MaskingResult: 마스킹 결과 (masked_data는 DataFrame)
+        """
+        detected_pii: List[PIIDetectionResult] = []
+        masked_df = df
+        
+        if self._combined_pattern is not None or self._scan_bank_accounts:
+            replace = self._make_replacer(detected_pii)
+            for column in df.select_dtypes(include=["object", "string"]).columns:
+                series = df[column]
+                # 문자열이 아닌 셀(None, 숫자 등)은 na=False로 제외
+                candidates = series.str.contains(_PII_CANDIDATE_RE, na=False)
+                if not candidates.any():
+                    continue
+                
+                found_before = len(detected_pii)
+                if self._scan_bank_accounts:
+                    masked = series[candidates].map(lambda text: self._mask_string(text, detected_pii))
+                else:
+                    masked = series[candidates].str.replace(self._combined_pattern, replace, regex=True)
+                if len(detected_pii) == found_before:
+                    continue
+                
+                if masked_df is df:
+                    masked_df = df.copy()
+                masked_df.loc[candidates, column] = masked
+        
+        self._log_masking_event(detected_pii, context)
+        
+        return MaskingResult(
+            original_data=df,
+            masked_data=masked_df,
+            detected_pii=detected_pii,
+            masking_applied=len(detected_pii) > 0
+        )
+    
     def _mask_recursive(self, data: Any, detected_pii: List[PIIDetectionResult]) -> Any:
-        """재귀적으로 데이터 구조를 탐색하며 마스킹"""
+        """
+        명시적 스택으로 데이터 구조를 탐색하며 마스킹
+        
+        PII가 없는 하위 구조는 새로 만들지 않고 원본 객체를 그대로 사용합니다.
+        원본은 MaskingResult.original_data로 보존되므로 제자리 수정은 하지 않습니다.
+        """
         if isinstance(data, str):
             return self._mask_string(data, detected_pii)
-        elif isinstance(data, dict):
-            return {key: self._mask_recursive(value, detected_pii) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self._mask_recursive(item, detected_pii) for item in data]
-        elif isinstance(data, tuple):
-            return tuple(self._mask_recursive(item, detected_pii) for item in data)
-        else:
+        if not isinstance(data, _CONTAINER_TYPES):
             return data
+        
+        # 프레임: [컨테이너, 자식 반복자, 마스킹된 자식 목록, 변경 여부]
+        stack = [[data, _iter_children(data), [], False]]
+        while True:
+            frame = stack[-1]
+            for child in frame[1]:
+                if isinstance(child, str):
+                    masked = self._mask_string(child, detected_pii)
+                elif isinstance(child, _CONTAINER_TYPES):
+                    stack.append([child, _iter_children(child), [], False])
+                    break
+                else:
+                    masked = child
+                frame[2].append(masked)
+                if masked is not child:
+                    frame[3] = True
+            else:
+                stack.pop()
+                container, _, children, changed = frame
+                result = _rebuild_container(container, children) if changed else container
+                if not stack:
+                    return result
+                parent = stack[-1]
+                parent[2].append(result)
+                if changed:
+                    parent[3] = True
     
     def _mask_string(self, text: str, detected_pii: List[PIIDetectionResult]) -> str:
-        """문자열에서 PII 탐지 및 마스킹"""
+        """문자열에서 PII 탐지 및 마스킹 (결합 정규식으로 한 번만 스캔)"""
         if not text or not isinstance(text, str):
             return text
         
-        masked_text = text
+        # 대부분의 텍스트 값(이름, 코드 등)은 후보 문자 검사에서 바로 끝남
+        if not _PII_CANDIDATE_RE.search(text):
+            return text
         
-        for pii_type, pattern in self._compiled_patterns.items():
-            config = self.PII_PATTERNS[pii_type]
-            
-            # 신뢰도 확인
-            if config['confidence'] < self.min_confidence:
+        accounts = _find_bank_accounts(text) if self._scan_bank_accounts else None
+        if accounts:
+            return self._mask_with_bank_accounts(text, accounts, detected_pii)
+        if self._combined_pattern is None:
+            return text
+        
+        return self._combined_pattern.sub(self._make_replacer(detected_pii), text)
+    
+    def _mask_with_bank_accounts(
+        self,
+        text: str,
+        accounts: List[re.Match],
+        detected_pii: List[PIIDetectionResult]
+    ) -> str:
+        """
+        결합 정규식 일치와 계좌번호 후보를 위치 순서대로 병합해 마스킹
+        
+        계좌번호는 PII_PATTERNS의 마지막 유형이므로, 같은 위치에서는 결합 정규식 일치가 우선합니다.
+        """
+        pattern = self._combined_pattern
+        replace = self._make_replacer(detected_pii)
+        pieces: List[str] = []
+        pos = 0
+        match = pattern.search(text) if pattern is not None else None
+        
+        for account in accounts:
+            start = account.start()
+            while match is not None and match.start() <= start:
+                pieces.append(text[pos:match.start()])
+                pieces.append(replace(match))
+                pos = match.end()
+                match = pattern.search(text, pos)
+            if start < pos:
                 continue
             
-            matches = list(pattern.finditer(masked_text))
-            
-            # 뒤에서부터 처리하여 인덱스 변화 방지
-            for match in reversed(matches):
-                original_value = match.group()
-                masked_value = self._generate_mask(original_value, pii_type)
-                
-                # 탐지 결과 기록
-                detected_pii.append(PIIDetectionResult(
-                    pii_type=pii_type,
-                    original_value=original_value,
-                    masked_value=masked_value,
-                    confidence=config['confidence'],
-                    position=match.start()
-                ))
-                
-                # 마스킹 적용
-                masked_text = (
-                    masked_text[:match.start()] + 
-                    masked_value + 
-                    masked_text[match.end():]
-                )
+            pieces.append(text[pos:start])
+            pieces.append(self._record_pii(PIIType.BANK_ACCOUNT, account.group(), start, detected_pii))
+            pos = account.end()
+            if match is not None and match.start() < pos:
+                match = pattern.search(text, pos)
         
-        return masked_text
+        while match is not None:
+            pieces.append(text[pos:match.start()])
+            pieces.append(replace(match))
+            pos = match.end()
+            match = pattern.search(text, pos)
+        
+        pieces.append(text[pos:])
+        return "".join(pieces)
+    
+    def _make_replacer(self, detected_pii: List[PIIDetectionResult]) -> Callable[[re.Match], str]:
+        """결합 정규식 일치를 마스킹하고 탐지 결과를 기록하는 치환 함수"""
+        def replace(match: re.Match) -> str:
+            return self._record_pii(PIIType(match.lastgroup), match.group(), match.start(), detected_pii)
+        
+        return replace
+    
+    def _record_pii(
+        self,
+        pii_type: PIIType,
+        original_value: str,
+        position: int,
+        detected_pii: List[PIIDetectionResult]
+    ) -> str:
+        """탐지된 값을 마스킹하고 탐지 결과 기록"""
+        masked_value = self._generate_mask(original_value, pii_type)
+        
+        # 탐지 결과 기록
+        detected_pii.append(PIIDetectionResult(
+            pii_type=pii_type,
+            original_value=original_value,
+            masked_value=masked_value,
+            confidence=self.PII_PATTERNS[pii_type]['confidence'],
+            position=position
+        ))
+        return masked_value
     
     def _generate_mask(self, value: str, pii_type: PIIType) -> str:
         """PII 유형에 따른 마스킹 생성"""
@@ -307,11 +476,19 @@ class PIIMasker:
     def detect_pii_types(self, text: str) -> List[PIIType]:
         """텍스트에서 PII 유형 탐지 (마스킹 없이)"""
         detected_types = []
+        if not _PII_CANDIDATE_RE.search(text):
+            return detected_types
         
         for pii_type, pattern in self._compiled_patterns.items():
             config = self.PII_PATTERNS[pii_type]
             
-            if config['confidence'] >= self.min_confidence and pattern.search(text):
+            if config['confidence'] < self.min_confidence:
+                continue
+            if pii_type is PIIType.BANK_ACCOUNT:
+                found = bool(_find_bank_accounts(text))
+            else:
+                found = pattern.search(text) is not None
+            if found:
                 detected_types.append(pii_type)
         
         return detected_types
@@ -326,6 +503,31 @@ class PIIMasker:
         return False
 
 
+# PII 패턴 사전 컴파일 (마스커 인스턴스마다 재컴파일하지 않음)
+_COMPILED_PII: Dict[PIIType, Pattern] = {
+    pii_type: re.compile(config['pattern'], re.IGNORECASE)
+    for pii_type, config in PIIMasker.PII_PATTERNS.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _combined_pii_pattern(min_confidence: float) -> Optional[Pattern]:
+    """
+    신뢰도 기준을 넘는 패턴을 이름 있는 그룹의 단일 정규식으로 결합
+    
+    그룹 이름은 PIIType 값이며, 같은 위치에서는 PII_PATTERNS 정의 순서가 우선합니다.
+    계좌번호는 _find_bank_accounts로 따로 찾으므로 제외합니다.
+    """
+    alternatives = [
+        f"(?P<{pii_type.value}>{config['pattern']})"
+        for pii_type, config in PIIMasker.PII_PATTERNS.items()
+        if config['confidence'] >= min_confidence and pii_type is not PIIType.BANK_ACCOUNT
+    ]
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
 class PIIMaskingError(Exception):
     """PII 마스킹 관련 예외"""
     pass
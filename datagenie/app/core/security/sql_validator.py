@@ -7,13 +7,34 @@ SQL 인젝션 방지 및 안전한 쿼리 검증을 담당하는 핵심 보안 
 
 import re
 import hashlib
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# 사전 필터용 단어 토큰 (정규식 \b 경계와 동일한 기준)
+_WORD_RE = re.compile(r"\w+")
+_WORD_BYTES_RE = re.compile(rb"\w+")
+
+# ASCII 전용 대문자 변환 테이블 (유니코드 케이스 폴딩 분기 없음)
+_ASCII_UPPER_TABLE = bytes.maketrans(
+    b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+
+# 주석 제거용 정규식 (블록 주석을 먼저 지운 뒤 한 줄 주석 제거)
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_LINE_COMMENT_RE = re.compile(r"--.*$", re.MULTILINE)
+
+# 사전 필터 앵커: 단어 토큰 중 하나(frozenset) 또는 부분 문자열(bytes), 항목 모두 필요
+_PatternAnchors = Tuple[Union[FrozenSet[bytes], bytes], ...]
+
+# 대문자 SQL과 단어 토큰 집합 (ASCII SQL은 bytes, 그 외는 str)
+_SQLFingerprint = Tuple[Union[str, bytes], FrozenSet[Union[str, bytes]]]
+
 
 class SecurityThreatLevel(Enum):
     """보안 위협 수준"""
@@ -23,7 +44,7 @@ class SecurityThreatLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SQLValidationResult:
     """SQL 검증 결과"""
     is_safe: bool
@@ -86,15 +107,103 @@ class SQLSecurityValidator:
         r'\bSELECT\s+.*\s+FROM\s+sys\.',  # 시스템 테이블 접근
     ]
     
+    # 패턴별 필요 조건 (대문자 ASCII SQL 기준, 패턴 순서와 일치)
+    _DANGEROUS_PATTERN_ANCHORS: Tuple[_PatternAnchors, ...] = (
+        (frozenset({b"INSERT", b"UPDATE", b"DELETE", b"DROP", b"CREATE", b"ALTER", b"TRUNCATE", b"REPLACE"}),),
+        (frozenset({b"EXEC", b"EXECUTE", b"CALL"}),),
+        (b";",),
+        (b"--",),
+        (b"/*", b"*/"),
+        (frozenset({b"UNION"}), frozenset({b"SELECT"})),
+        (frozenset({b"OR"}), frozenset({b"1"})),
+        (frozenset({b"AND"}), frozenset({b"1"})),
+        (b"'", b"OR", b"="),
+        (frozenset({b"SLEEP"}),),
+        (frozenset({b"BENCHMARK"}),),
+        (frozenset({b"LOAD_FILE"}),),
+        (frozenset({b"OUTFILE"}), frozenset({b"INTO"})),
+        (frozenset({b"DUMPFILE"}), frozenset({b"INTO"})),
+    )
+    
+    _SUSPICIOUS_PATTERN_ANCHORS: Tuple[_PatternAnchors, ...] = (
+        (b"--", frozenset({b"SELECT"}), frozenset({b"FROM"})),
+        (b"INFORMATION_SCHEMA", frozenset({b"SELECT"}), frozenset({b"COUNT"})),
+        (b"MYSQL.", frozenset({b"SELECT"}), frozenset({b"FROM"})),
+        (b"PG_", frozenset({b"SELECT"}), frozenset({b"FROM"})),
+        (b"SYS.", frozenset({b"SELECT"}), frozenset({b"FROM"})),
+    )
+    
+    # 검증 결과 LRU 캐시 크기 (대시보드/정기 리포트의 반복 쿼리)
+    RESULT_CACHE_SIZE = 1024
+    
     def __init__(self):
         """SQL 보안 검증기 초기화"""
-        self._compiled_dangerous_patterns = [
-            re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-            for pattern in self.DANGEROUS_SQL_PATTERNS
-        ]
-        self._compiled_suspicious_patterns = [
-            re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-            for pattern in self.SUSPICIOUS_PATTERNS
+        # 정규식은 모듈 import 시 한 번만 컴파일되며 인스턴스는 참조만 공유
+        self._compiled_dangerous_patterns = _COMPILED_DANGEROUS
+        self._compiled_suspicious_patterns = _COMPILED_SUSPICIOUS
+        self._dangerous_re = _DANGEROUS_RE
+        self._suspicious_re = _SUSPICIOUS_RE
+        self._forbidden_re = _FORBIDDEN_RE
+        self._forbidden_bytes_re = _FORBIDDEN_BYTES_RE
+        self._forbidden_keyword_set = _FORBIDDEN_KEYWORD_SET
+        self._forbidden_keyword_bytes = _FORBIDDEN_KEYWORD_BYTES
+        self._forbidden_index = _FORBIDDEN_INDEX
+        
+        # SQL SHA-256 다이제스트 → 검증 결과 (검증은 SQL 문자열에만 의존)
+        self._result_cache: "OrderedDict[bytes, SQLValidationResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _compile_combined(patterns: List[str]) -> "re.Pattern[str]":
+        """
+        패턴 목록을 명명 그룹 alternation으로 결합
+        
+        각 패턴을 lookahead로 감싸 매칭 구간을 소비하지 않으므로
+        서로 겹치는 패턴도 개별 검사와 동일하게 탐지됩니다.
+        """
+        return re.compile(
+            "|".join(f"(?=(?P<p{i}>{pattern}))" for i, pattern in enumerate(patterns)),
+            re.IGNORECASE | re.MULTILINE
+        )
+    
+    @staticmethod
+    def _fingerprint(sql: str) -> _SQLFingerprint:
+        """
+        사전 필터용 대문자 SQL과 단어 토큰 집합
+        
+        대부분의 SQL은 ASCII이므로 bytes.translate로 대문자 변환 후
+        bytes 정규식으로 토큰화합니다 (ASCII 범위의 \\w는 유니코드 \\w와 동일).
+        """
+        if sql.isascii():
+            sql_upper = sql.encode("ascii").translate(_ASCII_UPPER_TABLE)
+            return sql_upper, frozenset(_WORD_BYTES_RE.findall(sql_upper))
+        
+        sql_upper = sql.upper()
+        return sql_upper, frozenset(_WORD_RE.findall(sql_upper))
+    
+    @staticmethod
+    def _candidate_patterns(
+        anchors: Tuple[_PatternAnchors, ...],
+        sql: str,
+        fingerprint: _SQLFingerprint
+    ) -> Optional[List[int]]:
+        """
+        필요 조건을 만족해 매칭될 가능성이 있는 패턴 인덱스
+        
+        IGNORECASE 매칭은 upper()와 다른 유니코드 대응(예: 켈빈 기호)이 있으므로
+        ASCII가 아닌 SQL은 None을 반환해 전체 검사로 넘깁니다.
+        """
+        sql_upper, tokens = fingerprint
+        if not isinstance(sql_upper, bytes):
+            return None
+
+        return [
+            index
+            for index, pattern_anchors in enumerate(anchors)
+            if all(
+                anchor in sql_upper if isinstance(anchor, bytes) else not tokens.isdisjoint(anchor)
+                for anchor in pattern_anchors
+            )
         ]
     
     def validate_sql(self, sql: str, context: Optional[Dict[str, Any]] = None) -> SQLValidationResult:
@@ -115,32 +224,65 @@ class SQLSecurityValidator:
                 violations=["빈 SQL 쿼리는 허용되지 않습니다"]
             )
         
+        sql_digest = hashlib.sha256(sql.encode()).digest()
+        result = self._get_cached_result(sql_digest)
+        if result is None:
+            result = self._evaluate_sql(sql)
+            self._store_result(sql_digest, result)
+        
+        # 보안 이벤트 로깅 (캐시 적중 시에도 호출 컨텍스트별로 기록)
+        self._log_security_event(sql, result.violations, result.warnings, context, sql_digest)
+        
+        return result
+    
+    def _get_cached_result(self, sql_digest: bytes) -> Optional[SQLValidationResult]:
+        """캐시된 검증 결과 조회 (LRU 순서 갱신)"""
+        with self._result_cache_lock:
+            result = self._result_cache.get(sql_digest)
+            if result is not None:
+                self._result_cache.move_to_end(sql_digest)
+            return result
+    
+    def _store_result(self, sql_digest: bytes, result: SQLValidationResult) -> None:
+        """검증 결과 캐싱 (용량 초과 시 가장 오래된 항목 제거)"""
+        with self._result_cache_lock:
+            self._result_cache[sql_digest] = result
+            self._result_cache.move_to_end(sql_digest)
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def _evaluate_sql(self, sql: str) -> SQLValidationResult:
+        """SQL 보안 검증 단계 실행"""
         violations = []
         warnings = []
         threat_level = SecurityThreatLevel.LOW
+        # 대문자 변환과 주석 제거는 한 번만 수행하고 하위 검사에서 공유
+        fingerprint = self._fingerprint(sql)
+        sql_upper = fingerprint[0]
+        sql_nocmt = self._strip_comments(sql)
         
         # 1. 금지된 키워드 검사
-        keyword_violations = self._check_forbidden_keywords(sql)
+        keyword_violations = self._check_forbidden_keywords(sql, fingerprint)
         if keyword_violations:
             violations.extend(keyword_violations)
             threat_level = SecurityThreatLevel.CRITICAL
         
         # 2. 위험한 패턴 검사
-        pattern_violations = self._check_dangerous_patterns(sql)
+        pattern_violations = self._check_dangerous_patterns(sql, fingerprint)
         if pattern_violations:
             violations.extend(pattern_violations)
             if threat_level != SecurityThreatLevel.CRITICAL:
                 threat_level = SecurityThreatLevel.HIGH
         
         # 3. 의심스러운 패턴 검사 (경고)
-        suspicious_warnings = self._check_suspicious_patterns(sql)
+        suspicious_warnings = self._check_suspicious_patterns(sql, fingerprint)
         if suspicious_warnings:
             warnings.extend(suspicious_warnings)
             if threat_level == SecurityThreatLevel.LOW:
                 threat_level = SecurityThreatLevel.MEDIUM
         
         # 4. SELECT 문인지 확인
-        if not self._is_select_query(sql):
+        if not self._is_select_query(sql, sql_nocmt):
             violations.append("SELECT 쿼리만 허용됩니다")
             threat_level = SecurityThreatLevel.CRITICAL
         
@@ -150,10 +292,7 @@ class SQLSecurityValidator:
             threat_level = SecurityThreatLevel.HIGH
         
         # 6. LIMIT 절 확인 및 추가
-        sanitized_sql = self._ensure_limit_clause(sql) if not violations else None
-        
-        # 보안 이벤트 로깅
-        self._log_security_event(sql, violations, warnings, context)
+        sanitized_sql = self._ensure_limit_clause(sql, sql_upper) if not violations else None
         
         return SQLValidationResult(
             is_safe=len(violations) == 0,
@@ -163,59 +302,148 @@ class SQLSecurityValidator:
             warnings=warnings
         )
     
-    def _check_forbidden_keywords(self, sql: str) -> List[str]:
+    def _check_forbidden_keywords(
+        self,
+        sql: str,
+        fingerprint: Optional[_SQLFingerprint] = None
+    ) -> List[str]:
         """금지된 키워드 검사"""
-        violations = []
-        sql_upper = sql.upper()
+        sql_upper, tokens = fingerprint or self._fingerprint(sql)
+        if isinstance(sql_upper, bytes):
+            if tokens.isdisjoint(self._forbidden_keyword_bytes):
+                return []
+            found = {
+                match.group().decode("ascii")
+                for match in self._forbidden_bytes_re.finditer(sql_upper)
+            }
+        else:
+            if tokens.isdisjoint(self._forbidden_keyword_set):
+                return []
+            found = {match.group() for match in self._forbidden_re.finditer(sql_upper)}
         
-        for keyword in self.FORBIDDEN_SQL_KEYWORDS:
-            # 단어 경계를 고려한 정확한 매칭
-            pattern = rf'\b{re.escape(keyword)}\b'
-            if re.search(pattern, sql_upper):
-                violations.append(f"금지된 SQL 키워드 감지: {keyword}")
+        return [
+            f"금지된 SQL 키워드 감지: {keyword}"
+            for keyword in sorted(found, key=self._forbidden_index.__getitem__)
+        ]
+    
+    def _check_dangerous_patterns(
+        self,
+        sql: str,
+        fingerprint: Optional[_SQLFingerprint] = None,
+        *,
+        all_matches: bool = False
+    ) -> List[str]:
+        """
+        위험한 패턴 검사
         
-        return violations
+        패턴이 하나라도 일치하면 쿼리는 거부되므로 기본적으로 첫 일치에서 멈춥니다.
+        감사용으로 일치하는 모든 패턴이 필요하면 all_matches=True를 사용합니다.
+        """
+        indices = self._match_patterns(
+            self._DANGEROUS_PATTERN_ANCHORS,
+            self._dangerous_re,
+            self._compiled_dangerous_patterns,
+            sql,
+            fingerprint or self._fingerprint(sql),
+            first_only=not all_matches
+        )
+        return [
+            f"위험한 SQL 패턴 감지: {self.DANGEROUS_SQL_PATTERNS[i]}"
+            for i in indices
+        ]
     
-    def _check_dangerous_patterns(self, sql: str) -> List[str]:
-        """위험한 패턴 검사"""
-        violations = []
+    def _check_suspicious_patterns(
+        self,
+        sql: str,
+        fingerprint: Optional[_SQLFingerprint] = None
+    ) -> List[str]:
+        """의심스러운 패턴 검사"""
+        indices = self._match_patterns(
+            self._SUSPICIOUS_PATTERN_ANCHORS,
+            self._suspicious_re,
+            self._compiled_suspicious_patterns,
+            sql,
+            fingerprint or self._fingerprint(sql)
+        )
+        return [
+            f"의심스러운 SQL 패턴: {self.SUSPICIOUS_PATTERNS[i]}"
+            for i in indices
+        ]
+    
+    def _match_patterns(
+        self,
+        anchors: Tuple[_PatternAnchors, ...],
+        combined: "re.Pattern[str]",
+        compiled: Tuple["re.Pattern[str]", ...],
+        sql: str,
+        fingerprint: _SQLFingerprint,
+        first_only: bool = False
+    ) -> List[int]:
+        """사전 필터를 통과한 후보만 정규식으로 확인 (필터 불가 시 결합 정규식 스캔)"""
+        candidates = self._candidate_patterns(anchors, sql, fingerprint)
+        if candidates is None:
+            if first_only:
+                match = combined.search(sql)
+                return [int(match.lastgroup[1:])] if match else []
+            return self._scan_patterns(combined, compiled, sql)
         
-        for i, pattern in enumerate(self._compiled_dangerous_patterns):
-            if pattern.search(sql):
-                violations.append(f"위험한 SQL 패턴 감지: {self.DANGEROUS_SQL_PATTERNS[i]}")
+        if first_only:
+            for index in candidates:
+                if compiled[index].search(sql):
+                    return [index]
+            return []
         
-        return violations
+        return [index for index in candidates if compiled[index].search(sql)]
     
-    def _check_suspicious_patterns(self, sql: str) -> List[str]:
-        """의심스러운 패턴 검사"""
-        warnings = []
+    @staticmethod
+    def _scan_patterns(
+        combined: "re.Pattern[str]",
+        compiled: Tuple["re.Pattern[str]", ...],
+        sql: str
+    ) -> List[int]:
+        """
+        결합 정규식 finditer 1회로 매칭된 패턴 인덱스 수집
+        
+        alternation은 같은 위치에서 첫 번째 대안만 기록하므로,
+        매칭 위치에서만 뒤쪽 패턴을 개별 확인합니다.
+        """
+        fired = set()
         
-        for i, pattern in enumerate(self._compiled_suspicious_patterns):
-            if pattern.search(sql):
-                warnings.append(f"의심스러운 SQL 패턴: {self.SUSPICIOUS_PATTERNS[i]}")
+        for match in combined.finditer(sql):
+            index = int(match.lastgroup[1:])
+            fired.add(index)
+            position = match.start()
+            for other in range(index + 1, len(compiled)):
+                if other not in fired and compiled[other].match(sql, position):
+                    fired.add(other)
         
-        return warnings
+        return sorted(fired)
+    
+    @staticmethod
+    def _strip_comments(sql: str) -> str:
+        """다중 라인 주석과 단일 라인 주석 제거"""
+        return _LINE_COMMENT_RE.sub('', _BLOCK_COMMENT_RE.sub('', sql))
     
-    def _is_select_query(self, sql: str) -> bool:
-        """SELECT 쿼리인지 확인"""
+    def _is_select_query(self, sql: str, sql_nocmt: Optional[str] = None) -> bool:
+        """SELECT 쿼리인지 확인 (sql_nocmt: 주석을 제거한 SQL)"""
         # 공백과 주석을 제거한 후 첫 번째 토큰 확인
-        cleaned_sql = re.sub(r'/\*.*?\*/', '', sql, flags=re.DOTALL)  # 다중 라인 주석 제거
-        cleaned_sql = re.sub(r'--.*$', '', cleaned_sql, flags=re.MULTILINE)  # 단일 라인 주석 제거
-        cleaned_sql = cleaned_sql.strip()
+        if sql_nocmt is None:
+            sql_nocmt = self._strip_comments(sql)
+        words = sql_nocmt.split(None, 1)
         
-        if not cleaned_sql:
+        if not words:
             return False
         
         # 첫 번째 단어가 SELECT인지 확인
-        first_word = cleaned_sql.split()[0].upper()
-        return first_word == "SELECT"
+        return words[0].upper() == "SELECT"
     
-    def _ensure_limit_clause(self, sql: str) -> str:
-        """LIMIT 절 확인 및 추가"""
-        sql_upper = sql.upper()
+    def _ensure_limit_clause(self, sql: str, sql_upper: Union[str, bytes, None] = None) -> str:
+        """LIMIT 절 확인 및 추가 (sql_upper: 대문자로 변환한 SQL)"""
+        if sql_upper is None:
+            sql_upper = sql.upper()
         
         # 이미 LIMIT이 있는지 확인
-        if 'LIMIT' in sql_upper:
+        if (b'LIMIT' if isinstance(sql_upper, bytes) else 'LIMIT') in sql_upper:
             return sql
         
         # LIMIT 절 추가 (최대 1000행)
@@ -227,10 +455,13 @@ class SQLSecurityValidator:
         sql: str, 
         violations: List[str], 
         warnings: List[str],
-        context: Optional[Dict[str, Any]]
+        context: Optional[Dict[str, Any]],
+        sql_digest: Optional[bytes] = None
     ):
         """보안 이벤트 로깅"""
-        sql_hash = hashlib.sha256(sql.encode()).hexdigest()[:16]
+        if sql_digest is None:
+            sql_digest = hashlib.sha256(sql.encode()).digest()
+        sql_hash = sql_digest.hex()[:16]
         
         if violations:
             logger.error(
@@ -264,6 +495,30 @@ class SQLSecurityValidator:
             )
 
 
+# 패턴 사전 컴파일 (검증기 인스턴스마다 재컴파일하지 않음)
+_COMPILED_DANGEROUS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in SQLSecurityValidator.DANGEROUS_SQL_PATTERNS
+)
+_COMPILED_SUSPICIOUS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in SQLSecurityValidator.SUSPICIOUS_PATTERNS
+)
+_DANGEROUS_RE = SQLSecurityValidator._compile_combined(SQLSecurityValidator.DANGEROUS_SQL_PATTERNS)
+_SUSPICIOUS_RE = SQLSecurityValidator._compile_combined(SQLSecurityValidator.SUSPICIOUS_PATTERNS)
+_FORBIDDEN_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, SQLSecurityValidator.FORBIDDEN_SQL_KEYWORDS)) + r")\b"
+)
+_FORBIDDEN_BYTES_RE = re.compile(_FORBIDDEN_RE.pattern.encode("ascii"))
+_FORBIDDEN_KEYWORD_SET = frozenset(SQLSecurityValidator.FORBIDDEN_SQL_KEYWORDS)
+_FORBIDDEN_KEYWORD_BYTES = frozenset(
+    keyword.encode("ascii") for keyword in SQLSecurityValidator.FORBIDDEN_SQL_KEYWORDS
+)
+_FORBIDDEN_INDEX = {
+    keyword: index for index, keyword in enumerate(SQLSecurityValidator.FORBIDDEN_SQL_KEYWORDS)
+}
+
+
 class SecurityError(Exception):
     """보안 관련 예외"""
     
@@ -7,10 +7,11 @@ Clean Architecture: 도메인 엔티티
 - 불변성과 일관성 보장
 """
 
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
 class QueryType(Enum):
@@ -28,13 +29,46 @@ class QueryStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass(frozen=True)
+# 상태 문자열 (문자열 표현마다 Enum value 조회를 반복하지 않음)
+_STATUS_STR = {status: status.value for status in QueryStatus}
+
+# 상태 전환표: 목표 상태 -> 전환 가능한 현재 상태 (호출마다 리스트를 만들지 않음)
+_ALLOWED_TRANSITIONS = {
+    QueryStatus.PROCESSING: frozenset((QueryStatus.PENDING,)),
+    QueryStatus.COMPLETED: frozenset((QueryStatus.PENDING, QueryStatus.PROCESSING)),
+}
+
+# 쿼리 유형 분류 키워드
+_DATABASE_KEYWORDS = (
+    "매출", "고객", "주문", "상품", "데이터베이스", "테이블", "조회",
+    "sales", "customer", "order", "product", "database", "table", "select"
+)
+_EXCEL_KEYWORDS = (
+    "파일", "엑셀", "업로드", "분석", "차트", "그래프",
+    "file", "excel", "upload", "analyze", "chart", "graph"
+)
+
+# 두 키워드 목록을 한 번의 스캔으로 찾는 결합 정규식 (그룹 이름은 QueryType 값)
+# 키워드는 소문자 ASCII와 한글뿐이므로 ASCII 대소문자 무시로 question.lower() 복사본 없이 검색
+_QUERY_TYPE_KEYWORD_RE = re.compile(
+    f"(?P<{QueryType.DATABASE.value}>{'|'.join(map(re.escape, _DATABASE_KEYWORDS))})"
+    f"|(?P<{QueryType.EXCEL.value}>{'|'.join(map(re.escape, _EXCEL_KEYWORDS))})",
+    re.IGNORECASE | re.ASCII
+)
+_DATABASE_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, _DATABASE_KEYWORDS)), re.IGNORECASE | re.ASCII
+)
+
+
+# 불변 객체로 취급: 변경은 with_*/mark_* 메서드가 반환하는 새 인스턴스로만
+# (frozen=True는 생성 시 필드마다 느린 __setattr__ 경로를 거치므로 사용하지 않음)
+@dataclass(slots=True)
 class AnalysisQuery:
     """
     분석 쿼리 도메인 엔티티
     
     Clean Architecture: 이 엔티티는 분석 쿼리의 핵심 비즈니스 규칙을 담당합니다.
-    - 불변 객체 (frozen=True)
+    - 불변 객체로 취급 (상태 변경 메서드는 새 인스턴스 반환)
     - 비즈니스 규칙 검증
     - 상태 변경 메서드
     """
@@ -91,20 +125,24 @@ class AnalysisQuery:
         Returns:
             bool: 쿼리가 유효한지 여부
         """
-        # 비즈니스 규칙 1: 질문이 비어있지 않아야 함
-        if not self.question or not self.question.strip():
+        # 비용이 적은 검사부터 수행하고, 공백 검사는 isspace()로 strip() 복사본 없이 확인
+        
+        # 비즈니스 규칙 1: 데이터베이스 쿼리인 경우 연결 ID 필요
+        if self.query_type == QueryType.DATABASE and not self.connection_id:
             return False
         
-        # 비즈니스 규칙 2: 질문 길이 제한 (1000자)
-        if len(self.question.strip()) > 1000:
+        # 비즈니스 규칙 2: 사용자 ID가 있어야 함
+        user_id = self.user_id
+        if not user_id or user_id.isspace():
             return False
         
-        # 비즈니스 규칙 3: 사용자 ID가 있어야 함
-        if not self.user_id or not self.user_id.strip():
+        # 비즈니스 규칙 3: 질문이 비어있지 않아야 함
+        question = self.question
+        if not question or question.isspace():
             return False
         
-        # 비즈니스 규칙 4: 데이터베이스 쿼리인 경우 연결 ID 필요
-        if self.query_type == QueryType.DATABASE and not self.connection_id:
+        # 비즈니스 규칙 4: 질문 길이 제한 (1000자, 앞뒤 공백 제외)
+        if len(question) > 1000 and len(question.strip()) > 1000:
             return False
         
         return True
@@ -138,25 +176,33 @@ class AnalysisQuery:
         Returns:
             AnalysisQuery: 상태가 변경된 새 인스턴스
         """
-        return AnalysisQuery(
-            id=self.id,
-            question=self.question,
-            user_id=self.user_id,
-            query_type=self.query_type,
+        # None만 "변경 없음"으로 취급 (0ms 실행 시간도 유효한 값)
+        return replace(
+            self,
             status=new_status,
-            created_at=self.created_at,
-            connection_id=self.connection_id,
-            execution_time_ms=execution_time_ms or self.execution_time_ms,
-            error_message=error_message or self.error_message
+            execution_time_ms=self.execution_time_ms if execution_time_ms is None else execution_time_ms,
+            error_message=self.error_message if error_message is None else error_message
         )
     
     def has_error(self) -> bool:
         """에러가 있는지 확인"""
         return self.status == QueryStatus.FAILED and self.error_message is not None
     
+    def __eq__(self, other: object) -> bool:
+        """엔티티 동등성: 식별자(id)가 같으면 같은 쿼리"""
+        if not isinstance(other, AnalysisQuery):
+            return NotImplemented
+        return self.id == other.id
+    
+    def __hash__(self) -> int:
+        """식별자만 해싱 (질문 길이와 무관)"""
+        return hash(self.id)
+    
     def __str__(self) -> str:
         """문자열 표현"""
-        return f"AnalysisQuery(id={self.id}, question='{self.question[:50]}...', user_id={self.user_id}, status={self.status.value})"
+        question = self.question
+        question_preview = question if len(question) <= 50 else question[:50]
+        return f"AnalysisQuery(id={self.id}, question='{question_preview}...', user_id={self.user_id}, status={_STATUS_STR[self.status]})"
     
     def is_processing(self) -> bool:
         """쿼리가 처리 중인지 확인"""
@@ -177,12 +223,12 @@ class AnalysisQuery:
         Returns:
             새로운 AnalysisQuery 인스턴스 (불변 객체)
         """
-        if self.status != QueryStatus.PENDING:
+        if self.status not in _ALLOWED_TRANSITIONS[QueryStatus.PROCESSING]:
             raise InvalidStateTransitionError(
                 f"PENDING 상태에서만 PROCESSING으로 변경 가능. 현재 상태: {self.status}"
             )
         
-        return self._replace(status=QueryStatus.PROCESSING)
+        return replace(self, status=QueryStatus.PROCESSING)
     
     def mark_completed(self, execution_time_ms: int) -> "AnalysisQuery":
         """
@@ -194,7 +240,7 @@ class AnalysisQuery:
         Returns:
             새로운 AnalysisQuery 인스턴스
         """
-        if self.status not in [QueryStatus.PENDING, QueryStatus.PROCESSING]:
+        if self.status not in _ALLOWED_TRANSITIONS[QueryStatus.COMPLETED]:
             raise InvalidStateTransitionError(
                 f"PENDING 또는 PROCESSING 상태에서만 COMPLETED로 변경 가능. 현재 상태: {self.status}"
             )
@@ -202,7 +248,8 @@ class AnalysisQuery:
         if execution_time_ms < 0:
             raise ValueError("실행 시간은 0 이상이어야 합니다")
         
-        return self._replace(
+        return replace(
+            self,
             status=QueryStatus.COMPLETED,
             execution_time_ms=execution_time_ms
         )
@@ -224,7 +271,8 @@ class AnalysisQuery:
         if execution_time_ms < 0:
             raise ValueError("실행 시간은 0 이상이어야 합니다")
         
-        return self._replace(
+        return replace(
+            self,
             status=QueryStatus.FAILED,
             error_message=error_message.strip(),
             execution_time_ms=execution_time_ms
@@ -253,57 +301,21 @@ class AnalysisQuery:
         Returns:
             QueryType: 결정된 쿼리 유형
         """
-        question_lower = question.lower().strip()
-        
-        # 데이터베이스 관련 키워드 확인
-        db_keywords = [
-            "매출", "고객", "주문", "상품", "데이터베이스", "테이블", "조회",
-            "sales", "customer", "order", "product", "database", "table", "select"
-        ]
-        
-        # Excel 관련 키워드 확인
-        excel_keywords = [
-            "파일", "엑셀", "업로드", "분석", "차트", "그래프",
-            "file", "excel", "upload", "analyze", "chart", "graph"
-        ]
-        
         # 연결 ID가 있으면 데이터베이스 쿼리로 우선 분류
         if connection_id:
             return QueryType.DATABASE
         
-        # 키워드 기반 분류
-        if any(keyword in question_lower for keyword in db_keywords):
-            return QueryType.DATABASE
-        elif any(keyword in question_lower for keyword in excel_keywords):
-            return QueryType.EXCEL
-        else:
+        # 키워드 기반 분류 (데이터베이스 키워드가 Excel 키워드보다 우선)
+        match = _QUERY_TYPE_KEYWORD_RE.search(question)
+        if match is None:
             return QueryType.GENERAL
-    
-    def _replace(self, **changes) -> "AnalysisQuery":
-        """
-        불변 객체의 일부 필드를 변경한 새 인스턴스 생성
-        
-        Args:
-            **changes: 변경할 필드들
-            
-        Returns:
-            새로운 AnalysisQuery 인스턴스
-        """
-        # dataclass의 replace 기능 구현
-        current_values = {
-            'id': self.id,
-            'question': self.question,
-            'user_id': self.user_id,
-            'query_type': self.query_type,
-            'status': self.status,
-            'created_at': self.created_at,
-            'connection_id': self.connection_id,
-            'execution_time_ms': self.execution_time_ms,
-            'error_message': self.error_message
-        }
+        if match.lastgroup == QueryType.DATABASE.value:
+            return QueryType.DATABASE
         
-        current_values.update(changes)
-        return AnalysisQuery(**current_values)
+        # Excel 키워드가 먼저 나와도 뒤쪽에 데이터베이스 키워드가 있으면 데이터베이스 쿼리
+        if _DATABASE_KEYWORD_RE.search(question, match.start() + 1):
+            return QueryType.DATABASE
+        return QueryType.EXCEL
 
 
 class InvalidStateTransitionError(Exception):
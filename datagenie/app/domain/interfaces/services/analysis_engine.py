@@ -5,7 +5,7 @@ Clean Architecture: 도메인에서 정의하는 분석 엔진 인터페이스
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, BinaryIO
 from app.domain.value_objects.analysis_result import AnalysisResult
 
 
@@ -21,7 +21,7 @@ class IAnalysisEngine(ABC):
         self,
         question: str,
         connection_id: Optional[str] = None,
-        file_data: Optional[bytes] = None,
+        file_data: Optional[BinaryIO] = None,
         options: Optional[Dict[str, Any]] = None
     ) -> AnalysisResult:
         """
@@ -30,7 +30,7 @@ class IAnalysisEngine(ABC):
         Args:
             question: 사용자 질문
             connection_id: 데이터베이스 연결 ID (선택사항)
-            file_data: 파일 데이터 (선택사항)
+            file_data: 파일 스트림 (선택사항, 읽기 위치는 처음)
             options: 추가 옵션
             
         Returns:
@@ -4,11 +4,13 @@ Analysis Result Value Object
 Clean Architecture: 분석 결과를 나타내는 값 객체
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import Dict, Any, List, Optional
 
 
-@dataclass(frozen=True)
+# 불변 객체로 취급: 생성 후 필드를 변경하지 않음 (frozen=True 생성 비용 회피)
+@dataclass(slots=True)
 class AnalysisResult:
     """
     분석 결과 값 객체
@@ -29,6 +31,8 @@ class AnalysisResult:
     data: Optional[List[Dict[str, Any]]] = None
     columns: Optional[List[str]] = None
     row_count: Optional[int] = None
+    # 열 지향 결과 데이터 (열 이름 -> 값 목록): 행마다 딕셔너리를 만들지 않는 대용량 결과용
+    column_data: Optional[Dict[str, List[Any]]] = None
     
     # 시각화 정보
     chart_type: Optional[str] = None
@@ -43,9 +47,26 @@ class AnalysisResult:
     # 메타데이터
     metadata: Optional[Dict[str, Any]] = None
     
+    def __post_init__(self) -> None:
+        """
+        열 지향 데이터 검증 후 행 수를 생성 시 한 번 계산 (명시적으로 전달된 row_count는 유지)
+        
+        Raises:
+            ValueError: columns에 column_data에 없는 열이 있거나 열 길이가 서로 다른 경우
+        """
+        if self.column_data is not None:
+            self._validate_column_data()
+        if self.row_count is None:
+            if self.data is not None:
+                self.row_count = len(self.data)
+            elif self.column_data is not None:
+                self.row_count = self._columnar_row_count()
+    
     def has_data(self) -> bool:
         """결과에 데이터가 있는지 확인"""
-        return self.data is not None and len(self.data) > 0
+        if self.data is not None:
+            return len(self.data) > 0
+        return self._columnar_row_count() > 0
     
     def has_visualization(self) -> bool:
         """시각화가 생성되었는지 확인"""
@@ -68,24 +89,55 @@ class AnalysisResult:
         if not self.has_data():
             return []
         
-        return self.data[:limit]
+        if self.data is not None:
+            return self.data[:limit]
+        
+        # 열 지향 데이터는 미리보기 행만 딕셔너리로 변환
+        names = self._column_names()
+        sliced = [self.column_data[name][:limit] for name in names]
+        return [dict(zip(names, values)) for values in zip(*sliced)]
+    
+    def get_rows(self) -> List[Dict[str, Any]]:
+        """
+        전체 데이터를 행 목록으로 반환
+        
+        Returns:
+            행 딕셔너리 목록 (열 지향 데이터는 이때 변환)
+        """
+        if self.data is not None:
+            return self.data
+        if not self.column_data:
+            return []
+        
+        names = self._column_names()
+        return [dict(zip(names, values)) for values in zip(*(self.column_data[name] for name in names))]
+    
+    def _validate_column_data(self) -> None:
+        """열 지향 데이터 일관성 검증 (미리보기·행 변환이 열을 잘라내거나 KeyError를 내지 않도록)"""
+        if self.columns is not None:
+            missing = [name for name in self.columns if name not in self.column_data]
+            if missing:
+                raise ValueError(f"column_data에 없는 열이 columns에 있습니다: {missing}")
+        
+        lengths = {len(values) for values in self.column_data.values()}
+        if len(lengths) > 1:
+            raise ValueError("column_data의 모든 열은 길이가 같아야 합니다")
+    
+    def _column_names(self) -> List[str]:
+        """열 지향 데이터의 열 순서 (columns가 있으면 그 순서)"""
+        return self.columns or list(self.column_data)
+    
+    def _columnar_row_count(self) -> int:
+        """열 지향 데이터의 행 수 (열 길이는 __post_init__에서 모두 같음을 검증)"""
+        if not self.column_data:
+            return 0
+        return len(next(iter(self.column_data.values())))
     
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return {
-            "analysis_type": self.analysis_type,
-            "question": self.question,
-            "sql_query": self.sql_query,
-            "generated_code": self.generated_code,
-            "execution_success": self.execution_success,
-            "data": self.data,
-            "columns": self.columns,
-            "row_count": self.row_count,
-            "chart_type": self.chart_type,
-            "chart_config": self.chart_config,
-            "chart_data": self.chart_data,
-            "summary": self.summary,
-            "insights": self.insights,
-            "recommendations": self.recommendations,
-            "metadata": self.metadata
-        }
+        """딕셔너리로 변환 (얕은 변환: 필드 값은 그대로 참조)"""
+        return dict(zip(_RESULT_FIELDS, _get_result_fields(self)))
+
+
+# 필드 이름 순서대로 값을 한 번에 읽는 getter (to_dict에서 사용)
+_RESULT_FIELDS = tuple(result_field.name for result_field in fields(AnalysisResult))
+_get_result_fields = attrgetter(*_RESULT_FIELDS)
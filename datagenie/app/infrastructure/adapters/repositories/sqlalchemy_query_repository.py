@@ -15,7 +15,7 @@ import structlog
 from app.domain.entities.analysis_query import AnalysisQuery, QueryType, QueryStatus
 from app.domain.interfaces.repositories.query_repository import IQueryRepository
 from app.models.query_history import QueryHistory
-from app.config.database import get_async_session
+from app.config.database import get_session_maker
 
 logger = structlog.get_logger(__name__)
 
@@ -35,7 +35,7 @@ class SQLAlchemyQueryRepository(IQueryRepository):
         Args:
             session_factory: 데이터베이스 세션 팩토리 (테스트용)
         """
-        self._session_factory = session_factory or get_async_session
+        self._session_factory = session_factory or get_session_maker()
         logger.info("SQLAlchemy Query Repository 초기화")
     
     async def save(self, query: AnalysisQuery) -> None:
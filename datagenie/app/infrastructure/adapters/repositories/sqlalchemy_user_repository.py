@@ -14,7 +14,7 @@ import structlog
 
 from app.domain.interfaces.repositories.user_repository import IUserRepository
 from app.models.user import User
-from app.config.database import get_async_session
+from app.config.database import get_session_maker
 
 logger = structlog.get_logger(__name__)
 
@@ -34,7 +34,7 @@ class SQLAlchemyUserRepository(IUserRepository):
         Args:
             session_factory: 데이터베이스 세션 팩토리 (테스트용)
         """
-        self._session_factory = session_factory or get_async_session
+        self._session_factory = session_factory or get_session_maker()
         logger.info("SQLAlchemy User Repository 초기화")
     
     async def find_by_id(self, user_id: str) -> Optional[User]:
@@ -14,7 +14,7 @@ import structlog
 from app.domain.interfaces.services.user_permissions import IUserPermissions
 from app.models.user import User
 from app.models.database_connection import DatabaseConnection
-from app.config.database import get_async_session
+from app.config.database import get_session_maker
 
 logger = structlog.get_logger(__name__)
 
@@ -34,7 +34,7 @@ class DatabaseUserPermissions(IUserPermissions):
         Args:
             session_factory: 데이터베이스 세션 팩토리 (테스트용)
         """
-        self._session_factory = session_factory or get_async_session
+        self._session_factory = session_factory or get_session_maker()
         logger.info("Database User Permissions 초기화")
     
     async def can_execute_analysis(self, user_id: str) -> bool:
@@ -6,6 +6,7 @@ LLM을 활용한 실제 분석 엔진 구현
 """
 
 import asyncio
+from dataclasses import asdict
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import structlog
@@ -189,7 +190,6 @@ class LLMAnalysisEngine(IAnalysisEngine):
                 execution_success=True,
                 data=mock_data["data"],
                 columns=mock_data["columns"],
-                row_count=len(mock_data["data"]),
                 summary=sql_result.explanation,
                 insights=self._generate_insights(mock_data["data"], sql_result),
                 recommendations=self._generate_recommendations(sql_result),
@@ -243,7 +243,6 @@ class LLMAnalysisEngine(IAnalysisEngine):
                 execution_success=True,
                 data=mock_result["data"],
                 columns=mock_result["columns"],
-                row_count=len(mock_result["data"]),
                 chart_type=excel_result.visualization_type,
                 chart_config=self._generate_chart_config(excel_result),
                 summary=excel_result.explanation,
@@ -285,7 +284,7 @@ class LLMAnalysisEngine(IAnalysisEngine):
                 "더 구체적인 질문으로 다시 시도해보세요"
             ],
             metadata={
-                "classification": classification.__dict__,
+                "classification": asdict(classification),
                 "user_id": user_id
             }
         )
@@ -293,10 +292,10 @@ class LLMAnalysisEngine(IAnalysisEngine):
     def _apply_pii_masking(self, result: AnalysisResult, user_id: str) -> AnalysisResult:
         """개인정보 마스킹 적용"""
         try:
-            # 데이터에 PII 마스킹 적용
-            if result.data:
+            # 데이터에 PII 마스킹 적용 (행 지향/열 지향 데이터 모두)
+            if result.data or result.column_data:
                 masking_result = self.pii_masker.mask_data(
-                    result.data,
+                    {"data": result.data, "column_data": result.column_data},
                     context={"user_id": user_id, "analysis_type": result.analysis_type}
                 )
                 
@@ -317,9 +316,10 @@ class LLMAnalysisEngine(IAnalysisEngine):
                         sql_query=result.sql_query,
                         generated_code=result.generated_code,
                         execution_success=result.execution_success,
-                        data=masking_result.masked_data,
+                        data=masking_result.masked_data["data"],
                         columns=result.columns,
                         row_count=result.row_count,
+                        column_data=masking_result.masked_data["column_data"],
                         chart_type=result.chart_type,
                         chart_config=result.chart_config,
                         chart_data=result.chart_data,
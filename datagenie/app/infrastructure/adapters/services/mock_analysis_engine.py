@@ -6,7 +6,7 @@ Mock Analysis Engine
 """
 
 import asyncio
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, BinaryIO
 import structlog
 
 from app.domain.interfaces.services.analysis_engine import IAnalysisEngine
@@ -31,7 +31,7 @@ class MockAnalysisEngine(IAnalysisEngine):
         self,
         question: str,
         connection_id: Optional[str] = None,
-        file_data: Optional[bytes] = None,
+        file_data: Optional[BinaryIO] = None,
         options: Optional[Dict[str, Any]] = None
     ) -> AnalysisResult:
         """
@@ -40,7 +40,7 @@ class MockAnalysisEngine(IAnalysisEngine):
         Args:
             question: 사용자 질문
             connection_id: 데이터베이스 연결 ID
-            file_data: 파일 데이터
+            file_data: 파일 스트림
             options: 추가 옵션
             
         Returns:
@@ -57,7 +57,7 @@ class MockAnalysisEngine(IAnalysisEngine):
         await asyncio.sleep(0.5)
         
         # 질문 유형에 따른 Mock 결과 생성
-        if file_data:
+        if file_data is not None:
             return self._create_excel_analysis_result(question)
         elif connection_id:
             return self._create_database_analysis_result(question)
@@ -124,7 +124,6 @@ class MockAnalysisEngine(IAnalysisEngine):
                 {"month": "2024-03-01T00:00:00Z", "total_sales": 158750.25}
             ],
             columns=["month", "total_sales"],
-            row_count=3,
             chart_type="line",
             chart_config={
                 "x_axis": "month",
@@ -162,7 +161,6 @@ class MockAnalysisEngine(IAnalysisEngine):
                 {"category": "도서", "sales": 95000}
             ],
             columns=["category", "sales"],
-            row_count=3,
             chart_type="bar",
             chart_config={
                 "x_axis": "category",
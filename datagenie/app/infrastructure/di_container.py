@@ -26,6 +26,11 @@ from app.infrastructure.adapters.services.mock_user_permissions import MockUserP
 logger = structlog.get_logger(__name__)
 
 
+class ContainerInitializationError(Exception):
+    """DI 컨테이너 서비스 초기화 실패"""
+    pass
+
+
 class DIContainer:
     """
     의존성 주입 컨테이너
@@ -89,7 +94,7 @@ class DIContainer:
             
         except Exception as e:
             logger.error("DI Container 초기화 실패", error=str(e))
-            raise
+            raise ContainerInitializationError(str(e)) from e
     
     def _should_use_real_implementations(self) -> bool:
         """실제 구현체 사용 여부 결정"""
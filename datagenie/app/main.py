@@ -10,22 +10,35 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
+from fastapi.dependencies.models import Dependant
 import uvicorn
 from datetime import datetime
 import structlog
 
-from app.config.settings import get_settings
-from app.config.logging import setup_logging
+from app.config.settings import get_settings, get_runtime_settings
+from app.config.logging import setup_logging, shutdown_logging
 from app.api.v1.analysis import router as analysis_router
 from app.api.v1.auth import router as auth_router
-from app.infrastructure.di_container import get_di_container
+from app.api.dependencies import (
+    get_current_user,
+    get_current_user_lightweight,
+    get_cached_user_info,
+)
+from app.api.introspection_cache import install_dependency_introspection_cache
+from app.infrastructure.di_container import get_di_container, ContainerInitializationError
 
 # 로깅 설정
 setup_logging()
 logger = structlog.get_logger(__name__)
 
-# 설정 로드
+# 설정 로드 (엔드포인트에서는 슬롯 기반 스냅샷 사용)
 settings = get_settings()
+runtime_settings = get_runtime_settings()
+
+# 요청마다 반복되는 의존성 검사 결과 캐싱
+install_dependency_introspection_cache()
 
 
 @asynccontextmanager
@@ -54,6 +67,7 @@ async def lifespan(app: FastAPI):
     finally:
         # 종료시 정리
         logger.info("DataGenie 애플리케이션 종료")
+        shutdown_logging()
         # TODO: 리소스 정리
 
 
@@ -70,7 +84,7 @@ app = FastAPI(
 # 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=settings.cors_origins_set,  # CORSMiddleware는 `origin in allow_origins`로 검사
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -95,6 +109,56 @@ app.include_router(
 )
 
 
+# Bearer 토큰을 요구하는 인증 의존성 (OpenAPI 보안 요구사항 표시 기준)
+_AUTH_DEPENDENCIES = frozenset((get_current_user, get_current_user_lightweight, get_cached_user_info))
+
+
+def _requires_auth(dependant: Dependant) -> bool:
+    """엔드포인트 의존성 트리에 인증 의존성이 있는지 확인"""
+    return any(
+        dependency.call in _AUTH_DEPENDENCIES or _requires_auth(dependency)
+        for dependency in dependant.dependencies
+    )
+
+
+def custom_openapi():
+    """
+    OpenAPI 스키마 생성
+    
+    인증 의존성이 Authorization 헤더를 직접 파싱하므로 FastAPI가 보안 요구사항을
+    자동으로 만들지 않습니다. Bearer 보안 스키마를 등록하고, 인증 의존성을 사용하는
+    엔드포인트에만 보안 요구사항을 붙입니다 (로그인·토큰 갱신·헬스 체크는 공개).
+    """
+    if app.openapi_schema:
+        return app.openapi_schema
+    
+    openapi_schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        description=app.description,
+        routes=app.routes,
+    )
+    openapi_schema.setdefault("components", {})["securitySchemes"] = {
+        "HTTPBearer": {"type": "http", "scheme": "bearer", "bearerFormat": "JWT"}
+    }
+    paths = openapi_schema.get("paths", {})
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or not route.include_in_schema:
+            continue
+        if not _requires_auth(route.dependant):
+            continue
+        for method in route.methods:
+            operation = paths.get(route.path_format, {}).get(method.lower())
+            if operation is not None:
+                operation["security"] = [{"HTTPBearer": []}]
+    
+    app.openapi_schema = openapi_schema
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
+
 # 기본 엔드포인트들
 @app.get("/")
 async def root():
@@ -102,7 +166,7 @@ async def root():
     return {
         "message": "Welcome to DataGenie! 🧞‍♂️",
         "description": "LLM-based Data Query, Analysis & Visualization Service",
-        "version": settings.app_version,
+        "version": runtime_settings.app_version,
         "docs": "/docs",
         "status": "running",
         "features": {
@@ -127,8 +191,8 @@ async def health_check():
             "status": "healthy",
             "timestamp": datetime.utcnow().isoformat(),
             "service": "DataGenie",
-            "version": settings.app_version,
-            "environment": "development" if settings.debug else "production"
+            "version": runtime_settings.app_version,
+            "environment": "development" if runtime_settings.debug else "production"
         }
     except Exception as e:
         logger.error("헬스체크 실패", error=str(e))
@@ -149,13 +213,37 @@ async def api_status():
             "user_management": "planned"
         },
         "limits": {
-            "max_file_size_mb": settings.max_file_size_mb,
+            "max_file_size_mb": runtime_settings.max_file_size_mb,
             "max_query_rows": 10000,
-            "rate_limit_per_minute": settings.rate_limit_per_minute
+            "rate_limit_per_minute": runtime_settings.rate_limit_per_minute
         }
     }
 
 
+# DI 컨테이너 초기화 예외 핸들러
+@app.exception_handler(ContainerInitializationError)
+async def container_initialization_exception_handler(request, exc):
+    """서비스 초기화 오류 처리"""
+    logger.error(
+        "서비스 초기화 오류",
+        path=request.url.path,
+        method=request.method,
+        error=str(exc)
+    )
+    
+    return JSONResponse(
+        status_code=500,
+        content={
+            "success": False,
+            "error": {
+                "code": "SERVICE_INITIALIZATION_ERROR",
+                "message": "서비스 초기화 오류가 발생했습니다.",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        }
+    )
+
+
 # 전역 예외 핸들러
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
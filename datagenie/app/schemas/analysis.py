@@ -74,6 +74,7 @@ class AnalysisResultSchema(BaseModel):
     data: Optional[List[Dict[str, Any]]] = Field(None, description="결과 데이터")
     columns: Optional[List[str]] = Field(None, description="컬럼 목록")
     row_count: Optional[int] = Field(None, description="결과 행 수")
+    column_data: Optional[Dict[str, List[Any]]] = Field(None, description="열 지향 결과 데이터 (열 이름 -> 값 목록)")
     
     chart_type: Optional[str] = Field(None, description="차트 유형")
     chart_config: Optional[Dict[str, Any]] = Field(None, description="차트 설정")
@@ -7,7 +7,7 @@ Clean Architecture: Application Business Rules
 
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional, Protocol
+from typing import Dict, Any, Optional, Protocol, BinaryIO
 from dataclasses import dataclass
 
 from app.domain.entities.analysis_query import AnalysisQuery, QueryType, QueryStatus
@@ -17,17 +17,17 @@ from app.domain.interfaces.services.analysis_engine import IAnalysisEngine
 from app.domain.interfaces.services.user_permissions import IUserPermissions
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisRequest:
     """분석 요청 DTO"""
     question: str
     user_id: str
     connection_id: Optional[str] = None
-    file_data: Optional[bytes] = None
+    file_data: Optional[BinaryIO] = None  # 업로드 파일 스트림 (처음 위치)
     options: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResponse:
     """분석 응답 DTO"""
     query_id: str
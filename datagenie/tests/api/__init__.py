@@ -0,0 +1,3 @@
+"""
+API Layer Tests
+"""
@@ -0,0 +1,58 @@
+"""
+Dependency Introspection Cache Tests
+
+TDD 규칙 준수: FastAPI 의존성 검사 캐시 패치 테스트
+"""
+
+from fastapi.dependencies import utils as dependency_utils
+
+from app.api import introspection_cache
+from app.api.introspection_cache import _PATCHED_CHECKS, install_dependency_introspection_cache
+
+
+class TestDependencyIntrospectionCache:
+    """FastAPI 의존성 검사 캐시 테스트"""
+    
+    def test_patched_checks_are_used_by_solve_dependencies(self):
+        """RED → GREEN: solve_dependencies가 패치 대상 함수를 모듈 전역으로 조회 (FastAPI 업그레이드 시 no-op 감지)"""
+        # Act
+        install_dependency_introspection_cache()
+        
+        # Assert
+        referenced = dependency_utils.solve_dependencies.__code__.co_names
+        for name in _PATCHED_CHECKS:
+            assert name in referenced
+            assert hasattr(getattr(dependency_utils, name), "__wrapped__")
+    
+    def test_cached_check_matches_original(self):
+        """RED → GREEN: 캐시된 검사 결과는 원래 검사와 동일"""
+        # Arrange
+        install_dependency_introspection_cache()
+        
+        async def coroutine_dependency():
+            return None
+        
+        def sync_dependency():
+            return None
+        
+        # Act & Assert
+        for name in _PATCHED_CHECKS:
+            check = getattr(dependency_utils, name)
+            for call in (coroutine_dependency, sync_dependency):
+                assert check(call) == check.__wrapped__(call)
+                assert check(call) == check.__wrapped__(call)
+    
+    def test_missing_check_skips_patch(self, monkeypatch):
+        """RED → GREEN: 검사 함수가 없으면 일부만 패치하지 않고 건너뜀"""
+        # Arrange
+        monkeypatch.setattr(introspection_cache, "_installed", False)
+        monkeypatch.delattr(dependency_utils, _PATCHED_CHECKS[0])
+        originals = {name: getattr(dependency_utils, name) for name in _PATCHED_CHECKS[1:]}
+        
+        # Act
+        install_dependency_introspection_cache()
+        
+        # Assert
+        assert not introspection_cache._installed
+        for name, original in originals.items():
+            assert getattr(dependency_utils, name) is original
@@ -4,6 +4,11 @@ Pytest Configuration and Fixtures
 DataGenie 전용 테스트 설정 및 공통 픽스처
 """
 
+import os
+
+# 테스트에서는 커넥션 풀 대신 NullPool 사용 (app 모듈 import 전에 설정)
+os.environ.setdefault("TESTING", "true")
+
 import pytest
 import asyncio
 from datetime import datetime, timezone
@@ -0,0 +1,3 @@
+"""
+Auth Core Tests
+"""
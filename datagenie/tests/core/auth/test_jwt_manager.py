@@ -0,0 +1,207 @@
+"""
+JWT Manager Tests
+
+TDD 규칙 준수: 인증 시스템 테스트
+"""
+
+import time
+
+import jwt
+import pytest
+
+from app.core.auth.jwt_manager import (
+    ASYNC_OFFLOAD_MIN_BYTES,
+    AuthenticatedUser,
+    JWTManager,
+    TokenType,
+    intern_permissions
+)
+
+SECRET = "test-secret-key-for-testing-only"
+
+
+@pytest.fixture
+def user() -> AuthenticatedUser:
+    """테스트 사용자 픽스처"""
+    return AuthenticatedUser(
+        user_id="user-1",
+        username="tester",
+        email="tester@example.com",
+        role="analyst",
+        permissions=intern_permissions(["analysis:execute", "query:read"])
+    )
+
+
+def _claims(**overrides):
+    claims = {
+        "user_id": "user-1",
+        "username": "tester",
+        "email": "tester@example.com",
+        "role": "analyst",
+        "permissions": ["query:read"],
+        "token_type": "access",
+        "iat": int(time.time()),
+        "exp": int(time.time()) + 60
+    }
+    claims.update(overrides)
+    return claims
+
+
+class TestJWTManager:
+    """JWT 관리자 테스트"""
+    
+    def test_access_token_round_trip(self, jwt_manager, user):
+        """발급한 액세스 토큰 검증"""
+        token = jwt_manager.create_access_token(user)
+        
+        result = jwt_manager.validate_token(token)
+        
+        assert result.is_success()
+        assert result.payload.user_id == "user-1"
+        assert result.payload.token_type == TokenType.ACCESS
+        assert set(result.payload.permissions) == set(user.permissions)
+    
+    def test_token_is_compatible_with_pyjwt(self, jwt_manager, user):
+        """HS256 고속 경로와 PyJWT 간 상호 호환"""
+        token = jwt_manager.create_access_token(user)
+        decoded = jwt.decode(token, SECRET, algorithms=["HS256"])
+        assert decoded["username"] == "tester"
+        
+        pyjwt_token = jwt.encode(_claims(), SECRET, algorithm="HS256")
+        assert jwt_manager.validate_token(pyjwt_token).is_success()
+    
+    def test_tampered_signature_rejected(self, jwt_manager, user):
+        """서명이 다른 토큰 거부"""
+        forged = jwt.encode(_claims(role="admin"), "other-secret", algorithm="HS256")
+        
+        result = jwt_manager.validate_token(forged)
+        
+        assert not result.is_valid
+        assert result.error_message == "유효하지 않은 토큰입니다"
+    
+    def test_unsigned_token_rejected(self, jwt_manager):
+        """alg=none 토큰 거부"""
+        unsigned = jwt.encode(_claims(), None, algorithm="none")
+        
+        assert not jwt_manager.validate_token(unsigned).is_valid
+    
+    @pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c.d", "토큰.값.서명"])
+    def test_malformed_token_rejected(self, jwt_manager, token):
+        """형식이 잘못된 토큰 거부"""
+        assert not jwt_manager.validate_token(token).is_valid
+    
+    def test_expired_token_rejected(self, jwt_manager):
+        """만료된 토큰 거부"""
+        expired = jwt.encode(_claims(exp=int(time.time()) - 1), SECRET, algorithm="HS256")
+        
+        result = jwt_manager.validate_token(expired)
+        
+        assert not result.is_valid
+        assert result.error_message == "토큰이 만료되었습니다"
+    
+    def test_non_fast_path_algorithm(self, user):
+        """HS256 외 알고리즘은 미리 준비한 PyJWT 알고리즘 구현 사용"""
+        manager = JWTManager(secret_key=SECRET, algorithm="HS512")
+        token = manager.create_access_token(user)
+        
+        assert jwt.decode(token, SECRET, algorithms=["HS512"])["username"] == "tester"
+        assert manager.validate_token(jwt.encode(_claims(), SECRET, algorithm="HS512")).is_success()
+        assert not manager.validate_token(jwt.encode(_claims(), SECRET, algorithm="HS256")).is_valid
+    
+    def test_refresh_token_issues_access_token(self, jwt_manager, user):
+        """리프레시 토큰으로 액세스 토큰 재발급"""
+        refresh_token = jwt_manager.create_refresh_token(user)
+        
+        access_token = jwt_manager.refresh_access_token(refresh_token)
+        
+        assert access_token is not None
+        assert jwt_manager.validate_token(access_token).payload.token_type == TokenType.ACCESS
+        assert jwt_manager.refresh_access_token(access_token) is None
+    
+    def test_blacklisted_token_rejected(self, jwt_manager, user):
+        """로그아웃한 토큰 거부"""
+        token = jwt_manager.create_access_token(user)
+        
+        jwt_manager.blacklist_token(token)
+        
+        assert not jwt_manager.validate_token(token).is_valid
+    
+    def test_blacklist_uses_redis_with_token_ttl(self, user):
+        """Redis 블랙리스트는 토큰 남은 수명만큼만 보관"""
+        class FakeRedis:
+            def __init__(self):
+                self.store = {}
+            
+            def set(self, key, value, ex=None):
+                self.store[key] = (value, ex)
+            
+            def exists(self, key):
+                return int(key in self.store)
+        
+        redis_client = FakeRedis()
+        manager = JWTManager(secret_key=SECRET, redis_client=redis_client)
+        token = manager.create_access_token(user)
+        
+        manager.blacklist_token(token)
+        
+        (key, (_, ttl)), = redis_client.store.items()
+        assert key.startswith("jwt:bl:")
+        assert 0 < ttl <= manager.access_token_expire_seconds
+        assert not manager.validate_token(token).is_valid
+        # 같은 Redis를 쓰는 다른 인스턴스에서도 거부
+        assert not JWTManager(secret_key=SECRET, redis_client=redis_client).validate_token(token).is_valid
+    
+    @pytest.mark.asyncio
+    async def test_is_token_revoked_async_checks_shared_blacklist(self, user):
+        """다른 인스턴스가 Redis에 등록한 폐기 토큰도 감지"""
+        class FakeRedis:
+            def __init__(self):
+                self.store = {}
+            
+            def set(self, key, value, ex=None):
+                self.store[key] = (value, ex)
+            
+            def exists(self, key):
+                return int(key in self.store)
+        
+        redis_client = FakeRedis()
+        issuer = JWTManager(secret_key=SECRET, redis_client=redis_client)
+        other = JWTManager(secret_key=SECRET, redis_client=redis_client)
+        token = issuer.create_access_token(user)
+        
+        assert not await other.is_token_revoked_async(token)
+        issuer.blacklist_token(token)
+        assert await other.is_token_revoked_async(token)
+    
+    @pytest.mark.asyncio
+    async def test_async_variants_match_sync(self, jwt_manager, user):
+        """비동기 생성/검증은 작은 토큰은 바로, 큰 토큰은 스레드 풀에서 처리"""
+        big_user = AuthenticatedUser(
+            user_id="user-2",
+            username="admin",
+            email="admin@example.com",
+            role="admin",
+            permissions=intern_permissions(f"resource{i}:read" for i in range(200))
+        )
+        
+        for subject in (user, big_user):
+            token = await jwt_manager.create_access_token_async(subject)
+            result = await jwt_manager.validate_token_async(token)
+            assert result.is_success()
+            assert set(result.payload.permissions) == set(subject.permissions)
+        
+        assert len(token) > ASYNC_OFFLOAD_MIN_BYTES
+    
+    def test_minimal_access_token_validation(self, jwt_manager, user):
+        """최소 검증은 액세스 토큰만 허용하고 식별 정보만 반환"""
+        access_token = jwt_manager.create_access_token(user)
+        
+        user_id, role, permissions = jwt_manager.validate_access_token_minimal(access_token)
+        
+        assert (user_id, role) == ("user-1", "analyst")
+        assert set(permissions) == set(user.permissions)
+        assert jwt_manager.validate_access_token_minimal(jwt_manager.create_refresh_token(user)) is None
+        assert jwt_manager.validate_access_token_minimal(access_token + "x") is None
+        
+        jwt_manager.blacklist_token(access_token)
+        assert jwt_manager.validate_access_token_minimal(access_token) is None
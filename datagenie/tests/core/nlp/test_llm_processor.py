@@ -0,0 +1,100 @@
+"""
+LLM Processor Tests
+
+TDD 규칙 준수: LLM 응답 처리 테스트
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from app.core.nlp.llm_processor import ExampleIndex, _LLMBatcher, _extract_json_object
+
+
+class TestExtractJsonObject:
+    """LLM 응답 JSON 추출 테스트"""
+    
+    def test_json_mode_response(self):
+        """JSON만 있는 응답은 그대로 반환"""
+        assert _extract_json_object(' {"sql": "SELECT 1"}\n') == '{"sql": "SELECT 1"}'
+    
+    def test_json_surrounded_by_text(self):
+        """설명 문장 사이의 JSON 추출"""
+        response = '결과입니다:\n```json\n{"a": {"b": 1}}\n```\n추가 설명 {참고}'
+        
+        assert _extract_json_object(response) == '{"a": {"b": 1}}'
+    
+    def test_braces_inside_strings_ignored(self):
+        """문자열 안의 중괄호와 이스케이프 무시"""
+        response = 'text {"sql": "SELECT \'}\' AS x", "note": "say \\"{\\""} tail'
+        
+        assert _extract_json_object(response) == '{"sql": "SELECT \'}\' AS x", "note": "say \\"{\\""}'
+    
+    @pytest.mark.parametrize("response", ["JSON 없음", "앞부분 {\"a\": 1", ""])
+    def test_no_complete_object(self, response):
+        """완결된 JSON 객체가 없으면 None"""
+        assert _extract_json_object(response) is None
+
+
+class TestExampleIndex:
+    """예시 인덱스 테스트"""
+    
+    def test_top_examples_by_keyword_overlap(self):
+        """키워드 겹침 순으로 선택하고 동점은 원래 순서 유지"""
+        examples = [
+            {"question": "월별 매출 합계"},
+            {"question": "고객 수"},
+            {"question": "지역별 월별 매출"},
+            {"question": "매출 상위 고객"},
+        ]
+        index = ExampleIndex(examples)
+        
+        top = index.top_examples("월별 매출 보여줘", 3)
+        
+        assert top == [examples[0], examples[2], examples[3]]
+
+
+class TestLLMBatcher:
+    """LLM 호출 배칭 테스트"""
+    
+    class FakeLLM:
+        def __init__(self):
+            self.batches = []
+        
+        async def abatch(self, inputs, return_exceptions=False):
+            self.batches.append([messages[0].content for messages in inputs])
+            return [
+                ValueError("실패") if messages[0].content == "bad"
+                else SimpleNamespace(content=messages[0].content.upper())
+                for messages in inputs
+            ]
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        """동시 호출은 한 번의 abatch로 전송"""
+        llm = self.FakeLLM()
+        batcher = _LLMBatcher(llm, window_seconds=0.01, max_batch_size=8)
+        
+        results = await asyncio.gather(
+            batcher.invoke("a"),
+            batcher.invoke("b"),
+            batcher.invoke("bad"),
+            return_exceptions=True
+        )
+        
+        assert llm.batches == [["a", "b", "bad"]]
+        assert results[:2] == ["A", "B"]
+        assert isinstance(results[2], ValueError)
+    
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        """최대 크기에 도달하면 시간 창을 기다리지 않고 전송"""
+        llm = self.FakeLLM()
+        batcher = _LLMBatcher(llm, window_seconds=60, max_batch_size=2)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.invoke("a"), batcher.invoke("b")),
+            timeout=1
+        )
+        
+        assert results == ["A", "B"]
@@ -0,0 +1,116 @@
+"""
+PII Masker Tests
+
+TDD 규칙 준수: 개인정보 마스킹 테스트
+"""
+
+import pytest
+from app.core.security.pii_masker import PIIMasker, PIIType
+
+
+class TestPIIMasker:
+    """개인정보 마스킹 테스트"""
+    
+    def test_masks_multiple_types_in_one_string(self, pii_masker):
+        """한 문자열 안의 여러 PII 유형을 모두 마스킹"""
+        # Arrange
+        text = "연락처 010-1234-5678, 메일 hong.gildong@example.com, 주민번호 900101-1234567"
+        
+        # Act
+        result = pii_masker.mask_data(text)
+        
+        # Assert
+        assert result.masked_data == (
+            "연락처 010-****-5678, 메일 h**********g@example.com, 주민번호 900101-1******"
+        )
+        assert [pii.pii_type for pii in result.detected_pii] == [
+            PIIType.PHONE, PIIType.EMAIL, PIIType.KOREAN_RRN
+        ]
+        assert [pii.position for pii in result.detected_pii] == [
+            text.index("010"), text.index("hong"), text.index("900101")
+        ]
+    
+    def test_masks_nested_structures(self, pii_masker):
+        """딕셔너리/리스트/튜플 내부 문자열 마스킹"""
+        data = {"rows": [("192.168.1.100", 3), {"card": "1234-5678-9012-3456"}]}
+        
+        result = pii_masker.mask_data(data)
+        
+        assert result.masked_data == {"rows": [("192.168.*.***", 3), {"card": "****-****-****-3456"}]}
+        assert result.has_pii()
+    
+    def test_low_confidence_types_skipped(self):
+        """최소 신뢰도 미만 유형은 탐지하지 않음"""
+        masker = PIIMasker(min_confidence=0.7)
+        
+        result = masker.mask_data("계좌 1234567890123")
+        
+        assert not result.has_pii()
+        assert result.masked_data == "계좌 1234567890123"
+    
+    def test_bank_account_length_and_boundaries(self):
+        """계좌번호는 단어 경계로 둘러싸인 10~16자리 숫자만 탐지"""
+        masker = PIIMasker(min_confidence=0.6)
+        
+        result = masker.mask_data("계좌 1234567890123, 코드 A1234567890123, 번호 " + "1" * 40)
+        
+        assert [pii.original_value for pii in result.detected_pii] == ["1234567890123"]
+        assert result.masked_data.startswith("계좌 123*******123,")
+        assert masker.detect_pii_types("계좌: 1234567890") == [PIIType.BANK_ACCOUNT]
+    
+    def test_bank_account_yields_to_earlier_patterns(self):
+        """같은 위치에서는 앞선 패턴(전화번호)이 계좌번호보다 우선"""
+        masker = PIIMasker(min_confidence=0.6)
+        
+        result = masker.mask_data("01012345678 / 9876543210")
+        
+        assert [pii.pii_type for pii in result.detected_pii] == [PIIType.PHONE, PIIType.BANK_ACCOUNT]
+        assert result.masked_data == "010-****-5678 / 987****210"
+    
+    @pytest.mark.parametrize("text", ["", "개인정보 없음", "SELECT * FROM users"])
+    def test_text_without_pii_unchanged(self, pii_masker, text):
+        """PII가 없으면 원본 유지"""
+        result = pii_masker.mask_data(text)
+        
+        assert result.masked_data == text
+        assert not result.masking_applied
+    
+    def test_pii_free_subtrees_reused_and_original_untouched(self, pii_masker):
+        """PII 없는 하위 구조는 원본 재사용, 원본 데이터는 변경되지 않음"""
+        clean = {"name": "홍길동", "tags": ["a", "b"]}
+        dirty = ["010-1234-5678"]
+        data = {"clean": clean, "dirty": dirty}
+        
+        result = pii_masker.mask_data(data)
+        
+        assert result.masked_data["clean"] is clean
+        assert result.masked_data["dirty"] == ["010-****-5678"]
+        assert dirty == ["010-1234-5678"]
+    
+    def test_deeply_nested_data(self, pii_masker):
+        """재귀 한도를 넘는 깊이도 처리"""
+        data = ["010-1234-5678"]
+        for _ in range(5000):
+            data = [data]
+        
+        result = pii_masker.mask_data(data)
+        
+        leaf = result.masked_data
+        while len(leaf) == 1 and isinstance(leaf[0], list):
+            leaf = leaf[0]
+        assert leaf == ["010-****-5678"]
+    
+    def test_masks_dataframe_string_columns(self, pii_masker):
+        """DataFrame은 문자열 컬럼만 마스킹하고 원본은 유지"""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({
+            "contact": ["010-1234-5678", "없음", None],
+            "amount": [100, 200, 300],
+        })
+        
+        result = pii_masker.mask_data(df)
+        
+        assert result.masking_applied
+        assert list(result.masked_data["contact"][:2]) == ["010-****-5678", "없음"]
+        assert result.masked_data["contact"][2] is None
+        assert df["contact"][0] == "010-1234-5678"
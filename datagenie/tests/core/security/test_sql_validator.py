@@ -237,3 +237,122 @@ class TestSQLSecurityValidator:
         # 위험한 쿼리
         assert unsafe_result.has_violations() == True
         assert unsafe_result.is_execution_allowed() == False
+    
+    def test_overlapping_patterns_all_reported(self, validator):
+        """RED → GREEN: 같은 위치에서 겹치는 패턴도 모두 보고"""
+        # Arrange
+        sql = "SELECT a FROM pg_user WHERE a IN (b FROM sys.objects)"
+        
+        # Act
+        warnings = validator._check_suspicious_patterns(sql)
+        
+        # Assert
+        assert warnings == [
+            f"의심스러운 SQL 패턴: {validator.SUSPICIOUS_PATTERNS[3]}",
+            f"의심스러운 SQL 패턴: {validator.SUSPICIOUS_PATTERNS[4]}",
+        ]
+    
+    def test_forbidden_keywords_reported_in_declaration_order(self, validator):
+        """RED → GREEN: 금지 키워드는 선언 순서대로 한 번씩 보고"""
+        # Act
+        violations = validator._check_forbidden_keywords(
+            "execute p; exec q; insert into t values (1); EXEC r"
+        )
+        
+        # Assert
+        assert violations == [
+            "금지된 SQL 키워드 감지: INSERT",
+            "금지된 SQL 키워드 감지: EXEC",
+            "금지된 SQL 키워드 감지: EXECUTE",
+        ]
+    
+    def test_prefilter_anchors_align_with_patterns(self, validator):
+        """RED → GREEN: 사전 필터 앵커가 패턴 목록과 1:1 대응"""
+        # Assert
+        assert len(validator._DANGEROUS_PATTERN_ANCHORS) == len(validator.DANGEROUS_SQL_PATTERNS)
+        assert len(validator._SUSPICIOUS_PATTERN_ANCHORS) == len(validator.SUSPICIOUS_PATTERNS)
+    
+    def test_prefilter_skips_regex_for_plain_select(self, validator):
+        """RED → GREEN: 앵커가 없는 쿼리는 후보 패턴 없음"""
+        # Arrange
+        sql = "SELECT id, created_at FROM orders ORDER BY created_at DESC"
+        fingerprint = validator._fingerprint(sql)
+        
+        # Act
+        candidates = validator._candidate_patterns(
+            validator._DANGEROUS_PATTERN_ANCHORS, sql, fingerprint
+        )
+        
+        # Assert
+        assert candidates == []
+        assert validator._check_forbidden_keywords(sql, fingerprint) == []
+    
+    def test_non_ascii_sql_uses_full_scan(self, validator):
+        """RED → GREEN: ASCII가 아닌 SQL은 대소문자 변환 차이 때문에 전체 검사"""
+        # Arrange
+        sql = "SELECT BENCHMARK(1000000, 1) FROM 사용자"
+        
+        # Act
+        result = validator.validate_sql(sql)
+        
+        # Assert
+        assert validator._candidate_patterns(
+            validator._DANGEROUS_PATTERN_ANCHORS, sql, validator._fingerprint(sql)
+        ) is None
+        assert result.is_safe == False
+    
+    def test_repeated_query_served_from_cache(self, validator):
+        """RED → GREEN: 반복 쿼리는 캐시된 결과 재사용"""
+        # Arrange
+        sql = "SELECT id FROM reports WHERE day = '2024-01-01'"
+        
+        # Act
+        first = validator.validate_sql(sql, {"user_id": "a"})
+        second = validator.validate_sql(sql, {"user_id": "b"})
+        
+        # Assert
+        assert second is first
+        assert first.sanitized_sql == f"{sql} LIMIT 1000"
+    
+    def test_result_cache_is_keyed_by_exact_sql(self, validator):
+        """RED → GREEN: 대소문자/공백이 다른 쿼리는 별도 결과 (sanitized_sql 보존)"""
+        # Act
+        lower = validator.validate_sql("select id from users")
+        upper = validator.validate_sql("SELECT id  FROM users")
+        
+        # Assert
+        assert lower.sanitized_sql == "select id from users LIMIT 1000"
+        assert upper.sanitized_sql == "SELECT id  FROM users LIMIT 1000"
+    
+    def test_result_cache_evicts_least_recently_used(self, validator):
+        """RED → GREEN: 캐시 용량 초과 시 가장 오래된 결과 제거"""
+        # Arrange
+        validator.RESULT_CACHE_SIZE = 2
+        first = validator.validate_sql("SELECT 1")
+        validator.validate_sql("SELECT 2")
+        
+        # Act
+        validator.validate_sql("SELECT 1")  # 최근 사용으로 갱신
+        validator.validate_sql("SELECT 3")  # SELECT 2 제거
+        
+        # Assert
+        assert len(validator._result_cache) == 2
+        assert validator.validate_sql("SELECT 1") is first
+    
+    def test_dangerous_patterns_stop_at_first_match(self, validator):
+        """RED → GREEN: 위험 패턴은 기본적으로 첫 일치만 보고, 감사용 옵션은 전체 보고"""
+        # Arrange
+        sql = "SELECT * FROM users WHERE id = 1 OR 1=1; DROP TABLE users; --"
+        
+        # Act
+        first_only = validator._check_dangerous_patterns(sql)
+        all_matches = validator._check_dangerous_patterns(sql, all_matches=True)
+        
+        # Assert
+        assert len(first_only) == 1
+        assert first_only[0] in all_matches
+        assert len(all_matches) == 4
+        
+        # 비ASCII SQL(결합 정규식 경로)도 동일
+        assert len(validator._check_dangerous_patterns(sql + " 한글")) == 1
+        assert len(validator._check_dangerous_patterns(sql + " 한글", all_matches=True)) == 4
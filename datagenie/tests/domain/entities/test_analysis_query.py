@@ -6,7 +6,9 @@ TDD 규칙 준수: Domain 엔티티 테스트
 
 import pytest
 from datetime import datetime, timezone
-from app.domain.entities.analysis_query import AnalysisQuery, QueryType, QueryStatus
+from app.domain.entities.analysis_query import (
+    AnalysisQuery, QueryType, QueryStatus, InvalidStateTransitionError
+)
 
 
 class TestAnalysisQuery:
@@ -133,8 +135,21 @@ class TestAnalysisQuery:
         # Assert
         assert query.query_type == QueryType.EXCEL
     
+    def test_query_type_database_keywords_take_priority(self):
+        """RED → GREEN: Excel 키워드가 먼저 나와도 데이터베이스 키워드가 우선"""
+        # Arrange & Act
+        query = AnalysisQuery.create_new(
+            id="test-query-priority",
+            question="Chart로 월별 Sales 추이를 보여주세요",
+            user_id="user-123",
+            created_at=datetime.now(timezone.utc)
+        )
+        
+        # Assert
+        assert query.query_type == QueryType.DATABASE
+    
     def test_query_immutability(self):
-        """RED → GREEN: 쿼리 불변성 확인"""
+        """RED → GREEN: 상태 변경 메서드는 원본을 바꾸지 않고 새 인스턴스 반환"""
         # Arrange
         query = AnalysisQuery.create_new(
             id="test-query-immutable",
@@ -143,9 +158,38 @@ class TestAnalysisQuery:
             created_at=datetime.now(timezone.utc)
         )
         
-        # Act & Assert
+        # Act
+        processing = query.mark_processing()
+        
+        # Assert
+        assert processing is not query
+        assert query.status == QueryStatus.PENDING
+        assert processing.status == QueryStatus.PROCESSING
         with pytest.raises(AttributeError):
-            query.question = "변경된 질문"  # frozen=True로 인해 변경 불가
+            query.extra_field = "추가 필드"  # slots=True로 인해 필드 외 속성 추가 불가
+    
+    def test_query_identity_by_id(self):
+        """RED → GREEN: 같은 id의 쿼리는 상태가 달라도 같은 엔티티"""
+        # Arrange
+        query = AnalysisQuery.create_new(
+            id="test-query-identity",
+            question="식별자 테스트",
+            user_id="user-123",
+            created_at=datetime.now(timezone.utc)
+        )
+        
+        # Act
+        processing = query.mark_processing()
+        
+        # Assert
+        assert processing == query
+        assert len({query, processing}) == 1
+        assert query != AnalysisQuery.create_new(
+            id="other-query",
+            question="식별자 테스트",
+            user_id="user-123",
+            created_at=query.created_at
+        )
     
     def test_query_status_progression(self):
         """RED → GREEN: 쿼리 상태 변경"""
@@ -170,6 +214,39 @@ class TestAnalysisQuery:
         assert completed_query.status == QueryStatus.COMPLETED
         assert completed_query.execution_time_ms == 1500
     
+    def test_with_status_keeps_zero_execution_time(self):
+        """RED → GREEN: 0ms 실행 시간도 유효한 값으로 반영"""
+        # Arrange
+        query = AnalysisQuery.create_new(
+            id="test-query-zero-ms",
+            question="실행 시간 테스트",
+            user_id="user-123",
+            created_at=datetime.now(timezone.utc)
+        ).with_status(QueryStatus.PROCESSING, execution_time_ms=1500)
+        
+        # Act
+        completed_query = query.with_status(QueryStatus.COMPLETED, execution_time_ms=0)
+        
+        # Assert
+        assert completed_query.execution_time_ms == 0
+        assert completed_query.with_status(QueryStatus.COMPLETED).execution_time_ms == 0
+    
+    def test_invalid_state_transitions_rejected(self):
+        """RED → GREEN: 완료된 쿼리는 다시 처리 중/완료 상태로 전환할 수 없음"""
+        # Arrange
+        completed_query = AnalysisQuery.create_new(
+            id="test-query-transition",
+            question="상태 전환 테스트",
+            user_id="user-123",
+            created_at=datetime.now(timezone.utc)
+        ).mark_processing().mark_completed(execution_time_ms=10)
+        
+        # Act & Assert
+        with pytest.raises(InvalidStateTransitionError):
+            completed_query.mark_processing()
+        with pytest.raises(InvalidStateTransitionError):
+            completed_query.mark_completed(execution_time_ms=20)
+    
     def test_query_with_error(self):
         """RED → GREEN: 에러가 있는 쿼리 상태"""
         # Arrange
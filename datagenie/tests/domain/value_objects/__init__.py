@@ -0,0 +1,3 @@
+"""
+Domain Value Objects Tests
+"""
@@ -0,0 +1,89 @@
+"""
+AnalysisResult Value Object Tests
+
+TDD 규칙 준수: Domain 값 객체 테스트
+"""
+
+import pytest
+
+from app.domain.value_objects.analysis_result import AnalysisResult
+
+
+class TestAnalysisResult:
+    """AnalysisResult 값 객체 테스트"""
+    
+    def test_row_data_preview(self):
+        """RED → GREEN: 행 지향 데이터 미리보기"""
+        # Arrange
+        rows = [{"id": i, "amount": i * 10} for i in range(10)]
+        result = AnalysisResult(analysis_type="database", question="매출", data=rows)
+        
+        # Act & Assert
+        assert result.has_data()
+        assert result.get_data_preview(3) == rows[:3]
+        assert result.get_rows() is rows
+        assert result.row_count == 10
+    
+    def test_columnar_data_preview_and_rows(self):
+        """RED → GREEN: 열 지향 데이터는 columns 순서로 행을 구성"""
+        # Arrange
+        result = AnalysisResult(
+            analysis_type="database",
+            question="매출",
+            columns=["amount", "id"],
+            column_data={"id": [1, 2, 3], "amount": [10, 20, 30]}
+        )
+        
+        # Act & Assert
+        assert result.has_data()
+        assert result.get_data_preview(2) == [{"amount": 10, "id": 1}, {"amount": 20, "id": 2}]
+        assert result.get_rows()[-1] == {"amount": 30, "id": 3}
+        assert list(result.get_rows()[0]) == ["amount", "id"]
+        assert result.to_dict()["column_data"] is result.column_data
+        assert result.row_count == 3
+    
+    def test_explicit_row_count_kept(self):
+        """RED → GREEN: 명시적으로 전달한 행 수는 유지하고, 데이터가 없으면 None"""
+        # Arrange & Act
+        truncated = AnalysisResult(
+            analysis_type="database",
+            question="매출",
+            data=[{"id": 1}],
+            row_count=1000
+        )
+        empty = AnalysisResult(analysis_type="general", question="안녕하세요")
+        
+        # Assert
+        assert truncated.row_count == 1000
+        assert empty.row_count is None
+    
+    def test_empty_columnar_data(self):
+        """RED → GREEN: 행이 없는 열 지향 데이터"""
+        # Arrange
+        result = AnalysisResult(
+            analysis_type="database",
+            question="매출",
+            column_data={"id": []}
+        )
+        
+        # Act & Assert
+        assert not result.has_data()
+        assert result.get_data_preview() == []
+        assert result.get_rows() == []
+    
+    def test_inconsistent_columnar_data_rejected(self):
+        """RED → GREEN: columns에 없는 열이나 길이가 다른 열은 생성 시 거부"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            AnalysisResult(
+                analysis_type="database",
+                question="매출",
+                columns=["id", "amount"],
+                column_data={"id": [1, 2]}
+            )
+        with pytest.raises(ValueError):
+            AnalysisResult(
+                analysis_type="database",
+                question="매출",
+                column_data={"id": [1, 2, 3], "amount": [10, 20]}
+            )